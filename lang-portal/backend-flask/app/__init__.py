@@ -3,6 +3,12 @@ from flask_cors import CORS
 from flask_migrate import Migrate
 from config import Config
 from app.extensions import db
+from app.utils.engine import apply_engine_options, install_pragmas, check_engine_profile
+from app.utils.response_cache import init_response_cache
+from app.utils.json_provider import init_json_provider
+from app.utils.compression import init_compression
+from app.utils.query_stats import init_query_stats
+from app.utils.metrics import init_metrics
 
 def create_app(config_class=Config):
     """Create and configure the Flask application"""
@@ -10,12 +16,20 @@ def create_app(config_class=Config):
     app.config.from_object(config_class)
     
     # Initialize extensions
+    apply_engine_options(app)
     db.init_app(app)
     migrate = Migrate(app, db)  # Add migration support
     CORS(app)
+    init_metrics(app)
+    init_response_cache(app)
+    init_json_provider(app)
+    init_compression(app)
     
     # Register blueprints
     with app.app_context():
+        install_pragmas(app, db.engine)
+        init_query_stats(app, db.engine)
+        
         from app.routes.api import bp as api_bp
         from app.routes.study_sessions import bp as study_sessions_bp
         
@@ -27,5 +41,8 @@ def create_app(config_class=Config):
             db.create_all()
         except Exception as e:
             print(f"Error creating tables: {e}")
+        
+        if app.config['SQLITE_PROFILES'][app.config['SQLITE_PROFILE']]:
+            check_engine_profile(app, db.engine)
     
     return app
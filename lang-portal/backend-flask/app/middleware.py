@@ -3,9 +3,15 @@ from flask import request, jsonify
 from pydantic import ValidationError
 from app.schemas import PaginationParams
 from app.utils.responses import error_response
+from app.utils.pagination import decode_cursor
 
-def validate_pagination(max_per_page=50):
-    """Validates and standardizes pagination parameters"""
+def validate_pagination(max_per_page=50, allow_cursor=False):
+    """Validates and standardizes pagination parameters
+
+    With allow_cursor=True a ``cursor`` query argument switches the view to
+    keyset pagination: the decoded cursor is passed as ``cursor`` (an empty
+    value starts at the first page) and ``page`` is ignored.
+    """
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
@@ -36,6 +42,16 @@ def validate_pagination(max_per_page=50):
                         status_code=400
                     )
 
+                if allow_cursor and 'cursor' in request.args:
+                    try:
+                        kwargs['cursor'] = decode_cursor(request.args['cursor'])
+                    except ValueError:
+                        return error_response(
+                            message="Invalid pagination cursor",
+                            error_code="VALIDATION_ERROR",
+                            status_code=400
+                        )
+
                 return f(*args, page=page, per_page=per_page, **kwargs)
             except Exception as e:
                 return error_response(
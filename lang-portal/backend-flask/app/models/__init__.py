@@ -3,11 +3,21 @@ from .group import Group
 from .study_activity import StudyActivity
 from .study_session import StudySession
 from .word_review import WordReviewItem
+from .dashboard_stats import DashboardStats, WordReviewStats
+from .data_version import DataVersion
+from .word_schedule import WordSchedule
+from .daily_activity import DailyActivity
+from . import word_search  # registers the words_fts search index DDL
 
 __all__ = [
     'Word',
     'Group',
     'StudyActivity',
     'StudySession',
-    'WordReviewItem'
+    'WordReviewItem',
+    'DashboardStats',
+    'WordReviewStats',
+    'DataVersion',
+    'WordSchedule',
+    'DailyActivity'
 ]
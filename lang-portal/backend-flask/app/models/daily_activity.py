@@ -0,0 +1,60 @@
+from sqlalchemy import event, DDL
+from app.extensions import db
+
+class DailyActivity(db.Model):
+    """Per-day (UTC) review and session counts, one row per day with any activity.
+
+    Maintained by triggers like the dashboard rollups, so streaks are a short
+    walk over this table instead of a scan of every review timestamp.
+    """
+    __tablename__ = 'daily_activity'
+
+    day = db.Column(db.Date, primary_key=True)
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    correct_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    session_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+
+DAILY_ACTIVITY_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS word_review_items_daily_insert AFTER INSERT ON word_review_items
+    BEGIN
+        INSERT INTO daily_activity (day, review_count, correct_count, session_count)
+        VALUES (date(NEW.created_at), 1, NEW.is_correct, 0)
+        ON CONFLICT (day) DO UPDATE SET
+            review_count = review_count + 1,
+            correct_count = correct_count + excluded.correct_count;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS word_review_items_daily_delete AFTER DELETE ON word_review_items
+    BEGIN
+        UPDATE daily_activity
+        SET review_count = review_count - 1,
+            correct_count = correct_count - OLD.is_correct
+        WHERE day = date(OLD.created_at);
+        DELETE FROM daily_activity
+        WHERE day = date(OLD.created_at) AND review_count = 0 AND session_count = 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS study_sessions_daily_insert AFTER INSERT ON study_sessions
+    BEGIN
+        INSERT INTO daily_activity (day, review_count, correct_count, session_count)
+        VALUES (date(NEW.started_at), 0, 0, 1)
+        ON CONFLICT (day) DO UPDATE SET session_count = session_count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS study_sessions_daily_delete AFTER DELETE ON study_sessions
+    BEGIN
+        UPDATE daily_activity SET session_count = session_count - 1
+        WHERE day = date(OLD.started_at);
+        DELETE FROM daily_activity
+        WHERE day = date(OLD.started_at) AND review_count = 0 AND session_count = 0;
+    END
+    """
+]
+
+for trigger in DAILY_ACTIVITY_TRIGGERS:
+    event.listen(db.metadata, 'after_create', DDL(trigger).execute_if(dialect='sqlite'))
@@ -0,0 +1,153 @@
+from sqlalchemy import event, DDL
+from app.extensions import db
+
+class DashboardStats(db.Model):
+    """Single-row rollup of the totals the dashboard endpoints report.
+
+    Maintained by triggers in the same transaction as the writes they count,
+    so reading it is a primary-key lookup instead of full-table COUNTs.
+    """
+    __tablename__ = 'dashboard_stats'
+
+    id = db.Column(db.Integer, primary_key=True)
+    total_words = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    total_groups = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    total_activities = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    total_sessions = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    completed_sessions = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    total_reviews = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    correct_reviews = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    words_reviewed = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    ROW_ID = 1
+
+
+class WordReviewStats(db.Model):
+    """Per-word review totals, used to track how many distinct words were reviewed"""
+    __tablename__ = 'word_review_stats'
+
+    word_id = db.Column(db.Integer, primary_key=True)
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    correct_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+
+ROLLUP_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS words_rollup_insert AFTER INSERT ON words
+    BEGIN
+        UPDATE dashboard_stats SET total_words = total_words + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_rollup_delete AFTER DELETE ON words
+    BEGIN
+        UPDATE dashboard_stats SET total_words = total_words - 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS groups_rollup_insert AFTER INSERT ON groups
+    BEGIN
+        UPDATE dashboard_stats SET total_groups = total_groups + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS groups_rollup_delete AFTER DELETE ON groups
+    BEGIN
+        UPDATE dashboard_stats SET total_groups = total_groups - 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS study_activities_rollup_insert AFTER INSERT ON study_activities
+    BEGIN
+        UPDATE dashboard_stats SET total_activities = total_activities + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS study_activities_rollup_delete AFTER DELETE ON study_activities
+    BEGIN
+        UPDATE dashboard_stats SET total_activities = total_activities - 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS study_sessions_rollup_insert AFTER INSERT ON study_sessions
+    BEGIN
+        UPDATE dashboard_stats
+        SET total_sessions = total_sessions + 1,
+            completed_sessions = completed_sessions + (NEW.ended_at IS NOT NULL)
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS study_sessions_rollup_end AFTER UPDATE OF ended_at ON study_sessions
+    BEGIN
+        UPDATE dashboard_stats
+        SET completed_sessions = completed_sessions
+            + (NEW.ended_at IS NOT NULL) - (OLD.ended_at IS NOT NULL)
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS study_sessions_rollup_delete AFTER DELETE ON study_sessions
+    BEGIN
+        UPDATE dashboard_stats
+        SET total_sessions = total_sessions - 1,
+            completed_sessions = completed_sessions - (OLD.ended_at IS NOT NULL)
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS word_review_items_rollup_insert AFTER INSERT ON word_review_items
+    BEGIN
+        UPDATE dashboard_stats
+        SET total_reviews = total_reviews + 1,
+            correct_reviews = correct_reviews + NEW.is_correct,
+            words_reviewed = words_reviewed + NOT EXISTS (
+                SELECT 1 FROM word_review_stats WHERE word_id = NEW.word_id
+            )
+        WHERE id = 1;
+        INSERT INTO word_review_stats (word_id, review_count, correct_count)
+        VALUES (NEW.word_id, 1, NEW.is_correct)
+        ON CONFLICT (word_id) DO UPDATE SET
+            review_count = review_count + 1,
+            correct_count = correct_count + excluded.correct_count;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS word_review_items_rollup_correct AFTER UPDATE OF is_correct ON word_review_items
+    BEGIN
+        UPDATE dashboard_stats
+        SET correct_reviews = correct_reviews + NEW.is_correct - OLD.is_correct
+        WHERE id = 1;
+        UPDATE word_review_stats
+        SET correct_count = correct_count + NEW.is_correct - OLD.is_correct
+        WHERE word_id = NEW.word_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS word_review_items_rollup_delete AFTER DELETE ON word_review_items
+    BEGIN
+        UPDATE word_review_stats
+        SET review_count = review_count - 1,
+            correct_count = correct_count - OLD.is_correct
+        WHERE word_id = OLD.word_id;
+        UPDATE dashboard_stats
+        SET total_reviews = total_reviews - 1,
+            correct_reviews = correct_reviews - OLD.is_correct,
+            words_reviewed = words_reviewed - EXISTS (
+                SELECT 1 FROM word_review_stats WHERE word_id = OLD.word_id AND review_count = 0
+            )
+        WHERE id = 1;
+        DELETE FROM word_review_stats WHERE word_id = OLD.word_id AND review_count = 0;
+    END
+    """
+]
+
+event.listen(
+    DashboardStats.__table__,
+    'after_create',
+    DDL("INSERT OR IGNORE INTO dashboard_stats (id) VALUES (1)")
+)
+
+# The rollup triggers span several tables, so create them once all tables exist.
+for trigger in ROLLUP_TRIGGERS:
+    event.listen(db.metadata, 'after_create', DDL(trigger).execute_if(dialect='sqlite'))
@@ -0,0 +1,38 @@
+from sqlalchemy import event, DDL, text
+from app.extensions import db
+
+# Tables whose writes bump a change counter; read endpoints derive ETags from them
+VERSIONED_TABLES = ['words', 'groups', 'words_groups', 'study_activities']
+
+class DataVersion(db.Model):
+    """Per-table change counter, bumped by triggers on every row written"""
+    __tablename__ = 'data_versions'
+
+    table_name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    updated_at = db.Column(db.DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP'))
+
+
+def version_triggers(table_name):
+    """CREATE TRIGGER statements bumping table_name's version on insert, update and delete"""
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {table_name}_version_{operation.lower()}
+        AFTER {operation} ON {table_name}
+        BEGIN
+            UPDATE data_versions
+            SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+            WHERE table_name = '{table_name}';
+        END
+        """
+        for operation in ('INSERT', 'UPDATE', 'DELETE')
+    ]
+
+for versioned in VERSIONED_TABLES:
+    event.listen(
+        DataVersion.__table__,
+        'after_create',
+        DDL(f"INSERT OR IGNORE INTO data_versions (table_name) VALUES ('{versioned}')")
+    )
+    for trigger in version_triggers(versioned):
+        event.listen(db.metadata, 'after_create', DDL(trigger).execute_if(dialect='sqlite'))
@@ -1,19 +1,53 @@
 from app.models.base import BaseModel, db
-from sqlalchemy import func
+from sqlalchemy import func, event, DDL
 from app.models.word_review import WordReviewItem
 from datetime import datetime, UTC
 
 # Define the association table
 words_groups = db.Table('words_groups',
     db.Column('word_id', db.Integer, db.ForeignKey('words.id'), primary_key=True),
-    db.Column('group_id', db.Integer, db.ForeignKey('groups.id'), primary_key=True)
+    db.Column('group_id', db.Integer, db.ForeignKey('groups.id'), primary_key=True),
+    # The primary key serves word -> groups lookups; this serves group -> words
+    db.Index('ix_words_groups_group_id_word_id', 'group_id', 'word_id')
 )
 
+# Keep groups.words_count in step with memberships, whether they are written
+# through the ORM relationship or with plain SQL (seeding, imports).
+WORDS_COUNT_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS words_groups_count_insert
+    AFTER INSERT ON words_groups
+    BEGIN
+        UPDATE groups SET words_count = words_count + 1 WHERE id = NEW.group_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_groups_count_delete
+    AFTER DELETE ON words_groups
+    BEGIN
+        UPDATE groups SET words_count = words_count - 1 WHERE id = OLD.group_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_groups_count_update
+    AFTER UPDATE OF group_id ON words_groups
+    WHEN OLD.group_id IS NOT NEW.group_id
+    BEGIN
+        UPDATE groups SET words_count = words_count - 1 WHERE id = OLD.group_id;
+        UPDATE groups SET words_count = words_count + 1 WHERE id = NEW.group_id;
+    END
+    """
+]
+
+for trigger in WORDS_COUNT_TRIGGERS:
+    event.listen(words_groups, 'after_create', DDL(trigger).execute_if(dialect='sqlite'))
+
 class Group(BaseModel):
     __tablename__ = 'groups'
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
+    words_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     created_at = db.Column(db.DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
     updated_at = db.Column(db.DateTime(timezone=True), onupdate=lambda: datetime.now(UTC))
     
@@ -25,7 +59,8 @@ class Group(BaseModel):
 
     @property
     def total_words(self):
-        return self.words.count()
+        """Number of words in the group, maintained by the words_groups triggers"""
+        return self.words_count or 0
 
     @property
     def word_list(self):
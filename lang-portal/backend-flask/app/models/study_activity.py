@@ -9,6 +9,8 @@ class StudyActivity(db.Model):
     description = db.Column(db.Text)
     instructions = db.Column(db.Text)
     thumbnail = db.Column(db.String(255))
+    # Words handed out when a session starts; None uses the API default
+    words_per_session = db.Column(db.Integer)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, onupdate=datetime.utcnow)
 
@@ -24,6 +26,7 @@ class StudyActivity(db.Model):
             'description': self.description,
             'instructions': self.instructions,
             'thumbnail': self.thumbnail,
+            'words_per_session': self.words_per_session,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
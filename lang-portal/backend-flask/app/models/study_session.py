@@ -5,6 +5,12 @@ from app.models.base import BaseModel
 
 class StudySession(BaseModel):
     __tablename__ = 'study_sessions'
+    __table_args__ = (
+        db.Index('ix_study_sessions_group_id', 'group_id'),
+        db.Index('ix_study_sessions_study_activity_id', 'study_activity_id'),
+        db.Index('ix_study_sessions_started_at', 'started_at'),
+        {'extend_existing': True}
+    )
 
     group_id = db.Column(db.Integer, db.ForeignKey('groups.id'), nullable=True)
     study_activity_id = db.Column(db.Integer, db.ForeignKey('study_activities.id'), nullable=True)
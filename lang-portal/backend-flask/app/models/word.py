@@ -3,6 +3,11 @@ from app.models.base import BaseModel, db
 
 class Word(BaseModel):
     __tablename__ = 'words'
+    __table_args__ = (
+        # Duplicate checks on the natural key during imports
+        db.Index('ix_words_nepali_word_english_word', 'nepali_word', 'english_word'),
+        {'extend_existing': True}
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     nepali_word = db.Column(db.String(100), nullable=False)
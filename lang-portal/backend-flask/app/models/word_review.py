@@ -4,6 +4,17 @@ from sqlalchemy import text, DateTime
 
 class WordReviewItem(BaseModel):
     __tablename__ = 'word_review_items'
+    __table_args__ = (
+        # Per-session counts and reviewed-word lookups
+        db.Index('ix_word_review_items_session_id_is_correct', 'session_id', 'is_correct', 'word_id'),
+        # Per-group statistics
+        db.Index('ix_word_review_items_group_id_is_correct', 'group_id', 'is_correct'),
+        # Per-word totals (GROUP BY word_id)
+        db.Index('ix_word_review_items_word_id_is_correct', 'word_id', 'is_correct'),
+        # Time-range exports, in created_at order
+        db.Index('ix_word_review_items_created_at', 'created_at'),
+        {'extend_existing': True}
+    )
 
     word_id = db.Column(db.Integer, db.ForeignKey('words.id'), nullable=False)
     session_id = db.Column(db.Integer, db.ForeignKey('study_sessions.id'), nullable=False)
@@ -0,0 +1,96 @@
+from sqlalchemy import event, DDL
+from app.extensions import db
+
+class WordSchedule(db.Model):
+    """Spaced-repetition state of a word within a group (SM-2).
+
+    Advanced by a trigger on every review insert, so the next words to drill
+    are an index range scan over (group_id, due_at) instead of a replay of
+    the review history.
+    """
+    __tablename__ = 'word_schedules'
+    __table_args__ = (
+        db.Index('ix_word_schedules_group_id_due_at', 'group_id', 'due_at'),
+    )
+
+    word_id = db.Column(db.Integer, primary_key=True)
+    group_id = db.Column(db.Integer, primary_key=True)
+    repetitions = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    ease_factor = db.Column(db.Float, nullable=False, default=2.5, server_default='2.5')
+    interval_days = db.Column(db.Float, nullable=False, default=0, server_default='0')
+    lapses = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    last_reviewed_at = db.Column(db.DateTime, nullable=False)
+    due_at = db.Column(db.DateTime, nullable=False)
+
+    def to_dict(self):
+        return {
+            'word_id': self.word_id,
+            'group_id': self.group_id,
+            'repetitions': self.repetitions,
+            'ease_factor': self.ease_factor,
+            'interval_days': self.interval_days,
+            'lapses': self.lapses,
+            'last_reviewed_at': self.last_reviewed_at.isoformat() if self.last_reviewed_at else None,
+            'due_at': self.due_at.isoformat() if self.due_at else None
+        }
+
+
+# SM-2 with binary grading: a correct answer is quality 5 (ease +0.1), a
+# wrong one quality 1 (ease -0.54, repetitions restart). Ease never drops
+# below 1.3. Intervals go 1 day, 6 days, then previous interval * ease,
+# capped at MAX_INTERVAL_DAYS: a long run of correct answers otherwise
+# pushes due_at past the year 9999, where datetime() returns NULL and the
+# NOT NULL column rejects every further review of the word.
+# The statement is shared by the trigger (reading NEW.*) and by
+# rebuild_word_schedules (replaying word_review_items in id order, the
+# order the trigger saw them, even for backdated created_at values), so
+# both schedule alike; {source} completes the SELECT for each.
+MAX_INTERVAL_DAYS = 36500
+
+SCHEDULE_UPSERT = f"""
+    INSERT INTO word_schedules (
+        word_id, group_id, repetitions, ease_factor, interval_days, lapses, last_reviewed_at, due_at
+    )
+    SELECT
+        {{row}}word_id, {{row}}group_id,
+        {{row}}is_correct,
+        CASE WHEN {{row}}is_correct THEN 2.6 ELSE 1.96 END,
+        1,
+        1 - {{row}}is_correct,
+        {{row}}created_at,
+        datetime({{row}}created_at, '+1 days')
+    {{source}}
+    ON CONFLICT (word_id, group_id) DO UPDATE SET
+        repetitions = CASE WHEN excluded.repetitions THEN repetitions + 1 ELSE 0 END,
+        ease_factor = MAX(1.3, ease_factor + CASE WHEN excluded.repetitions THEN 0.1 ELSE -0.54 END),
+        interval_days = CASE
+            WHEN NOT excluded.repetitions OR repetitions = 0 THEN 1
+            WHEN repetitions = 1 THEN 6
+            ELSE MIN(ROUND(interval_days * ease_factor, 2), {MAX_INTERVAL_DAYS})
+        END,
+        lapses = lapses + excluded.lapses,
+        last_reviewed_at = excluded.last_reviewed_at,
+        due_at = datetime(excluded.last_reviewed_at, '+' || CASE
+            WHEN NOT excluded.repetitions OR repetitions = 0 THEN 1
+            WHEN repetitions = 1 THEN 6
+            ELSE MIN(ROUND(interval_days * ease_factor, 2), {MAX_INTERVAL_DAYS})
+        END || ' days')
+"""
+
+# "WHERE true" keeps SQLite from parsing ON CONFLICT as a join constraint.
+# The trigger is dropped and recreated on every create_all, so databases
+# built by an older version pick up changes to the statement.
+SCHEDULE_TRIGGER = f"""
+    CREATE TRIGGER word_review_items_schedule AFTER INSERT ON word_review_items
+    BEGIN
+        {SCHEDULE_UPSERT.format(row='NEW.', source='WHERE true').strip()};
+    END
+"""
+
+SCHEDULE_REPLAY = SCHEDULE_UPSERT.format(
+    row='', source='FROM word_review_items WHERE true ORDER BY id'
+)
+
+event.listen(db.metadata, 'after_create',
+             DDL("DROP TRIGGER IF EXISTS word_review_items_schedule").execute_if(dialect='sqlite'))
+event.listen(db.metadata, 'after_create', DDL(SCHEDULE_TRIGGER).execute_if(dialect='sqlite'))
@@ -0,0 +1,63 @@
+from sqlalchemy import event
+from app.extensions import db
+
+# External-content FTS5 index over the three word columns. unicode61 keeps
+# Devanagari vowel signs and viramas inside tokens (they are Unicode marks, not
+# separators) while remove_diacritics folds accents in the Latin columns.
+CREATE_WORDS_FTS = """
+    CREATE VIRTUAL TABLE words_fts USING fts5(
+        nepali_word,
+        romanized_nepali_word,
+        english_word,
+        content='words',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+"""
+
+WORDS_FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS words_fts_insert AFTER INSERT ON words
+    BEGIN
+        INSERT INTO words_fts (rowid, nepali_word, romanized_nepali_word, english_word)
+        VALUES (NEW.id, NEW.nepali_word, NEW.romanized_nepali_word, NEW.english_word);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_fts_delete AFTER DELETE ON words
+    BEGIN
+        INSERT INTO words_fts (words_fts, rowid, nepali_word, romanized_nepali_word, english_word)
+        VALUES ('delete', OLD.id, OLD.nepali_word, OLD.romanized_nepali_word, OLD.english_word);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_fts_update
+    AFTER UPDATE OF nepali_word, romanized_nepali_word, english_word ON words
+    BEGIN
+        INSERT INTO words_fts (words_fts, rowid, nepali_word, romanized_nepali_word, english_word)
+        VALUES ('delete', OLD.id, OLD.nepali_word, OLD.romanized_nepali_word, OLD.english_word);
+        INSERT INTO words_fts (rowid, nepali_word, romanized_nepali_word, english_word)
+        VALUES (NEW.id, NEW.nepali_word, NEW.romanized_nepali_word, NEW.english_word);
+    END
+    """
+]
+
+@event.listens_for(db.metadata, 'after_create')
+def create_words_fts(target, connection, **kw):
+    """Create the search index (populating it from existing words) and its sync triggers"""
+    if connection.dialect.name != 'sqlite':
+        return
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'words_fts'"
+    ).first()
+    if not exists:
+        connection.exec_driver_sql(CREATE_WORDS_FTS)
+        connection.exec_driver_sql("INSERT INTO words_fts (words_fts) VALUES ('rebuild')")
+    for trigger in WORDS_FTS_TRIGGERS:
+        connection.exec_driver_sql(trigger)
+
+@event.listens_for(db.metadata, 'before_drop')
+def drop_words_fts(target, connection, **kw):
+    """Drop the search index with the tables so it cannot outlive its content"""
+    if connection.dialect.name == 'sqlite':
+        connection.exec_driver_sql("DROP TABLE IF EXISTS words_fts")
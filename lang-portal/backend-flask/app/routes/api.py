@@ -1,18 +1,42 @@
-from flask import Blueprint, jsonify, request, abort
+from flask import Blueprint, jsonify, request, abort, current_app, stream_with_context
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import joinedload
 from app.models.word import Word
-from app.models.group import Group
+from app.models.group import Group, words_groups
 from app.models.study_activity import StudyActivity 
 from app.models.study_session import StudySession 
 from app.models.word_review import WordReviewItem
+from app.models.word_schedule import WordSchedule
 from app.middleware import validate_pagination, validate_json_body
-from app.schemas import StudyActivityCreate, WordReviewCreate
+from app.schemas import StudyActivityCreate, WordReviewCreate, WordReviewBatchItem
 from app import db
 from datetime import datetime, UTC
 from app.utils.responses import success_response, error_response, pagination_meta
-from app.utils.statistics import get_study_progress, get_dashboard_statistics
+from app.utils.pagination import keyset_paginate
+from app.utils.http_cache import conditional_get
+from app.utils.projections import (
+    word_rows, group_word_rows, word_group_rows, study_session_rows, paginate_words, paginate_group_words,
+    paginate_word_groups, paginate_study_sessions, sample_group_words, row_dicts
+)
+from app.utils.search import search_words
+from app.utils.fuzzy import get_fuzzy_index
+from app.utils.export import export_reviews, parse_export_bound, EXPORT_FORMATS
+from app.utils.word_import import import_words, ImportAborted, IMPORT_FORMATS
+from app.utils.response_cache import cached, invalidate, get_response_cache
+from app.utils.metrics import record_reviews
+from app.utils.statistics import (
+    get_study_progress, get_dashboard_statistics, session_review_counts, get_rollup, average_score,
+    get_streak
+)
 
 bp = Blueprint('api', __name__, url_prefix='/api')
 
+# Words returned when a study session starts; the cap matches the list endpoints'
+# per_page limit so the cursor continues with same-sized pages
+SESSION_WORDS_DEFAULT = 50
+SESSION_WORDS_MAX = 50
+
 
 @bp.route('/', methods=['GET'])
 def index():
@@ -22,14 +46,23 @@ def index():
         "status": "operational"
     })
 
+@bp.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """Report response cache and compressed-body cache counters"""
+    stats = get_response_cache().stats()
+    stats['compression'] = current_app.extensions['compression_cache'].stats()
+    return success_response(data=stats)
+
 @bp.route('/dashboard', methods=['GET'])
+@cached('catalog', 'sessions')
 def dashboard():
     """Get dashboard overview"""
     try:
+        rollup = get_rollup()
         data = {
-            'total_words': Word.query.count(),
-            'total_groups': Group.query.count(),
-            'total_study_sessions': StudySession.query.count()
+            'total_words': rollup['total_words'],
+            'total_groups': rollup['total_groups'],
+            'total_study_sessions': rollup['total_sessions']
         }
         return success_response(data=data)
     except Exception as e:
@@ -40,40 +73,156 @@ def dashboard():
         )
 
 @bp.route('/words', methods=['GET'])
+@conditional_get('words')
+@validate_pagination(allow_cursor=True)
+def get_words(page=1, per_page=20, cursor=None):
+    try:
+        if cursor is not None:
+            pagination = keyset_paginate(word_rows(), Word.id, cursor, per_page)
+        else:
+            pagination = paginate_words(page, per_page)
+        data = {"words": row_dicts(pagination.items)}
+        return success_response(data=data, meta=pagination_meta(pagination))
+    except Exception as e:
+        return error_response(
+            message="Failed to fetch words",
+            error_code="NOT_FOUND",
+            status_code=404
+        )
+
+@bp.route('/words/import', methods=['POST'])
+def import_words_endpoint():
+    """Bulk import words from a CSV or NDJSON upload.
+
+    Accepts a multipart ``file`` field or a raw request body. The format comes
+    from ``?format=``, else the file extension or Content-Type. The body is
+    parsed as it streams in; the report lists per-line validation errors.
+    """
+    upload = request.files.get('file')
+    if upload is not None:
+        stream, name, content_type = upload.stream, upload.filename or '', upload.mimetype
+    else:
+        stream, name, content_type = request.stream, '', request.mimetype
+
+    import_format = request.args.get('format')
+    if import_format is None:
+        if name.endswith('.csv') or content_type == 'text/csv':
+            import_format = 'csv'
+        elif name.endswith(('.ndjson', '.jsonl')) or content_type in ('application/x-ndjson', 'application/jsonl'):
+            import_format = 'ndjson'
+    if import_format not in IMPORT_FORMATS:
+        return error_response(
+            message=f"format must be one of: {', '.join(IMPORT_FORMATS)}",
+            error_code="VALIDATION_ERROR",
+            status_code=400
+        )
+
+    try:
+        report = import_words(stream, import_format)
+    except ImportAborted as aborted:
+        # Chunks before the failure stay committed; report them with the error
+        if aborted.report['inserted']:
+            invalidate('catalog')
+        if isinstance(aborted.__cause__, UnicodeDecodeError):
+            return error_response(
+                message="Upload must be UTF-8 encoded",
+                error_code="VALIDATION_ERROR",
+                status_code=400,
+                data=aborted.report
+            )
+        return error_response(
+            message="Failed to import words",
+            error_code="DATABASE_ERROR",
+            status_code=500,
+            data=aborted.report
+        )
+    except Exception:
+        return error_response(
+            message="Failed to import words",
+            error_code="DATABASE_ERROR",
+            status_code=500
+        )
+    if report['inserted']:
+        invalidate('catalog')
+    return success_response(data=report, message="Import finished")
+
+@bp.route('/words/search', methods=['GET'])
+@conditional_get('words')
 @validate_pagination()
-def get_words(page=1, per_page=20):
+def search_words_endpoint(page=1, per_page=20):
+    """Full-text prefix search over Nepali, romanized and English words"""
     try:
-        pagination = Word.query.paginate(page=page, per_page=per_page)
-        data = {
+        pagination = search_words(request.args.get('q', ''), page=page, per_page=per_page)
+    except ValueError as e:
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR",
+            status_code=400
+        )
+    return success_response(
+        data={
             "words": [{
                 "id": w.id,
                 "nepali_word": w.nepali_word,
                 "romanized_nepali_word": w.romanized_nepali_word,
                 "english_word": w.english_word,
-                "part_of_speech": w.part_of_speech
+                "part_of_speech": w.part_of_speech,
+                "rank": w.rank
             } for w in pagination.items]
-        }
-        return success_response(data=data, meta=pagination_meta(pagination))
-    except Exception as e:
+        },
+        meta=pagination_meta(pagination)
+    )
+
+@bp.route('/words/fuzzy', methods=['GET'])
+@conditional_get('words')
+def fuzzy_lookup_words():
+    """Typo-tolerant lookup by romanized spelling, closest matches first"""
+    query = request.args.get('q', '').strip()
+    limit = request.args.get('limit', 5, type=int)
+    max_distance = request.args.get('max_distance', None, type=int)
+    if not query:
         return error_response(
-            message="Failed to fetch words",
-            error_code="NOT_FOUND",
-            status_code=404
+            message="Search query is required",
+            error_code="VALIDATION_ERROR",
+            status_code=400
+        )
+    if not 1 <= limit <= 50 or (max_distance is not None and not 0 <= max_distance <= 3):
+        return error_response(
+            message="limit must be between 1 and 50 and max_distance between 0 and 3",
+            error_code="VALIDATION_ERROR",
+            status_code=400
         )
 
+    matches = get_fuzzy_index().search(query, limit=limit, max_distance=max_distance)
+    rows = db.session.execute(
+        select(Word.id, Word.nepali_word, Word.romanized_nepali_word, Word.english_word)
+        .where(Word.id.in_([word_id for word_id, _ in matches]))
+    ).all()
+    words = {row.id: row for row in rows}
+    return success_response(data={
+        "words": [{
+            "id": word_id,
+            "nepali_word": words[word_id].nepali_word,
+            "romanized_nepali_word": words[word_id].romanized_nepali_word,
+            "english_word": words[word_id].english_word,
+            "distance": distance
+        } for word_id, distance in matches if word_id in words]
+    })
+
 @bp.route('/dashboard/statistics', methods=['GET'])
+@cached('reviews', 'sessions')
 def dashboard_statistics():
     """Get dashboard statistics"""
     try:
-        reviews = WordReviewItem.query
-        total_reviews = reviews.count()
-        correct_reviews = reviews.filter_by(is_correct=True).count()
+        rollup = get_rollup()
+        total_reviews = rollup['total_reviews']
         
         data = {
-            'words_learned': db.session.query(WordReviewItem.word_id).group_by(WordReviewItem.word_id).count(),
-            'average_score': (correct_reviews / total_reviews * 100) if total_reviews > 0 else 0,
+            'words_learned': rollup['words_reviewed'],
+            'average_score': (rollup['correct_reviews'] / total_reviews * 100) if total_reviews > 0 else 0,
             'total_reviews': total_reviews,
-            'study_sessions_completed': StudySession.query.filter(StudySession.ended_at.isnot(None)).count()
+            'study_sessions_completed': rollup['completed_sessions'],
+            **get_streak()
         }
         return success_response(data=data)
     except Exception as e:
@@ -104,6 +253,8 @@ def review_word(session_id, word_id):
         
         db.session.add(review)
         db.session.commit()
+        invalidate('reviews')
+        record_reviews(1)
         
         return jsonify({
             "success": True,
@@ -113,12 +264,151 @@ def review_word(session_id, word_id):
             "session_id": review.session_id,
             "group_id": review.group_id,
             "is_correct": review.is_correct,
-            "created_at": review.created_at.isoformat() + "Z"
+            "created_at": review.created_at
         })
     except ValueError as e:
         return error_response(str(e), status_code=400, error_code="VALIDATION_ERROR")
 
+@bp.route('/study-sessions/<int:session_id>/reviews', methods=['POST'])
+def review_words_batch(session_id):
+    """Record many word reviews for a session in one transaction"""
+    data = request.get_json(silent=True)
+    items = data.get('reviews') if isinstance(data, dict) else None
+    max_size = current_app.config['REVIEW_BATCH_MAX_SIZE']
+    if not isinstance(items, list) or not items:
+        return error_response(
+            message="reviews must be a non-empty list",
+            error_code="VALIDATION_ERROR",
+            status_code=400
+        )
+    if len(items) > max_size:
+        return error_response(
+            message=f"At most {max_size} reviews can be submitted at once",
+            error_code="VALIDATION_ERROR",
+            status_code=400
+        )
+
+    session = db.session.get(StudySession, session_id)
+    if not session:
+        return error_response(
+            message=f"Study session with id {session_id} not found",
+            error_code="NOT_FOUND",
+            status_code=404
+        )
+    if session.group_id is None:
+        return error_response(
+            message="Study session has no group",
+            error_code="INVALID_STATE",
+            status_code=400
+        )
+
+    results = []
+    reviews = []
+    for index, item in enumerate(items):
+        try:
+            reviews.append((index, WordReviewBatchItem.model_validate(item)))
+            results.append(None)
+        except ValidationError as e:
+            results.append({
+                "index": index,
+                "status": "rejected",
+                "errors": [error['msg'] for error in e.errors()]
+            })
+
+    # One lookup of the group's words covers every item in the batch
+    group_word_ids = set(db.session.scalars(
+        select(words_groups.c.word_id)
+        .where(words_groups.c.group_id == session.group_id)
+        .where(words_groups.c.word_id.in_({review.word_id for _, review in reviews}))
+    ))
+
+    now = datetime.now(UTC)
+    rows = []
+    for index, review in reviews:
+        if review.word_id not in group_word_ids:
+            results[index] = {
+                "index": index,
+                "word_id": review.word_id,
+                "status": "rejected",
+                "errors": ["Word is not part of the session's group"]
+            }
+            continue
+        rows.append((index, {
+            "word_id": review.word_id,
+            "session_id": session_id,
+            "group_id": session.group_id,
+            "is_correct": review.is_correct,
+            "created_at": review.created_at or now
+        }))
+
+    if not rows:
+        return error_response(
+            message="No valid reviews in batch",
+            error_code="VALIDATION_ERROR",
+            status_code=400,
+            errors=results
+        )
+
+    try:
+        ids = db.session.scalars(
+            insert(WordReviewItem).returning(WordReviewItem.id, sort_by_parameter_order=True),
+            [row for _, row in rows]
+        ).all()
+        db.session.commit()
+        invalidate('reviews')
+        record_reviews(len(ids))
+    except Exception:
+        db.session.rollback()
+        return error_response(
+            message="Failed to record reviews",
+            error_code="DATABASE_ERROR",
+            status_code=500
+        )
+
+    for (index, row), review_id in zip(rows, ids):
+        results[index] = {
+            "index": index,
+            "word_id": row["word_id"],
+            "status": "created",
+            "id": review_id,
+            "is_correct": row["is_correct"]
+        }
+
+    return success_response(
+        data={
+            "session_id": session_id,
+            "accepted": len(rows),
+            "rejected": len(items) - len(rows),
+            "results": results
+        },
+        message="Word reviews recorded successfully"
+    )
+
+@bp.route('/reviews/export', methods=['GET'])
+def export_review_history():
+    """Stream review history joined with word, group and session data as NDJSON or CSV.
+
+    Rows are read from a streaming cursor in fixed-size chunks, so memory use
+    does not grow with the size of the history.
+    """
+    export_format = request.args.get('format', 'ndjson')
+    try:
+        since = parse_export_bound(request.args.get('since'), 'since')
+        until = parse_export_bound(request.args.get('until'), 'until')
+        body = export_reviews(export_format, since=since, until=until)
+    except ValueError as e:
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR",
+            status_code=400
+        )
+
+    response = current_app.response_class(stream_with_context(body), mimetype=EXPORT_FORMATS[export_format])
+    response.headers['Content-Disposition'] = f'attachment; filename="reviews.{export_format}"'
+    return response
+
 @bp.route('/dashboard/last-session', methods=['GET'])
+@cached('reviews', 'sessions')
 def last_session():
     """Get last study session"""
     try:
@@ -134,8 +424,8 @@ def last_session():
         return success_response(data={
             'id': last_session.id,
             'score': round(score, 2),
-            'started_at': last_session.started_at.isoformat() + "Z",
-            'ended_at': last_session.ended_at.isoformat() + "Z" if last_session.ended_at else None
+            'started_at': last_session.started_at,
+            'ended_at': last_session.ended_at
         })
     except Exception as e:
         return error_response(
@@ -145,14 +435,16 @@ def last_session():
         )
 
 @bp.route('/dashboard/study-progress', methods=['GET'])
+@cached('catalog', 'reviews', 'sessions')
 def study_progress():
     """Get study progress"""
     try:
+        rollup = get_rollup()
         data = {
             'progress': {
-                'total_words_studied': db.session.query(WordReviewItem.word_id).group_by(WordReviewItem.word_id).count(),
-                'total_sessions': StudySession.query.count(),
-                'total_activities': StudyActivity.query.count()
+                'total_words_studied': rollup['words_reviewed'],
+                'total_sessions': rollup['total_sessions'],
+                'total_activities': rollup['total_activities']
             }
         }
         return success_response(data=data)
@@ -164,6 +456,7 @@ def study_progress():
         )
 
 @bp.route('/study-activities', methods=['GET'])
+@conditional_get('study_activities')
 @validate_pagination()
 def get_study_activities(page=1, per_page=20):
     try:
@@ -188,6 +481,8 @@ def get_study_activities(page=1, per_page=20):
         )
 
 @bp.route('/study-activities/<int:id>', methods=['GET'])
+@conditional_get('study_activities')
+@cached('catalog')
 def get_study_activity(id):
     """Get details of a specific study activity"""
     try:
@@ -214,12 +509,12 @@ def get_activity_sessions(id):
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
     
-    pagination = StudySession.query.filter_by(study_activity_id=id).paginate(
-        page=page, per_page=per_page
-    )
+    pagination = with_session_relations(StudySession.query)\
+        .filter_by(study_activity_id=id)\
+        .paginate(page=page, per_page=per_page)
     
     return jsonify({
-        "study_sessions": [format_study_session(session) for session in pagination.items],
+        "study_sessions": format_study_sessions(pagination.items),
         "pagination": {
             "page": pagination.page,
             "per_page": pagination.per_page,
@@ -231,6 +526,15 @@ def get_activity_sessions(id):
 
 @bp.route('/study-activities', methods=['POST'])
 def create_study_session():
+    """Start a study session and return the first words to study.
+
+    The response holds at most words_limit words (default: the activity's
+    words_per_session, else SESSION_WORDS_DEFAULT), so its size does not
+    grow with the group. In order, the rest of the group is fetched with
+    GET /api/groups/<group_id>/words?cursor=<next_cursor>. With
+    "sample": true the words are a random subset instead and there is no
+    cursor.
+    """
     try:
         data = request.get_json()
         if not data or 'group_id' not in data or 'study_activity_id' not in data:
@@ -243,9 +547,17 @@ def create_study_session():
         try:
             group_id = int(data['group_id'])
             study_activity_id = int(data['study_activity_id'])
+            words_limit = int(data['words_limit']) if data.get('words_limit') is not None else None
         except (ValueError, TypeError):
             return error_response(
-                message="Invalid data types for group_id or study_activity_id",
+                message="Invalid data types for group_id, study_activity_id or words_limit",
+                error_code="VALIDATION_ERROR",
+                status_code=400
+            )
+        sample = data.get('sample', False)
+        if not isinstance(sample, bool) or (words_limit is not None and not 1 <= words_limit <= SESSION_WORDS_MAX):
+            return error_response(
+                message=f"sample must be a boolean and words_limit between 1 and {SESSION_WORDS_MAX}",
                 error_code="VALIDATION_ERROR",
                 status_code=400
             )
@@ -261,6 +573,16 @@ def create_study_session():
                 status_code=404
             )
         
+        # Read the first words before the commit expires the group
+        words_limit = min(words_limit or activity.words_per_session or SESSION_WORDS_DEFAULT, SESSION_WORDS_MAX)
+        words_total = group.words_count
+        if sample:
+            words, next_cursor = sample_group_words(group, words_limit), None
+        else:
+            first_page = keyset_paginate(group_word_rows(group_id), words_groups.c.word_id,
+                                         {"after": None}, words_limit)
+            words, next_cursor = first_page.items, first_page.next_cursor
+        
         # Create the study session
         session = StudySession(
             group_id=group_id,
@@ -268,23 +590,20 @@ def create_study_session():
             started_at=datetime.now(UTC)
         )
         db.session.add(session)
+        db.session.flush()
+        session_id = session.id  # read before the commit expires it
         db.session.commit()
-        
-        # Get all words from the group
-        group_words = [{
-            'id': w.id,
-            'nepali_word': w.nepali_word,
-            'english_word': w.english_word,
-            'romanized_nepali_word': w.romanized_nepali_word
-        } for w in group.words]
+        invalidate('sessions')
         
         return jsonify({
             "success": True,
             "message": "Study session created successfully",
-            "id": session.id,
-            "group_id": session.group_id,
-            "study_activity_id": session.study_activity_id,
-            "words": group_words
+            "id": session_id,
+            "group_id": group_id,
+            "study_activity_id": study_activity_id,
+            "words": row_dicts(words),
+            "words_total": words_total,
+            "next_cursor": next_cursor
         })
     except Exception as e:
         db.session.rollback()
@@ -297,6 +616,8 @@ def create_study_session():
 
 
 @bp.route('/words/<int:id>', methods=['GET'])
+@conditional_get('words', 'groups', 'words_groups')
+@cached('catalog')
 def get_word(id):
     try:
         word = db.session.get(Word, id)
@@ -313,12 +634,9 @@ def get_word(id):
             "romanized_nepali_word": word.romanized_nepali_word,
             "english_word": word.english_word,
             "part_of_speech": word.part_of_speech,
-            "word_groups": [{
-                "id": g.id,
-                "name": g.name,
-                "description": g.description,
-                "total_words": g.words.count()
-            } for g in word.groups]
+            "word_groups": row_dicts(db.session.execute(
+                word_group_rows(id).order_by(words_groups.c.group_id)
+            ))
         })
     except Exception as e:
         return error_response(
@@ -340,17 +658,10 @@ def get_word_groups(id, page=1, per_page=20):
                 status_code=404
             )
         
-        pagination = word.groups.paginate(page=page, per_page=per_page)
+        pagination = paginate_word_groups(id, page, per_page)
         
         return success_response(
-            data={
-                "word_groups": [{
-                    "id": g.id,
-                    "name": g.name,
-                    "description": g.description,
-                    "total_words": g.words.count()
-                } for g in pagination.items]
-            },
+            data={"word_groups": row_dicts(pagination.items)},
             meta=pagination_meta(pagination)
         )
     except Exception as e:
@@ -368,8 +679,10 @@ def get_word_groups(id, page=1, per_page=20):
 def reset_history():
     try:
         WordReviewItem.query.delete()
+        WordSchedule.query.delete()
         StudySession.query.delete()
         db.session.commit()
+        invalidate('reviews', 'sessions')
         return jsonify({
             "success": True,
             "message": "History reset successfully"
@@ -385,10 +698,13 @@ def reset_history():
 def full_reset():
     try:
         WordReviewItem.query.delete()
+        WordSchedule.query.delete()
         StudySession.query.delete()
+        db.session.execute(words_groups.delete())
         Word.query.delete()
         Group.query.delete()
         db.session.commit()
+        invalidate('catalog', 'reviews', 'sessions')
         return jsonify({
             "success": True,
             "message": "Full reset successfully"
@@ -401,23 +717,16 @@ def full_reset():
         }), 404
 
 @bp.route('/study-sessions', methods=['GET'])
-@validate_pagination()
-def get_study_sessions(page=1, per_page=20):
+@validate_pagination(allow_cursor=True)
+def get_study_sessions(page=1, per_page=20, cursor=None):
     """Get paginated list of study sessions"""
     try:
-        pagination = StudySession.query.paginate(page=page, per_page=per_page)
+        if cursor is not None:
+            pagination = keyset_paginate(study_session_rows(), StudySession.id, cursor, per_page)
+        else:
+            pagination = paginate_study_sessions(page, per_page)
         
-        data = {
-            "study_sessions": [{
-                "id": s.id,
-                "group_id": s.group_id,
-                "study_activity_id": s.study_activity_id,
-                "started_at": s.started_at.isoformat() + "Z",
-                "ended_at": s.ended_at.isoformat() + "Z" if s.ended_at else None,
-                "group_name": s.group.name if s.group else None,
-                "activity_name": s.activity.name if s.activity else None
-            } for s in pagination.items]
-        }
+        data = {"study_sessions": row_dicts(pagination.items)}
         
         return success_response(data=data, meta=pagination_meta(pagination))
     except Exception as e:
@@ -437,8 +746,8 @@ def get_study_session(id):
             "id": session_obj.id,
             "group_id": session_obj.group_id,
             "study_activity_id": session_obj.study_activity_id,
-            "started_at": session_obj.started_at.isoformat() + "Z",
-            "ended_at": session_obj.ended_at.isoformat() + "Z" if session_obj.ended_at else None,
+            "started_at": session_obj.started_at,
+            "ended_at": session_obj.ended_at,
             "group_name": session_obj.group.name if session_obj.group else None,
             "activity_name": session_obj.activity.name if session_obj.activity else None
         }
@@ -486,15 +795,13 @@ def get_session_words(id, page=1, per_page=20):  # Fixed parameter names
 @validate_pagination()
 def get_group_study_sessions(id, page=1, per_page=20):  # Fixed parameter names
     try:
-        group = db.session.get(Group, id)
-        
-        pagination = StudySession.query\
+        pagination = with_session_relations(StudySession.query)\
             .filter_by(group_id=id)\
             .paginate(page=page, per_page=per_page)
         
         return success_response(
             data={
-                "study_sessions": [format_study_session(session) for session in pagination.items]
+                "study_sessions": format_study_sessions(pagination.items)
             },
             meta=pagination_meta(pagination)
         )
@@ -519,7 +826,9 @@ def end_study_session(id):
             
         session.ended_at = datetime.now(UTC)
         db.session.commit()
+        invalidate('sessions')
         
+        session = with_session_relations(StudySession.query).filter_by(id=id).one()
         return success_response(data=format_study_session(session))
     except Exception as e:
         db.session.rollback()
@@ -529,52 +838,50 @@ def end_study_session(id):
             status_code=404
         )
 
-# Helper function for formatting study sessions
+# Helper functions for formatting study sessions
+def with_session_relations(query):
+    """Eager-load the group and activity a formatted study session needs"""
+    return query.options(
+        joinedload(StudySession.group),
+        joinedload(StudySession.activity)
+    )
+
+def format_study_sessions(sessions):
+    """Format a page of study sessions with review counts in one aggregate query"""
+    counts = session_review_counts([session.id for session in sessions])
+    return [{
+        "id": session.id,
+        "activity_name": session.activity.name if session.activity else None,
+        "group_name": session.group.name if session.group else None,
+        "started_at": session.started_at,
+        "ended_at": session.ended_at,
+        "number_of_review_items": counts[session.id]["total"],
+        "number_of_correct_review_items": counts[session.id]["correct"],
+        "number_of_wrong_review_items": counts[session.id]["wrong"]
+    } for session in sessions]
+
 def format_study_session(session):
     """Format study session data with review counts"""
-    # Use distinct count to avoid duplicates
-    correct_count = WordReviewItem.query.filter_by(
-        session_id=session.id, 
-        is_correct=True
-    ).count()
-    
-    wrong_count = WordReviewItem.query.filter_by(
-        session_id=session.id, 
-        is_correct=False
-    ).count()
-    
-    total_count = WordReviewItem.query.filter_by(
-        session_id=session.id
-    ).count()
-    
-    return {
-        "id": session.id,
-        "activity_name": session.activity.name,
-        "group_name": session.group.name,
-        "started_at": session.started_at.isoformat() + "Z",
-        "ended_at": session.ended_at.isoformat() + "Z" if session.ended_at else None,
-        "number_of_review_items": total_count,
-        "number_of_correct_review_items": correct_count,
-        "number_of_wrong_review_items": wrong_count
-    }
+    return format_study_sessions([session])[0]
 
 def calculate_average_score():
     """Calculate average score across all reviews"""
-    correct_reviews = WordReviewItem.query.filter_by(is_correct=True).count()
-    total_reviews = WordReviewItem.query.count()
-    return round((correct_reviews / total_reviews * 100) if total_reviews > 0 else 0, 2)
+    return average_score(get_rollup())
 
 def calculate_streak():
     """Calculate current learning streak"""
-    # For now, return a placeholder value
-    return 0
+    return get_streak()["current_streak"]
 
 @bp.route('/groups', methods=['GET'])
-@validate_pagination()
-def get_groups(page=1, per_page=20):
+@conditional_get('groups', 'words_groups')
+@validate_pagination(allow_cursor=True)
+def get_groups(page=1, per_page=20, cursor=None):
     """Get paginated list of word groups"""
     try:
-        pagination = Group.query.paginate(page=page, per_page=per_page)
+        if cursor is not None:
+            pagination = keyset_paginate(Group.query, Group.id, cursor, per_page)
+        else:
+            pagination = Group.query.paginate(page=page, per_page=per_page)
         
         return success_response(
             data={
@@ -595,6 +902,7 @@ def get_groups(page=1, per_page=20):
         )
 
 @bp.route('/groups/<int:id>', methods=['GET'])
+@cached('catalog', 'reviews')
 def get_group(id):
     """Get details of a specific group"""
     try:
@@ -620,22 +928,20 @@ def get_group(id):
         )
 
 @bp.route('/groups/<int:id>/words', methods=['GET'])
-@validate_pagination()
-def get_group_words(id, page=1, per_page=20):
+@conditional_get('words', 'groups', 'words_groups')
+@validate_pagination(allow_cursor=True)
+def get_group_words(id, page=1, per_page=20, cursor=None):
     """Get paginated list of words in a group"""
     try:
         group = db.session.get(Group, id)
-        pagination = group.words.paginate(page=page, per_page=per_page)
+        if cursor is not None:
+            # Key on the membership column so the (group_id, word_id) index supplies the order
+            pagination = keyset_paginate(group_word_rows(group.id), words_groups.c.word_id, cursor, per_page)
+        else:
+            pagination = paginate_group_words(group, page, per_page)
         
         return success_response(
-            data={
-                "words": [{
-                    "id": w.id,
-                    "nepali_word": w.nepali_word,
-                    "romanized_nepali_word": w.romanized_nepali_word,
-                    "english_word": w.english_word
-                } for w in pagination.items]
-            },
+            data={"words": row_dicts(pagination.items)},
             meta=pagination_meta(pagination)
         )
     except Exception as e:
@@ -644,3 +950,84 @@ def get_group_words(id, page=1, per_page=20):
             error_code="NOT_FOUND",
             status_code=404
         )
+
+@bp.route('/groups/<int:id>/due-words', methods=['GET'])
+def get_group_due_words(id):
+    """Get the next words to drill in a group, most overdue first.
+
+    Due words come from an index range scan over word_schedules; with
+    include_new (the default) the rest of the limit is filled with words
+    of the group that have never been reviewed.
+    """
+    limit = request.args.get('limit', 20, type=int)
+    include_new = request.args.get('include_new', 'true').lower() != 'false'
+    if not 1 <= limit <= 100:
+        return error_response(
+            message="limit must be between 1 and 100",
+            error_code="VALIDATION_ERROR",
+            status_code=400
+        )
+    if db.session.get(Group, id) is None:
+        return error_response(
+            message="Group not found",
+            error_code="NOT_FOUND",
+            status_code=404
+        )
+
+    try:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        word_columns = (Word.id, Word.nepali_word, Word.romanized_nepali_word, Word.english_word)
+        due = db.session.execute(
+            select(*word_columns, WordSchedule.due_at, WordSchedule.interval_days,
+                   WordSchedule.ease_factor, WordSchedule.repetitions)
+            .join(Word, Word.id == WordSchedule.word_id)
+            .where(WordSchedule.group_id == id, WordSchedule.due_at <= now)
+            .order_by(WordSchedule.due_at)
+            .limit(limit)
+        ).all()
+
+        words = [{
+            "id": row.id,
+            "nepali_word": row.nepali_word,
+            "romanized_nepali_word": row.romanized_nepali_word,
+            "english_word": row.english_word,
+            "new": False,
+            "due_at": row.due_at.isoformat(),
+            "interval_days": row.interval_days,
+            "ease_factor": row.ease_factor,
+            "repetitions": row.repetitions
+        } for row in due]
+
+        if include_new and len(words) < limit:
+            unseen = db.session.execute(
+                select(*word_columns)
+                .join(words_groups, words_groups.c.word_id == Word.id)
+                .where(
+                    words_groups.c.group_id == id,
+                    ~select(WordSchedule.word_id).where(
+                        WordSchedule.word_id == words_groups.c.word_id,
+                        WordSchedule.group_id == id
+                    ).exists()
+                )
+                .order_by(words_groups.c.word_id)
+                .limit(limit - len(words))
+            ).all()
+            words.extend({
+                "id": row.id,
+                "nepali_word": row.nepali_word,
+                "romanized_nepali_word": row.romanized_nepali_word,
+                "english_word": row.english_word,
+                "new": True,
+                "due_at": None,
+                "interval_days": 0,
+                "ease_factor": None,
+                "repetitions": 0
+            } for row in unseen)
+
+        return success_response(data={"group_id": id, "words": words})
+    except Exception as e:
+        return error_response(
+            message="Failed to fetch due words",
+            error_code="DATABASE_ERROR",
+            status_code=500
+        )
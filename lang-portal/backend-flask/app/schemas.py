@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import List
+from typing import List, Optional
+from datetime import datetime, UTC
 
 class WordBase(BaseModel):
     model_config = ConfigDict(
@@ -42,6 +43,24 @@ class WordReviewCreate(BaseModel):
     
     is_correct: bool = Field(...)
 
+class WordReviewBatchItem(BaseModel):
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        extra="forbid",
+        from_attributes=True
+    )
+    
+    word_id: int = Field(..., gt=0, strict=True)
+    is_correct: bool = Field(..., strict=True)
+    created_at: Optional[datetime] = None
+    
+    @field_validator('created_at')
+    def normalize_created_at(cls, v):
+        """Store client timestamps as naive UTC, like the rest of the review history"""
+        if v is not None and v.tzinfo is not None:
+            v = v.astimezone(UTC).replace(tzinfo=None)
+        return v
+
 class PaginationParams(BaseModel):
     model_config = ConfigDict(
         str_strip_whitespace=True,
@@ -0,0 +1,260 @@
+import json
+import os
+import time
+from datetime import datetime, UTC
+from itertools import islice
+from sqlalchemy import insert, select
+from app.extensions import db
+from app.models import Word, Group, StudyActivity, StudySession, WordReviewItem
+from app.models.group import words_groups
+
+# Tables whose secondary indexes are dropped during a load and rebuilt once at
+# the end, which is much cheaper than maintaining them row by row.
+DEFERRED_INDEX_TABLES = [WordReviewItem.__table__, StudySession.__table__, words_groups]
+
+def iter_json_array(path, buffer_size=1 << 16):
+    """Yield the objects of a top-level JSON array without loading the whole file"""
+    decoder = json.JSONDecoder()
+    with open(path, encoding='utf-8') as f:
+        buffer = f.read(buffer_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{path}: expected a JSON array")
+        buffer = buffer[1:]
+        eof = False
+        while True:
+            buffer = buffer.lstrip()
+            if buffer.startswith(','):
+                buffer = buffer[1:].lstrip()
+            if buffer.startswith(']'):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError(f"{path}: truncated or invalid JSON array")
+                chunk = f.read(buffer_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield item
+            buffer = buffer[end:]
+
+def chunked(iterable, size):
+    """Split an iterable into lists of at most size items"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+def parse_timestamp(value):
+    """Parse an ISO timestamp from a seed file into naive UTC, as the models store it"""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+class Progress:
+    """Per-table row counter that reports rows/sec at most once per interval"""
+
+    def __init__(self, table, report=print, interval=1.0):
+        self.table = table
+        self.report = report
+        self.interval = interval
+        self.inserted = 0
+        self.skipped = 0
+        self.started = self.last_report = time.perf_counter()
+
+    def update(self, inserted, skipped=0):
+        self.inserted += inserted
+        self.skipped += skipped
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report(f"  {self.table}: {self.inserted:,} rows ({self._rate(now):,.0f} rows/s)")
+
+    def done(self):
+        now = time.perf_counter()
+        self.report(
+            f"  {self.table}: {self.inserted:,} inserted, {self.skipped:,} already present "
+            f"in {now - self.started:.2f}s ({self._rate(now):,.0f} rows/s)"
+        )
+        return {'inserted': self.inserted, 'skipped': self.skipped}
+
+    def _rate(self, now):
+        elapsed = now - self.started
+        return self.inserted / elapsed if elapsed > 0 else 0
+
+
+class SeedLoader:
+    """Load the JSON seed files with set-based inserts.
+
+    Relations are resolved through dicts keyed by natural keys (activity and
+    group names, Nepali words), rows go in with chunked executemany, and the
+    whole load runs in one transaction. Rows that already exist are skipped,
+    so re-running a load only adds what is missing.
+    """
+
+    def __init__(self, seeds_dir, chunk_size=5000, defer_indexes=True, report=print):
+        self.seeds_dir = seeds_dir
+        self.chunk_size = chunk_size
+        self.defer_indexes = defer_indexes
+        self.report = report
+
+    def load(self):
+        """Run the full load and return inserted/skipped counts per table"""
+        started = time.perf_counter()
+        summary = {}
+        try:
+            if self.defer_indexes:
+                self._drop_indexes()
+            activity_ids = self.load_named(StudyActivity, 'activities.json', summary)
+            group_ids = self.load_named(Group, 'groups.json', summary)
+            word_ids = self.load_words(summary)
+            self.load_memberships(word_ids, group_ids, summary)
+            self.load_sessions(word_ids, group_ids, activity_ids, summary)
+            if self.defer_indexes:
+                self._create_indexes()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        self.report(f"Seeded in {time.perf_counter() - started:.2f}s")
+        return summary
+
+    def path(self, filename):
+        return os.path.join(self.seeds_dir, filename)
+
+    def load_named(self, model, filename, summary):
+        """Load rows keyed by a unique name; returns name -> id"""
+        ids = dict(db.session.execute(select(model.name, model.id)).all())
+        progress = Progress(model.__tablename__, self.report)
+        for chunk in chunked(iter_json_array(self.path(filename)), self.chunk_size):
+            new = []
+            for row in chunk:
+                if row['name'] not in ids:
+                    ids[row['name']] = None
+                    new.append(row)
+            self._insert_returning_ids(model, new, ids, key=lambda row: row['name'])
+            progress.update(len(new), len(chunk) - len(new))
+        summary[model.__tablename__] = progress.done()
+        return ids
+
+    def load_words(self, summary):
+        """Load words, deduplicated on (nepali_word, english_word); returns nepali_word -> id"""
+        existing = db.session.execute(select(Word.nepali_word, Word.english_word, Word.id)).all()
+        ids = {(nepali, english): word_id for nepali, english, word_id in existing}
+        progress = Progress('words', self.report)
+        for chunk in chunked(iter_json_array(self.path('words.json')), self.chunk_size):
+            new = []
+            for row in chunk:
+                key = (row['nepali_word'], row['english_word'])
+                if key in ids:
+                    continue
+                ids[key] = None
+                part_of_speech = row.get('part_of_speech') or []
+                new.append({
+                    'nepali_word': row['nepali_word'],
+                    'romanized_nepali_word': row['romanized_nepali_word'],
+                    'english_word': row['english_word'],
+                    'part_of_speech': part_of_speech if isinstance(part_of_speech, str) else json.dumps(part_of_speech)
+                })
+            self._insert_returning_ids(Word, new, ids, key=lambda row: (row['nepali_word'], row['english_word']))
+            progress.update(len(new), len(chunk) - len(new))
+        summary['words'] = progress.done()
+
+        # Membership and review seeds refer to words by their Nepali spelling
+        by_nepali = {}
+        for (nepali, _), word_id in ids.items():
+            by_nepali.setdefault(nepali, word_id)
+        return by_nepali
+
+    def load_memberships(self, word_ids, group_ids, summary):
+        progress = Progress('words_groups', self.report)
+        statement = insert(words_groups).prefix_with('OR IGNORE')
+        for chunk in chunked(iter_json_array(self.path('words_groups.json')), self.chunk_size):
+            rows = [{
+                'word_id': self._lookup(word_ids, relation['nepali_word'], 'word', 'words_groups.json'),
+                'group_id': self._lookup(group_ids, relation['group_name'], 'group', 'words_groups.json')
+            } for relation in chunk]
+            inserted = db.session.execute(statement, rows).rowcount
+            progress.update(inserted, len(rows) - inserted)
+        summary['words_groups'] = progress.done()
+
+    def load_sessions(self, word_ids, group_ids, activity_ids, summary):
+        """Load sessions with their nested reviews; sessions already present are skipped whole"""
+        seen = {
+            (group_id, activity_id, started_at)
+            for group_id, activity_id, started_at in db.session.execute(
+                select(StudySession.group_id, StudySession.study_activity_id, StudySession.started_at)
+            )
+        }
+        sessions = Progress('study_sessions', self.report)
+        reviews = Progress('word_review_items', self.report)
+        for chunk in chunked(iter_json_array(self.path('sessions.json')), self.chunk_size):
+            new = []
+            for session_data in chunk:
+                row = {
+                    'group_id': self._lookup(group_ids, session_data['group_name'], 'group', 'sessions.json'),
+                    'study_activity_id': self._lookup(
+                        activity_ids, session_data['activity_name'], 'activity', 'sessions.json'),
+                    'started_at': parse_timestamp(session_data['started_at']),
+                    'ended_at': parse_timestamp(session_data['ended_at']) if session_data.get('ended_at') else None
+                }
+                key = (row['group_id'], row['study_activity_id'], row['started_at'])
+                if key not in seen:
+                    seen.add(key)
+                    new.append((row, session_data.get('reviews', [])))
+            sessions.update(len(new), len(chunk) - len(new))
+            if not new:
+                continue
+
+            session_ids = db.session.scalars(
+                insert(StudySession).returning(StudySession.id, sort_by_parameter_order=True),
+                [row for row, _ in new]
+            ).all()
+            review_rows = [{
+                'word_id': self._lookup(word_ids, review['nepali_word'], 'word', 'sessions.json'),
+                'session_id': session_id,
+                'group_id': row['group_id'],
+                'is_correct': review['is_correct'],
+                'created_at': parse_timestamp(review['created_at'])
+            } for session_id, (row, session_reviews) in zip(session_ids, new) for review in session_reviews]
+            for review_chunk in chunked(review_rows, self.chunk_size):
+                db.session.execute(insert(WordReviewItem), review_chunk)
+                reviews.update(len(review_chunk))
+        summary['study_sessions'] = sessions.done()
+        summary['word_review_items'] = reviews.done()
+
+    def _insert_returning_ids(self, model, rows, ids, key):
+        if not rows:
+            return
+        new_ids = db.session.scalars(
+            insert(model).returning(model.id, sort_by_parameter_order=True), rows
+        ).all()
+        for row, new_id in zip(rows, new_ids):
+            ids[key(row)] = new_id
+
+    @staticmethod
+    def _lookup(ids, name, kind, filename):
+        try:
+            return ids[name]
+        except KeyError:
+            raise ValueError(f"{filename}: unknown {kind} {name!r}") from None
+
+    def _drop_indexes(self):
+        connection = db.session.connection()
+        for table in DEFERRED_INDEX_TABLES:
+            for index in table.indexes:
+                index.drop(connection, checkfirst=True)
+
+    def _create_indexes(self):
+        started = time.perf_counter()
+        connection = db.session.connection()
+        for table in DEFERRED_INDEX_TABLES:
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+        self.report(f"  indexes rebuilt in {time.perf_counter() - started:.2f}s")
+
+def load_seeds(seeds_dir, **options):
+    """Load the JSON seed files in seeds_dir; see SeedLoader"""
+    return SeedLoader(seeds_dir, **options).load()
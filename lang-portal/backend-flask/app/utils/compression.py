@@ -0,0 +1,90 @@
+import gzip
+from flask import current_app, request
+from app.utils.response_cache import LRUCache
+
+try:
+    import brotli
+except ImportError:  # optional; gzip alone covers every client
+    brotli = None
+
+# Media types worth compressing; everything else (images, already-compressed data) passes through
+COMPRESSIBLE_MIMETYPES = {'application/json', 'application/x-ndjson', 'text/csv', 'text/plain', 'text/html'}
+
+def available_encodings():
+    """Content codings this process can produce, in server preference order"""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+def encoded_etag(etag, encoding):
+    """Strong ETag of the encoded representation of a response"""
+    return f"{etag}-{encoding}"
+
+def etag_variants(etag):
+    """The ETag of a response and of each encoded representation it may be served as"""
+    return [etag] + [encoded_etag(etag, encoding) for encoding in ('br', 'gzip')]
+
+def compress(data, encoding, level):
+    if encoding == 'br':
+        return brotli.compress(data, quality=level)
+    # mtime=0 keeps the output a pure function of the input
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+def negotiate_encoding():
+    """Pick the best coding the client accepts, or None for identity"""
+    return request.accept_encodings.best_match(available_encodings())
+
+def compress_response(response):
+    """Compress a response body for clients that accept it.
+
+    Only complete 200 responses of a compressible media type at least
+    COMPRESSION_MIN_SIZE bytes long are encoded. Responses carrying a strong
+    ETag get an encoding-specific ETag, and their compressed bodies are kept
+    in an LRU keyed by that ETag, so repeat requests for unchanged data skip
+    the compression work. The body served from that cache can carry an
+    older envelope timestamp; like the ETag itself, only the data is compared.
+    """
+    config = current_app.config
+    if (not config['COMPRESSION_ENABLED']
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding()
+    if encoding is None:
+        return response
+
+    etag, weak = response.get_etag()
+    if response.status_code == 304:
+        # Keep the validator the client sent when it holds the encoded representation
+        if etag and request.if_none_match.contains(encoded_etag(etag, encoding)):
+            response.set_etag(encoded_etag(etag, encoding))
+        return response
+    if response.status_code != 200:
+        return response
+
+    data = response.get_data()
+    if len(data) < config['COMPRESSION_MIN_SIZE']:
+        return response
+
+    level = config['COMPRESSION_BROTLI_QUALITY'] if encoding == 'br' else config['COMPRESSION_LEVEL']
+    if etag and not weak:
+        cache = current_app.extensions['compression_cache']
+        key = (encoded_etag(etag, encoding), level)
+        body = cache.get(key)
+        if body is None:
+            body = compress(data, encoding, level)
+            cache.set(key, body)
+        response.set_etag(encoded_etag(etag, encoding))
+    else:
+        body = compress(data, encoding, level)
+
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+def init_compression(app):
+    """Register response compression and the compressed-body cache on the app"""
+    app.extensions['compression_cache'] = LRUCache(maxsize=app.config['COMPRESSION_CACHE_SIZE'])
+    app.after_request(compress_response)
@@ -0,0 +1,64 @@
+import logging
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+# Pragmas read back by the startup self-check, in reporting order
+CHECKED_PRAGMAS = [
+    'journal_mode', 'synchronous', 'busy_timeout', 'cache_size',
+    'mmap_size', 'temp_store', 'foreign_keys'
+]
+
+def is_file_database(uri):
+    """True when the SQLite URI points at a file rather than an in-memory database"""
+    url = make_url(uri)
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+def apply_engine_options(app):
+    """Merge the selected profile's pool settings into SQLALCHEMY_ENGINE_OPTIONS.
+
+    Must run before db.init_app, which reads the options when it builds the engine.
+    Pool settings only apply to file databases; in-memory databases keep
+    SQLAlchemy's single-connection pool.
+    """
+    profile = app.config['SQLITE_PROFILES'][app.config['SQLITE_PROFILE']]
+    if not is_file_database(app.config['SQLALCHEMY_DATABASE_URI']):
+        return
+    options = dict(profile.get('engine_options', {}))
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+def install_pragmas(app, engine):
+    """Set the selected profile's pragmas on every new DBAPI connection"""
+    pragmas = app.config['SQLITE_PROFILES'][app.config['SQLITE_PROFILE']].get('pragmas', {})
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def effective_pragmas(engine):
+    """Read back the pragmas a pooled connection actually runs with"""
+    with engine.connect() as connection:
+        return {
+            name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in CHECKED_PRAGMAS
+        }
+
+def check_engine_profile(app, engine):
+    """Log the effective pragmas and warn when WAL could not be enabled"""
+    profile_name = app.config['SQLITE_PROFILE']
+    effective = effective_pragmas(engine)
+    logger.info("SQLite profile %r: %s", profile_name,
+                ", ".join(f"{name}={value}" for name, value in effective.items()))
+
+    wanted = app.config['SQLITE_PROFILES'][profile_name].get('pragmas', {}).get('journal_mode')
+    if wanted and str(effective['journal_mode']).lower() != wanted.lower():
+        logger.warning("SQLite journal_mode is %s, not %s; concurrent reads will block on writes",
+                       effective['journal_mode'], wanted)
+    return effective
@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+from datetime import datetime, UTC
+from sqlalchemy import select
+from app.extensions import db
+from app.models import Word, Group, StudyActivity, StudySession, WordReviewItem
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+EXPORT_COLUMNS = [
+    WordReviewItem.id.label('review_id'),
+    WordReviewItem.created_at.label('reviewed_at'),
+    WordReviewItem.is_correct,
+    WordReviewItem.word_id,
+    Word.nepali_word,
+    Word.romanized_nepali_word,
+    Word.english_word,
+    WordReviewItem.group_id,
+    Group.name.label('group_name'),
+    WordReviewItem.session_id,
+    StudyActivity.name.label('activity_name'),
+    StudySession.started_at.label('session_started_at')
+]
+
+def parse_export_bound(value, name):
+    """Parse a since/until bound (ISO date or datetime) into naive UTC"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError(f"{name} must be an ISO 8601 date or datetime")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+def review_export_query(since=None, until=None):
+    """Reviews joined with their word, group, session and activity, oldest first.
+
+    Ordering and the since/until range both go through the created_at index,
+    so a bounded export reads only the rows it returns.
+    """
+    query = (
+        select(*EXPORT_COLUMNS)
+        .join(Word, Word.id == WordReviewItem.word_id)
+        .outerjoin(Group, Group.id == WordReviewItem.group_id)
+        .outerjoin(StudySession, StudySession.id == WordReviewItem.session_id)
+        .outerjoin(StudyActivity, StudyActivity.id == StudySession.study_activity_id)
+        .order_by(WordReviewItem.created_at, WordReviewItem.id)
+    )
+    if since is not None:
+        query = query.where(WordReviewItem.created_at >= since)
+    if until is not None:
+        query = query.where(WordReviewItem.created_at < until)
+    return query
+
+def iter_review_chunks(since=None, until=None, chunk_size=1000):
+    """Yield lists of export rows from a streaming cursor, chunk_size rows at a time"""
+    with db.engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=chunk_size).execute(
+            review_export_query(since, until)
+        )
+        for partition in result.mappings().partitions(chunk_size):
+            yield partition
+
+def _serialize(value):
+    if isinstance(value, datetime):
+        return value.isoformat() + "Z"
+    return value
+
+def iter_ndjson(chunks):
+    """One JSON object per line, one string per chunk"""
+    for rows in chunks:
+        yield ''.join(
+            json.dumps({key: _serialize(value) for key, value in row.items()}, ensure_ascii=False) + '\n'
+            for row in rows
+        )
+
+def iter_csv(chunks):
+    """A header line followed by one CSV string per chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column.key for column in EXPORT_COLUMNS])
+    yield buffer.getvalue()
+    for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_serialize(value) for value in row.values()] for row in rows)
+        yield buffer.getvalue()
+
+def export_reviews(export_format='ndjson', since=None, until=None, chunk_size=1000):
+    """Generate the review history as NDJSON or CSV text, chunk by chunk"""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    chunks = iter_review_chunks(since, until, chunk_size)
+    return iter_ndjson(chunks) if export_format == 'ndjson' else iter_csv(chunks)
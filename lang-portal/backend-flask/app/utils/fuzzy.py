@@ -0,0 +1,296 @@
+import re
+import threading
+from collections import Counter, defaultdict
+from flask import current_app, has_app_context
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+from app.extensions import db
+from app.models import Word
+
+# Spelling variants learners use interchangeably when romanizing Nepali,
+# folded before indexing so e.g. "dhanyavaad" and "dhanyabad" share a key.
+_PHONETIC_FOLDS = [
+    (re.compile(r'[^a-z]'), ''),
+    (re.compile(r'chh'), 'ch'),
+    (re.compile(r'[vw]'), 'b'),
+    (re.compile(r'ph'), 'f'),
+    (re.compile(r'sh'), 's'),
+    (re.compile(r'z'), 'j'),
+    (re.compile(r'ee'), 'i'),
+    (re.compile(r'oo'), 'u'),
+    (re.compile(r'(.)\1+'), r'\1'),  # aa -> a, tt -> t, ...
+]
+
+def normalize_romanized(text):
+    """Fold a romanized Nepali spelling to its phonetic key"""
+    key = (text or '').lower()
+    for pattern, replacement in _PHONETIC_FOLDS:
+        key = pattern.sub(replacement, key)
+    return key
+
+def trigrams(key):
+    """Padded trigrams of a key; a key of length n has n + 2 of them"""
+    padded = f"  {key} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+def pattern_masks(a):
+    """Per-character bitmasks of the positions each character holds in a"""
+    masks = {}
+    for i, char in enumerate(a):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+def _bit_parallel_distance(masks, length, b):
+    # Myers/Hyyrö bit-parallel edit distance: one column of the DP matrix per
+    # character of b, held as vertical +1/-1 delta bit vectors.
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    pv, mv, score = full, 0, length
+    for char in b:
+        eq = masks.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+def levenshtein(a, b, max_distance, masks=None):
+    """Edit distance between a and b, or max_distance + 1 once it is exceeded.
+
+    Pass ``masks=pattern_masks(a)`` when comparing one a against many b.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if not a:
+        return len(b)
+    distance = _bit_parallel_distance(masks or pattern_masks(a), len(a), b)
+    return min(distance, max_distance + 1)
+
+def default_max_distance(key):
+    """Edits tolerated for a query key: fewer for short keys to keep results meaningful"""
+    return 1 if len(key) <= 5 else 2
+
+
+class TrigramIndex:
+    """In-memory trigram inverted index over normalized romanized words.
+
+    Postings are bucketed by key length, so a lookup only touches keys whose
+    length is within max_distance of the query. Candidates must pass the
+    q-gram count filter (a key within k edits still holds all but at most 3k
+    of the query's distinct trigrams); by the prefix filter such a key appears
+    in at least one of the query's rarest ``len(grams) - required + 1``
+    posting lists, so only those are scanned and the rest are probed per
+    candidate. Survivors are verified with a bit-parallel Levenshtein, one
+    edit tier at a time so typical lookups stop before the loose k=2 filter.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.max_id = 0
+        self.pending = []                  # ids updated/deleted by committed ORM flushes
+        self._keys = {}                    # word id -> key
+        self._ids = {}                     # key -> word ids
+        self._gram_counts = {}             # key -> distinct trigrams
+        self._lengths = defaultdict(set)   # key length -> keys
+        self._postings = defaultdict(dict)  # trigram -> key length -> keys
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _index_key(self, key):
+        length = len(key)
+        grams = set(trigrams(key))
+        self._gram_counts[key] = len(grams)
+        self._lengths[length].add(key)
+        for gram in grams:
+            self._postings[gram].setdefault(length, set()).add(key)
+
+    def add(self, word_id, romanized):
+        with self._lock:
+            self.remove(word_id)
+            key = normalize_romanized(romanized)
+            self._keys[word_id] = key
+            self.max_id = max(self.max_id, word_id)
+            if not key:
+                return
+            if key not in self._ids:
+                self._ids[key] = set()
+                self._index_key(key)
+            self._ids[key].add(word_id)
+
+    def remove(self, word_id):
+        with self._lock:
+            key = self._keys.pop(word_id, None)
+            if not key:
+                return
+            self._ids[key].discard(word_id)
+            if self._ids[key]:
+                return
+            del self._ids[key]
+            del self._gram_counts[key]
+            length = len(key)
+            self._lengths[length].discard(key)
+            for gram in set(trigrams(key)):
+                bucket = self._postings[gram][length]
+                bucket.discard(key)
+                if not bucket:
+                    del self._postings[gram][length]
+                    if not self._postings[gram]:
+                        del self._postings[gram]
+
+    def rebuild(self, rows, version=None):
+        """Replace the contents with (id, romanized) rows"""
+        with self._lock:
+            self._keys = {word_id: normalize_romanized(romanized) for word_id, romanized in rows}
+            self._ids = {}
+            self._gram_counts = {}
+            self._lengths = defaultdict(set)
+            self._postings = defaultdict(dict)
+            for word_id, key in self._keys.items():
+                if not key:
+                    continue
+                if key not in self._ids:
+                    self._ids[key] = set()
+                    self._index_key(key)
+                self._ids[key].add(word_id)
+            self.max_id = max(self._keys, default=0)
+            self.pending = []
+            self.version = version
+
+    def _candidates(self, key, grams, max_distance):
+        lengths = range(max(1, len(key) - max_distance), len(key) + max_distance + 1)
+        # Each edit breaks at most three trigrams, so a key within max_distance
+        # edits still contains at least this many of the query's distinct trigrams.
+        required = len(grams) - 3 * max_distance
+        if required < 1:
+            return [candidate for length in lengths for candidate in self._lengths.get(length, ())]
+
+        lists = sorted(
+            ([self._postings.get(gram, {}).get(length, ()) for length in lengths] for gram in grams),
+            key=lambda buckets: sum(map(len, buckets))
+        )
+        prefix = len(lists) - required + 1
+        shared = Counter()
+        for buckets in lists[:prefix]:
+            for bucket in buckets:
+                shared.update(bucket)
+        rest = lists[prefix:]
+        candidates = []
+        for candidate, count in shared.items():
+            # The bound holds from the candidate's side too
+            needed = max(required, self._gram_counts[candidate] - 3 * max_distance)
+            slot = len(candidate) - lengths.start
+            for buckets in rest:
+                if count >= needed:
+                    break
+                count += candidate in buckets[slot]
+            if count >= needed:
+                candidates.append(candidate)
+        return candidates
+
+    def search(self, query, limit=5, max_distance=None):
+        """Return up to limit (word_id, distance) pairs, closest first"""
+        key = normalize_romanized(query)
+        if not key:
+            return []
+        if max_distance is None:
+            max_distance = default_max_distance(key)
+
+        grams = set(trigrams(key))
+        masks = pattern_masks(key)
+        with self._lock:
+            # Widen the distance one edit at a time: once a tier holds limit
+            # words, wider tiers could only add results that rank after them.
+            for distance in range(max_distance + 1):
+                scored = []
+                for candidate in self._candidates(key, grams, distance):
+                    found = levenshtein(key, candidate, distance, masks)
+                    if found <= distance:
+                        scored.append((found, candidate))
+                if sum(len(self._ids[candidate]) for _, candidate in scored) >= limit:
+                    break
+            scored.sort()
+
+            results = []
+            for distance, candidate in scored:
+                for word_id in sorted(self._ids[candidate]):
+                    results.append((word_id, distance))
+                    if len(results) == limit:
+                        return results
+            return results
+
+
+def _word_rows(*criteria):
+    return db.session.execute(select(Word.id, Word.romanized_nepali_word).where(*criteria)).all()
+
+def get_fuzzy_index():
+    """The app's fuzzy index, brought up to date with the words table.
+
+    The words data version is bumped by a trigger once per written row, so
+    the version delta since the last sync says exactly how many row writes
+    the index has to account for. Writes it can explain are applied
+    incrementally: inserts are the rows above ``max_id``, ORM updates and
+    deletes arrive through ``pending`` once their transaction commits. Any
+    shortfall (raw SQL, other processes) triggers a full rebuild.
+    """
+    from app.utils.http_cache import get_data_versions
+
+    index = current_app.extensions.setdefault('fuzzy_index', TrigramIndex())
+    version = get_data_versions(['words'])['words'][0]
+    if index.version == version:
+        return index
+
+    with index._lock:
+        if index.version == version:
+            return index
+        if index.version is None or version < index.version:
+            index.rebuild(_word_rows(), version)
+            return index
+
+        pending, index.pending = index.pending, []
+        max_id = index.max_id
+        rows = _word_rows(Word.id.in_(set(pending)) | (Word.id > max_id))
+        explained = len(pending) + sum(1 for word_id, _ in rows if word_id > max_id)
+        if explained != version - index.version:
+            index.rebuild(_word_rows(), version)
+            return index
+
+        for word_id in set(pending) - {word_id for word_id, _ in rows}:
+            index.remove(word_id)
+        for word_id, romanized in rows:
+            index.add(word_id, romanized)
+        index.version = version
+    return index
+
+# Updated and deleted ids are held on the session until its transaction
+# commits; handing them over at flush time would let a concurrent sync drain
+# them while the rows it reads still hold the old values.
+def _record_write(mapper, connection, target):
+    session = object_session(target)
+    if session is not None and (target in session.deleted or session.is_modified(target, include_collections=False)):
+        session.info.setdefault('fuzzy_pending', []).append(target.id)
+
+def _deliver_writes(session):
+    pending = session.info.pop('fuzzy_pending', None)
+    if pending and has_app_context():
+        index = current_app.extensions.get('fuzzy_index')
+        if index is not None:
+            with index._lock:
+                index.pending.extend(pending)
+
+def _discard_writes(session):
+    session.info.pop('fuzzy_pending', None)
+
+event.listen(Word, 'after_update', _record_write)
+event.listen(Word, 'after_delete', _record_write)
+event.listen(Session, 'after_commit', _deliver_writes)
+event.listen(Session, 'after_rollback', _discard_writes)
@@ -0,0 +1,73 @@
+import hashlib
+from datetime import datetime, timedelta, UTC
+from functools import wraps
+from flask import request, make_response
+from sqlalchemy import select
+from app.extensions import db
+from app.models.data_version import DataVersion
+from app.utils.compression import etag_variants
+
+def get_data_versions(tables):
+    """Read the change counters and last write times for tables in one query"""
+    rows = db.session.execute(
+        select(DataVersion.table_name, DataVersion.version, DataVersion.updated_at)
+        .where(DataVersion.table_name.in_(tables))
+        .order_by(DataVersion.table_name)
+    ).all()
+    return {name: (version, updated_at) for name, version, updated_at in rows}
+
+def compute_etag(tables):
+    """Build the ETag and Last-Modified for the current request from table versions"""
+    versions = get_data_versions(tables)
+    args = '&'.join(f"{key}={value}" for key, value in sorted(request.args.items(multi=True)))
+    fingerprint = '|'.join(
+        [request.path, args] + [f"{name}:{versions[name][0]}" for name in sorted(versions)]
+    )
+    etag = hashlib.sha1(fingerprint.encode()).hexdigest()
+    last_modified = max((updated_at for _, updated_at in versions.values()), default=None)
+    return etag, last_modified
+
+def conditional_get(*tables):
+    """Answer conditional GETs from the data versions of the tables a view reads.
+
+    Emits an ETag and Last-Modified on 200 responses and returns 304 Not
+    Modified without calling the view when If-None-Match (or, without it,
+    If-Modified-Since) shows the client already has the current data, in any
+    content coding. The envelope timestamp is not part of the validator;
+    only the data is.
+
+    ``updated_at`` only has one-second resolution, so while its second is
+    still running a later write can share it. Last-Modified is held back to
+    the previous second until then; a client revalidating with it gets the
+    full response rather than a stale 304.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            etag, last_modified = compute_etag(tables)
+
+            if request.if_none_match:
+                # A client holding a compressed copy sends its encoded ETag
+                not_modified = any(request.if_none_match.contains(tag) for tag in etag_variants(etag))
+            else:
+                not_modified = (
+                    request.if_modified_since is not None
+                    and last_modified is not None
+                    and last_modified.replace(microsecond=0) <= request.if_modified_since.replace(tzinfo=None)
+                )
+
+            if not_modified:
+                response = make_response('', 304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if last_modified is not None:
+                settled = datetime.now(UTC).replace(tzinfo=None, microsecond=0) - timedelta(seconds=1)
+                response.last_modified = min(last_modified.replace(microsecond=0), settled)
+            response.cache_control.no_cache = True
+            return response
+        return decorated_function
+    return decorator
@@ -0,0 +1,72 @@
+import dataclasses
+import decimal
+import uuid
+from datetime import date, datetime
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+def _default(o):
+    """Types beyond plain JSON, rendered exactly as orjson renders them"""
+    if isinstance(o, datetime):
+        # Naive datetimes are UTC throughout the app
+        if o.tzinfo is None:
+            return o.isoformat() + "Z"
+        text = o.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(o, date):
+        return o.isoformat()
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes compact responses with orjson when available.
+
+    For the app's payload types both paths emit the same bytes: sorted keys,
+    compact separators, UTF-8 text rather than \\u escapes, and datetimes as
+    ISO 8601 with a "Z" suffix (naive values are taken as UTC). They differ on
+    floats written with an exponent (orjson ``1e16``/``1e-7``, stdlib
+    ``1e+16``/``1e-07``) and on NaN/Infinity (orjson ``null``, stdlib the
+    non-standard ``NaN``). Integers beyond 64 bits, which orjson rejects, fall
+    back to the stdlib encoder. Pretty-printed debug responses always use the
+    stdlib encoder.
+    """
+
+    ensure_ascii = False
+    default = staticmethod(_default)
+
+    ORJSON_OPTIONS = (
+        (orjson.OPT_SORT_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+         | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE) if orjson else 0
+    )
+
+    def __init__(self, app, use_orjson=True):
+        super().__init__(app)
+        self.use_orjson = use_orjson and orjson is not None
+
+    def response(self, *args, **kwargs):
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        if not self.use_orjson or pretty:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, default=_default, option=self.ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+def init_json_provider(app):
+    """Install the JSON provider selected by JSON_SERIALIZER ('auto', 'orjson' or 'stdlib')"""
+    choice = app.config['JSON_SERIALIZER']
+    if choice == 'orjson' and orjson is None:
+        raise RuntimeError("JSON_SERIALIZER is 'orjson' but orjson is not installed")
+    app.json = FastJSONProvider(app, use_orjson=choice != 'stdlib')
@@ -0,0 +1,143 @@
+import os
+import re
+from sqlalchemy import text
+from app.extensions import db
+from app.models.word_schedule import SCHEDULE_REPLAY
+
+def rebuild_group_word_counts():
+    """Recompute groups.words_count from words_groups.
+
+    Returns the number of groups whose stored count had drifted.
+    """
+    drifted = db.session.execute(text("""
+        SELECT COUNT(*) FROM groups
+        WHERE words_count != (
+            SELECT COUNT(*) FROM words_groups WHERE words_groups.group_id = groups.id
+        )
+    """)).scalar()
+
+    db.session.execute(text("""
+        UPDATE groups SET words_count = (
+            SELECT COUNT(*) FROM words_groups WHERE words_groups.group_id = groups.id
+        )
+    """))
+    db.session.commit()
+    return drifted
+
+ROLLUP_SOURCES = {
+    'total_words': "SELECT COUNT(*) FROM words",
+    'total_groups': "SELECT COUNT(*) FROM groups",
+    'total_activities': "SELECT COUNT(*) FROM study_activities",
+    'total_sessions': "SELECT COUNT(*) FROM study_sessions",
+    'completed_sessions': "SELECT COUNT(*) FROM study_sessions WHERE ended_at IS NOT NULL",
+    'total_reviews': "SELECT COUNT(*) FROM word_review_items",
+    'correct_reviews': "SELECT COUNT(*) FROM word_review_items WHERE is_correct",
+    'words_reviewed': "SELECT COUNT(DISTINCT word_id) FROM word_review_items"
+}
+
+WORD_REVIEW_STATS_SOURCE = """
+    SELECT word_id, COUNT(*), SUM(is_correct) FROM word_review_items GROUP BY word_id
+"""
+
+DAILY_ACTIVITY_SOURCE = """
+    SELECT day, SUM(reviews), SUM(correct), SUM(sessions) FROM (
+        SELECT date(created_at) AS day, COUNT(*) AS reviews, SUM(is_correct) AS correct, 0 AS sessions
+        FROM word_review_items GROUP BY day
+        UNION ALL
+        SELECT date(started_at), 0, 0, COUNT(*) FROM study_sessions GROUP BY 1
+    ) GROUP BY day
+"""
+
+def _count_mismatched_rows(source, table_columns):
+    """Count rows present on only one side of a rebuilt source and its rollup table"""
+    return db.session.execute(text(f"""
+        SELECT
+            (SELECT COUNT(*) FROM (SELECT * FROM ({source}) EXCEPT SELECT {table_columns}))
+          + (SELECT COUNT(*) FROM (SELECT {table_columns} EXCEPT SELECT * FROM ({source})))
+    """)).scalar()
+
+def verify_rollups(repair=False):
+    """Rebuild the dashboard rollups from scratch and compare them with the stored ones.
+
+    Returns a dict of drifted dashboard_stats columns mapped to their stored
+    and actual values, plus the number of out-of-date word_review_stats and
+    daily_activity rows under their table names. With repair=True the rollups
+    are overwritten with the rebuilt values.
+    """
+    from app.utils.statistics import get_rollup
+
+    stored = get_rollup()
+    drift = {}
+    for column, query in ROLLUP_SOURCES.items():
+        actual = db.session.execute(text(query)).scalar() or 0
+        if stored[column] != actual:
+            drift[column] = {'stored': stored[column], 'actual': actual}
+
+    stale_words = _count_mismatched_rows(
+        WORD_REVIEW_STATS_SOURCE, "word_id, review_count, correct_count FROM word_review_stats"
+    )
+    if stale_words:
+        drift['word_review_stats'] = stale_words
+
+    stale_days = _count_mismatched_rows(
+        DAILY_ACTIVITY_SOURCE, "day, review_count, correct_count, session_count FROM daily_activity"
+    )
+    if stale_days:
+        drift['daily_activity'] = stale_days
+
+    if repair:
+        columns = ', '.join(ROLLUP_SOURCES)
+        values = ', '.join(f"({query})" for query in ROLLUP_SOURCES.values())
+        db.session.execute(text(
+            f"INSERT OR REPLACE INTO dashboard_stats (id, {columns}) VALUES (1, {values})"
+        ))
+        db.session.execute(text("DELETE FROM word_review_stats"))
+        db.session.execute(text(
+            f"INSERT INTO word_review_stats (word_id, review_count, correct_count) {WORD_REVIEW_STATS_SOURCE}"
+        ))
+        db.session.execute(text("DELETE FROM daily_activity"))
+        db.session.execute(text(
+            f"INSERT INTO daily_activity (day, review_count, correct_count, session_count) {DAILY_ACTIVITY_SOURCE}"
+        ))
+        db.session.commit()
+
+    return drift
+
+def rebuild_word_schedules():
+    """Recompute every word's spaced-repetition state by replaying review history.
+
+    Needed after reviews are deleted or edited, which the scheduling trigger
+    does not undo. Returns the number of schedules rebuilt.
+    """
+    db.session.execute(text("DELETE FROM word_schedules"))
+    db.session.execute(text(SCHEDULE_REPLAY))
+    db.session.commit()
+    return db.session.execute(text("SELECT COUNT(*) FROM word_schedules")).scalar()
+
+_ADD_COLUMN = re.compile(r"ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+(\w+)[^;]*;", re.IGNORECASE)
+
+def run_migrations(connection, migrations_dir):
+    """Apply the SQL files in migrations_dir not yet recorded in schema_migrations.
+
+    ``connection`` is a sqlite3 connection. A database built with create_all
+    already has every column, so ``ALTER TABLE ... ADD COLUMN`` statements for
+    columns that exist are skipped rather than failing the migration. Returns
+    the filenames applied.
+    """
+    connection.execute("CREATE TABLE IF NOT EXISTS schema_migrations (filename TEXT PRIMARY KEY)")
+    applied = {row[0] for row in connection.execute("SELECT filename FROM schema_migrations")}
+
+    def add_missing_column(match):
+        table, column = match.groups()
+        columns = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+        return '' if column in columns else match.group(0)
+
+    ran = []
+    for filename in sorted(os.listdir(migrations_dir)):
+        if filename.endswith('.sql') and filename not in applied:
+            with open(os.path.join(migrations_dir, filename)) as f:
+                connection.executescript(_ADD_COLUMN.sub(add_missing_column, f.read()))
+            connection.execute("INSERT INTO schema_migrations (filename) VALUES (?)", (filename,))
+            connection.commit()
+            ran.append(filename)
+    return ran
@@ -0,0 +1,361 @@
+import atexit
+import bisect
+import glob
+import json
+import os
+import threading
+import time
+import uuid
+from flask import current_app, request
+from app.extensions import db
+
+# Latency buckets in seconds, upper bounds (+Inf is implicit)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+class Metric:
+    """Base for metrics keyed by a tuple of label values"""
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        with self._lock:
+            return {labels: (list(value) if isinstance(value, list) else value)
+                    for labels, value in self.values.items()}
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    """A gauge; in multi-process mode the live processes' values are summed"""
+    kind = 'gauge'
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def dec(self, labels=(), amount=1):
+        self.inc(labels, -amount)
+
+
+class Histogram(Metric):
+    """Bucketed observations; values are [per-bucket counts..., +Inf count, sum]"""
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, labels, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self.values.get(labels)
+            if counts is None:
+                counts = self.values[labels] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+
+class MetricsRegistry:
+    """The app's metrics, with optional aggregation across worker processes.
+
+    Without a multiprocess directory the registry reports this process only.
+    With one, every process writes its values to
+    ``<dir>/metrics_<pid>_<token>.json`` at most once per flush interval (and
+    at exit), and a scrape sums all the files. The token is drawn per process,
+    so a worker that inherits a recycled pid never overwrites the counters of
+    the one that exited; on its first flush it renames that worker's files to
+    ``metrics_<pid>_<token>.exited.json``. Counters and histograms of exited
+    workers are kept, so totals never go backwards; gauges only count workers
+    that are still running. A scrape can trail other workers by up to one
+    flush interval.
+    """
+
+    def __init__(self, multiprocess_dir=None, flush_interval=1.0):
+        self.metrics = []
+        self.collectors = []
+        self.multiprocess_dir = multiprocess_dir
+        self.flush_interval = flush_interval
+        self._next_flush = 0.0
+        self._flush_lock = threading.Lock()
+        self._path = None
+        self._path_pid = None
+        self._flushed = {}
+        if multiprocess_dir:
+            os.makedirs(multiprocess_dir, exist_ok=True)
+            atexit.register(self._flush_at_exit)
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector):
+        """Register a callable returning {name: (kind, help, value)} for values read at collection"""
+        self.collectors.append(collector)
+
+    def collect(self):
+        """This process's values: {name: {'kind', 'help', 'labelnames', 'buckets', 'values'}}"""
+        families = {}
+        for metric in self.metrics:
+            families[metric.name] = {
+                'kind': metric.kind,
+                'help': metric.documentation,
+                'labelnames': list(metric.labelnames),
+                'buckets': list(getattr(metric, 'buckets', ())),
+                'values': [[list(labels), value] for labels, value in metric.snapshot().items()]
+            }
+        for collector in self.collectors:
+            for name, (kind, documentation, value) in collector().items():
+                families[name] = {'kind': kind, 'help': documentation, 'labelnames': [],
+                                  'buckets': [], 'values': [[[], value]]}
+        return families
+
+    def maybe_flush(self):
+        """Write this process's file if the flush interval has passed; cheap otherwise"""
+        if self.multiprocess_dir and time.monotonic() >= self._next_flush:
+            self.flush()
+
+    @property
+    def path(self):
+        """This process's metrics file, claimed on first use (again after a fork)"""
+        pid = os.getpid()
+        if self._path_pid != pid:
+            # Files left under our pid belong to an exited process that had it before
+            for stale in glob.glob(os.path.join(self.multiprocess_dir, f'metrics_{pid}_*.json')):
+                if not stale.endswith('.exited.json'):
+                    os.replace(stale, f"{stale[:-len('.json')]}.exited.json")
+            self._path = os.path.join(self.multiprocess_dir, f"metrics_{pid}_{uuid.uuid4().hex[:12]}.json")
+            self._path_pid = pid
+        return self._path
+
+    def flush(self):
+        with self._flush_lock:
+            self._next_flush = time.monotonic() + self.flush_interval
+            path = self.path
+            temporary = f"{path}.tmp"
+            families = self.collect()
+            with open(temporary, 'w') as f:
+                json.dump(families, f)
+            os.replace(temporary, path)
+            self._flushed = families
+
+    def flushed_value(self, metric, labels=()):
+        """The value this process's file last recorded for a metric, or None"""
+        for flushed_labels, value in self._flushed.get(metric.name, {}).get('values', ()):
+            if tuple(flushed_labels) == labels:
+                return value
+        return None
+
+    def _flush_at_exit(self):
+        try:
+            self.flush()
+        except OSError:
+            pass  # the directory is gone; nothing left to report to
+
+    def gather(self):
+        """Families summed over every process that reported (just this one when single-process)"""
+        if not self.multiprocess_dir:
+            return self.collect()
+        self.flush()
+        merged = {}
+        own = self.path
+        for path in sorted(glob.glob(os.path.join(self.multiprocess_dir, 'metrics_*.json'))):
+            name = os.path.basename(path)[len('metrics_'):-len('.json')]
+            pid = int(name.split('_')[0])
+            try:
+                with open(path) as f:
+                    families = json.load(f)
+            except (OSError, ValueError):
+                continue  # being replaced right now; its next flush will be picked up
+            alive = path == own or (not name.endswith('.exited') and _process_alive(pid))
+            for name, family in families.items():
+                if family['kind'] == 'gauge' and not alive:
+                    continue
+                target = merged.setdefault(name, {**family, 'values': []})
+                target['values'] = _merge_values(target['values'], family['values'])
+        return merged
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        for name, family in sorted(self.gather().items()):
+            lines.append(f"# HELP {name} {family['help']}")
+            lines.append(f"# TYPE {name} {family['kind']}")
+            labelnames = family['labelnames']
+            for labels, value in sorted(family['values'], key=lambda item: item[0]):
+                if family['kind'] == 'histogram':
+                    cumulative = 0
+                    bounds = [_format_value(bound) for bound in family['buckets']] + ['+Inf']
+                    for bound, count in zip(bounds, value[:-1]):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_labels(labelnames, labels, le=bound)} {cumulative}")
+                    lines.append(f"{name}_sum{_labels(labelnames, labels)} {_format_value(value[-1])}")
+                    lines.append(f"{name}_count{_labels(labelnames, labels)} {cumulative}")
+                else:
+                    lines.append(f"{name}{_labels(labelnames, labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _merge_values(into, values):
+    merged = {tuple(labels): value for labels, value in into}
+    for labels, value in values:
+        labels = tuple(labels)
+        if labels not in merged:
+            merged[labels] = value
+        elif isinstance(value, list):
+            merged[labels] = [a + b for a, b in zip(merged[labels], value)]
+        else:
+            merged[labels] += value
+    return [[list(labels), value] for labels, value in merged.items()]
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(names, values, **extra):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs += [f'{name}="{value}"' for name, value in extra.items()]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class AppMetrics:
+    """The metrics the API records, held in app.extensions['metrics']"""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.requests = registry.register(Counter(
+            'http_requests_total', 'HTTP requests by route template, method and status',
+            ('method', 'route', 'status')))
+        self.latency = registry.register(Histogram(
+            'http_request_duration_seconds', 'Time to produce a response, by route template and method',
+            ('method', 'route')))
+        self.in_flight = registry.register(Gauge(
+            'http_requests_in_flight', 'Requests currently being handled'))
+        self.pool_wait = registry.register(Histogram(
+            'db_pool_checkout_wait_seconds', 'Time spent waiting for a pooled database connection',
+            buckets=POOL_WAIT_BUCKETS))
+        self.reviews = registry.register(Counter(
+            'word_reviews_inserted_total', 'Word review items recorded'))
+
+
+def instrument_pool(engine, histogram):
+    """Time how long checkouts wait on the engine's pool.
+
+    SQLAlchemy has no event before a checkout starts waiting, so this wraps
+    the pool's internal _do_get; pools without it are left alone.
+    """
+    pool = engine.pool
+    do_get = getattr(pool, '_do_get', None)
+    if do_get is None:
+        return
+
+    def timed_do_get():
+        started = time.perf_counter()
+        try:
+            return do_get()
+        finally:
+            histogram.observe((), time.perf_counter() - started)
+
+    pool._do_get = timed_do_get
+
+def _cache_collector(app):
+    def collect():
+        families = {}
+        for name, cache in (('response_cache', app.extensions.get('response_cache')),
+                            ('compression_cache', app.extensions.get('compression_cache'))):
+            if cache is None:
+                continue
+            stats = cache.stats()
+            families[f'{name}_hits_total'] = ('counter', f'{name} lookups served from the cache', stats['hits'])
+            families[f'{name}_misses_total'] = ('counter', f'{name} lookups that missed', stats['misses'])
+            families[f'{name}_entries'] = ('gauge', f'Entries held in {name}', stats['size'])
+        return families
+    return collect
+
+def record_reviews(count):
+    """Count review items a write endpoint just committed"""
+    metrics = current_app.extensions.get('metrics')
+    if metrics is not None:
+        metrics.reviews.inc((), count)
+
+def init_metrics(app):
+    """Record request, pool, cache and review metrics and serve them at /metrics.
+
+    Call before other after_request hooks are registered: Flask runs them in
+    reverse order, so request latency then includes their work (compression).
+    """
+    if not app.config['METRICS_ENABLED']:
+        return
+    registry = MetricsRegistry(app.config['METRICS_MULTIPROC_DIR'], app.config['METRICS_FLUSH_INTERVAL'])
+    metrics = app.extensions['metrics'] = AppMetrics(registry)
+    registry.add_collector(_cache_collector(app))
+    with app.app_context():
+        instrument_pool(db.engine, metrics.pool_wait)
+
+    # Runs on every request, so it stays to one Flask hook (each costs a
+    # coroutine check) plus a WSGI wrapper, and one request proxy lookup.
+    def route_of(req):
+        return req.url_rule.rule if req.url_rule is not None else '<unmatched>'
+
+    @app.after_request
+    def record_request(response):
+        req = request._get_current_object()
+        started = req.environ.pop('metrics.started', None)
+        if started is not None:
+            labels = (req.method, route_of(req))
+            metrics.latency.observe(labels, time.perf_counter() - started)
+            metrics.requests.inc(labels + (str(response.status_code),))
+        return response
+
+    wsgi_app = app.wsgi_app
+
+    def measured_wsgi_app(environ, start_response):
+        environ['metrics.started'] = time.perf_counter()
+        metrics.in_flight.inc()
+        registry.maybe_flush()
+        try:
+            return wsgi_app(environ, start_response)
+        finally:
+            if environ.pop('metrics.started', None) is not None:
+                # An exception propagated past Flask's error handling
+                try:
+                    rule, _ = app.url_map.bind_to_environ(environ).match(return_rule=True)
+                    route = rule.rule
+                except Exception:
+                    route = '<unmatched>'
+                metrics.requests.inc((environ['REQUEST_METHOD'], route, '500'))
+            metrics.in_flight.dec()
+            if not metrics.in_flight.values.get(()) and registry.flushed_value(metrics.in_flight):
+                # Going idle: don't leave requests the last flush saw in flight in the file
+                registry.flush()
+            else:
+                registry.maybe_flush()
+
+    app.wsgi_app = measured_wsgi_app
+
+    @app.route('/metrics')
+    def metrics_endpoint():
+        return app.response_class(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,76 @@
+import base64
+import json
+from typing import Any, List, Optional
+from sqlalchemy import Select
+from app.extensions import db
+
+def encode_cursor(after: Any) -> str:
+    """Encode the last sort key of a page as an opaque cursor token"""
+    payload = json.dumps({"after": after}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+def decode_cursor(token: str) -> dict:
+    """Decode a cursor token; an empty token starts from the first page"""
+    if not token:
+        return {"after": None}
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        cursor = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(cursor, dict) or not isinstance(cursor.get("after"), int):
+        raise ValueError("Invalid cursor")
+    return cursor
+
+class KeysetPage:
+    """A page fetched with keyset (cursor) pagination"""
+
+    def __init__(self, items: List, per_page: int, next_cursor: Optional[str]):
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+def keyset_paginate(query, column, cursor: dict, per_page: int, key=None) -> KeysetPage:
+    """Fetch the page after the cursor with an index seek instead of OFFSET.
+
+    ``query`` is an ORM query or a Core ``select()`` of rows. ``column`` must
+    be unique and indexed (normally the primary key); ``key`` extracts its
+    value from a fetched item and defaults to ``item.id``. No total count
+    is run.
+    """
+    key = key or (lambda item: item.id)
+    if cursor["after"] is not None:
+        query = query.filter(column > cursor["after"])
+    query = query.order_by(column).limit(per_page + 1)
+    items = db.session.execute(query).all() if isinstance(query, Select) else query.all()
+
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        next_cursor = encode_cursor(key(items[-1]))
+    return KeysetPage(items, per_page, next_cursor)
+
+class OffsetPage:
+    """A page of rows fetched with LIMIT/OFFSET, shaped like a Flask-SQLAlchemy Pagination"""
+
+    def __init__(self, items: List, page: int, per_page: int, total: int):
+        self.items = items
+        self.page = page
+        self.per_page = per_page
+        self.total = total
+
+    @property
+    def pages(self) -> int:
+        return (self.total + self.per_page - 1) // self.per_page if self.total else 0
+
+    @property
+    def has_next(self) -> bool:
+        return self.page < self.pages
+
+    @property
+    def has_prev(self) -> bool:
+        return self.page > 1
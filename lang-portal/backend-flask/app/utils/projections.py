@@ -0,0 +1,140 @@
+import random
+from flask import abort
+from sqlalchemy import select, func, literal, union_all
+from app.extensions import db
+from app.models import Word, Group, StudyActivity, StudySession
+from app.models.group import words_groups
+from app.utils.pagination import OffsetPage
+from app.utils.statistics import get_rollup
+
+# Read-path queries for list endpoints. They select only the columns a page
+# renders and return plain Row tuples, so no ORM entities are built, tracked
+# in the identity map or lazily loaded; totals come from trigger-maintained
+# counters instead of a COUNT(*) over the table.
+
+def word_rows():
+    return select(Word.id, Word.nepali_word, Word.romanized_nepali_word,
+                  Word.english_word, Word.part_of_speech)
+
+def group_word_rows(group_id):
+    return (
+        select(Word.id, Word.nepali_word, Word.romanized_nepali_word, Word.english_word)
+        .join(words_groups, words_groups.c.word_id == Word.id)
+        .where(words_groups.c.group_id == group_id)
+    )
+
+def word_group_rows(word_id):
+    """A word's groups with their stored word totals, off the (word_id, group_id) key"""
+    return (
+        select(Group.id, Group.name, Group.description, Group.words_count.label('total_words'))
+        .join(words_groups, words_groups.c.group_id == Group.id)
+        .where(words_groups.c.word_id == word_id)
+    )
+
+def study_session_rows():
+    return (
+        select(StudySession.id, StudySession.group_id, StudySession.study_activity_id,
+               StudySession.started_at, StudySession.ended_at,
+               Group.name.label('group_name'), StudyActivity.name.label('activity_name'))
+        .outerjoin(Group, Group.id == StudySession.group_id)
+        .outerjoin(StudyActivity, StudyActivity.id == StudySession.study_activity_id)
+    )
+
+def offset_paginate_rows(statement, column, page, per_page, total):
+    """Fetch one LIMIT/OFFSET page of rows ordered by column.
+
+    ``total`` is the row count, or a callable returning it; the callable is
+    skipped when a first page that is not full already gives the total.
+    Like Flask-SQLAlchemy's paginate, a page past the end aborts with 404.
+    """
+    rows = db.session.execute(
+        statement.order_by(column).limit(per_page).offset((page - 1) * per_page)
+    ).all()
+    if not rows and page != 1:
+        abort(404)
+    if callable(total):
+        total = len(rows) if page == 1 and len(rows) < per_page else total()
+    return OffsetPage(rows, page, per_page, total)
+
+def paginate_words(page, per_page):
+    return offset_paginate_rows(word_rows(), Word.id, page, per_page, get_rollup()['total_words'])
+
+def paginate_group_words(group, page, per_page):
+    return offset_paginate_rows(group_word_rows(group.id), words_groups.c.word_id,
+                                page, per_page, group.words_count)
+
+def paginate_word_groups(word_id, page, per_page):
+    def count():
+        return db.session.execute(
+            select(func.count()).select_from(words_groups).where(words_groups.c.word_id == word_id)
+        ).scalar()
+    return offset_paginate_rows(word_group_rows(word_id), words_groups.c.group_id, page, per_page, count)
+
+def paginate_study_sessions(page, per_page):
+    return offset_paginate_rows(study_session_rows(), StudySession.id, page, per_page,
+                                get_rollup()['total_sessions'])
+
+def sample_group_words(group, count):
+    """Up to count words of the group in random order, without sorting the whole group.
+
+    Most picks seek the (group_id, word_id) index to the first member at or
+    after a random id between the group's lowest and highest word id, so the
+    cost depends on count, not on the group's size. Pivots that land in the
+    same gap between ids resolve to the same word. When a wide gap leaves the
+    picks short, one more statement reads the members on either side of a
+    random picked word (at most count each way, straight off the index) and
+    draws the rest from those, so session start stays at a fixed number of
+    statements even though that top-up is only locally random.
+    """
+    if group.words_count <= count * 4:
+        rows = db.session.execute(group_word_rows(group.id)).all()
+        return random.sample(rows, min(count, len(rows)))
+
+    # Separate subqueries: SQLite only reads min() or max() off the index end
+    # when it is the sole aggregate in its SELECT
+    member = words_groups.c.group_id == group.id
+    low, high = db.session.execute(select(
+        select(func.min(words_groups.c.word_id)).where(member).scalar_subquery(),
+        select(func.max(words_groups.c.word_id)).where(member).scalar_subquery()
+    )).one()
+    # Random pivot ids generated by SQLite, so the statement's shape never
+    # changes and its compiled form is reused from SQLAlchemy's cache (the
+    # double modulo keeps the offset non-negative without abs(), which
+    # overflows on the smallest random())
+    span = high - low + 1
+
+    def random_id():
+        return low + (func.random() % span + span) % span
+
+    pivots = select(literal(1).label('n'), random_id().label('pivot')).cte('pivots', recursive=True)
+    pivots = pivots.union_all(select(pivots.c.n + 1, random_id()).where(pivots.c.n < count * 2))
+    pick = (
+        select(words_groups.c.word_id)
+        .where(member, words_groups.c.word_id >= pivots.c.pivot)
+        .order_by(words_groups.c.word_id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    picked = {row.id: row for row in db.session.execute(
+        group_word_rows(group.id).where(Word.id.in_(select(pick).select_from(pivots)))
+    )}
+
+    if len(picked) < count:
+        anchor = random.choice(list(picked))
+        after = (select(words_groups.c.word_id).where(member, words_groups.c.word_id > anchor)
+                 .order_by(words_groups.c.word_id).limit(count).subquery())
+        before = (select(words_groups.c.word_id).where(member, words_groups.c.word_id < anchor)
+                  .order_by(words_groups.c.word_id.desc()).limit(count).subquery())
+        around = union_all(select(after.c.word_id), select(before.c.word_id))
+        neighbours = [row for row in db.session.execute(group_word_rows(group.id).where(Word.id.in_(around)))
+                      if row.id not in picked]
+        for row in random.sample(neighbours, min(count - len(picked), len(neighbours))):
+            picked[row.id] = row
+
+    rows = list(picked.values())
+    random.shuffle(rows)
+    return rows[:count]
+
+def row_dicts(rows):
+    """Serialize rows straight to dicts keyed by their column labels"""
+    return [row._asdict() for row in rows]
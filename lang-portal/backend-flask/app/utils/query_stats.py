@@ -0,0 +1,109 @@
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from flask import g, has_app_context
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+class QueryStats:
+    """Statement count, timings and repeats for one unit of work (normally a request)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.statements = Counter()
+
+    def add(self, statement, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.statements[statement] += 1
+
+    @property
+    def duplicates(self):
+        """Executions of a statement beyond its first; a high number usually means N+1"""
+        return sum(count - 1 for count in self.statements.values())
+
+    def repeated(self):
+        """Statements run more than once, most repeated first"""
+        return [(statement, count) for statement, count in self.statements.most_common() if count > 1]
+
+    def server_timing(self):
+        return f'db;dur={self.total_ms:.2f};desc="count={self.count}", db-max;dur={self.max_ms:.2f}'
+
+def _collectors():
+    """The QueryStats currently recording: the request's and any open capture_queries blocks"""
+    if not has_app_context():
+        return []
+    collectors = list(g.get('query_captures', ()))
+    if 'query_stats' in g:
+        collectors.append(g.query_stats)
+    return collectors
+
+def explain(cursor, statement, parameters):
+    """EXPLAIN QUERY PLAN detail lines for a statement, run on the connection that executed it"""
+    plan_cursor = cursor.connection.cursor()
+    try:
+        return [row[-1] for row in plan_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+    finally:
+        plan_cursor.close()
+
+def init_query_stats(app, engine):
+    """Time every statement the engine runs and report per-request totals.
+
+    Each response gets X-DB-Queries (statement count), X-DB-Duplicate-Queries
+    (repeats of an already-run statement) and a Server-Timing entry with the
+    total and slowest statement time. Statements slower than
+    SQL_SLOW_QUERY_MS are logged as warnings together with their query plan.
+    """
+    if not app.config['SQL_INSTRUMENTATION']:
+        return
+    slow_ms = app.config['SQL_SLOW_QUERY_MS']
+
+    # The start time lives on the statement's execution context, so a
+    # statement that raises (and never reaches after_cursor_execute) leaves
+    # nothing behind on the pooled connection
+    @event.listens_for(engine, 'before_cursor_execute')
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        context.query_start = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def record(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - context.query_start) * 1000
+        for stats in _collectors():
+            stats.add(statement, elapsed_ms)
+
+        if slow_ms is not None and elapsed_ms >= slow_ms and not executemany:
+            try:
+                plan = explain(cursor, statement, parameters)
+            except Exception as e:  # the plan is best effort; never fail the query over it
+                plan = [f"(no plan: {e})"]
+            logger.warning("Slow query (%.1f ms): %s\nparameters: %r\nplan:\n  %s",
+                           elapsed_ms, statement, parameters, "\n  ".join(plan))
+
+    @app.before_request
+    def start_query_stats():
+        g.query_stats = QueryStats()
+
+    @app.after_request
+    def add_query_headers(response):
+        stats = g.pop('query_stats', None)
+        if stats is not None:
+            response.headers['X-DB-Queries'] = str(stats.count)
+            response.headers['X-DB-Duplicate-Queries'] = str(stats.duplicates)
+            response.headers.add('Server-Timing', stats.server_timing())
+        return response
+
+@contextmanager
+def capture_queries():
+    """Collect stats for the statements run inside the block (which may span requests)"""
+    stats = QueryStats()
+    captures = g.setdefault('query_captures', [])
+    captures.append(stats)
+    try:
+        yield stats
+    finally:
+        captures.remove(stats)
@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, request, make_response
+
+class LRUCache:
+    """Thread-safe bounded LRU map with optional per-entry TTL and tag invalidation"""
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (value, expires_at, tags)
+        self._tags = {}                # tag -> set of keys
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._discard(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, tags=(), ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = (value, expires_at, tuple(tags))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def invalidate(self, *tags):
+        """Drop every entry carrying any of the tags"""
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys |= self._tags.get(tag, set())
+            for key in keys:
+                self._discard(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0
+            }
+
+    def _discard(self, key):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+def init_response_cache(app):
+    """Attach a response cache sized from config to the app"""
+    app.extensions['response_cache'] = LRUCache(
+        maxsize=app.config['RESPONSE_CACHE_SIZE'],
+        ttl=app.config['RESPONSE_CACHE_TTL']
+    )
+
+def get_response_cache():
+    return current_app.extensions['response_cache']
+
+def invalidate(*tags):
+    """Invalidate cached responses for the tags a write touched"""
+    if current_app.config['RESPONSE_CACHE_ENABLED']:
+        get_response_cache().invalidate(*tags)
+
+def cached(*tags, ttl=None):
+    """Serve a GET view's 200 responses from the in-process cache.
+
+    Entries are keyed by endpoint, path and query arguments and dropped when
+    a write endpoint invalidates one of ``tags`` or when their TTL runs out.
+    Writes that bypass the API (seeding, other worker processes) are only
+    picked up once the TTL expires.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not current_app.config['RESPONSE_CACHE_ENABLED']:
+                return f(*args, **kwargs)
+
+            cache = get_response_cache()
+            key = (request.endpoint, request.path, tuple(sorted(request.args.items(multi=True))))
+            hit = cache.get(key)
+            if hit is not None:
+                body, status, headers = hit
+                return current_app.response_class(body, status=status, headers=headers)
+
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                headers = [(name, value) for name, value in response.headers
+                           if name.lower() not in ('set-cookie', 'content-length')]
+                cache.set(key, (response.get_data(), response.status_code, headers), tags=tags, ttl=ttl)
+            return response
+        return decorated_function
+    return decorator
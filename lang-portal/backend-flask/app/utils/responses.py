@@ -1,6 +1,7 @@
 from flask import jsonify
 from typing import Any, Dict, Optional
 from datetime import datetime, UTC
+from app.utils.pagination import KeysetPage
 
 def success_response(
     data: Any = None,
@@ -29,7 +30,8 @@ def error_response(
     message: str = "An error occurred",
     status_code: int = 500,
     error_code: Optional[str] = None,
-    errors: Optional[list] = None
+    errors: Optional[list] = None,
+    data: Any = None
 ) -> tuple:
     """
     Creates a standardized error response
@@ -45,6 +47,9 @@ def error_response(
         
     if errors:
         response["errors"] = errors
+
+    if data is not None:
+        response["data"] = data
         
     return jsonify(response), status_code
 
@@ -52,6 +57,15 @@ def pagination_meta(pagination) -> Dict:
     """
     Creates standardized pagination metadata
     """
+    if isinstance(pagination, KeysetPage):
+        return {
+            "pagination": {
+                "mode": "cursor",
+                "per_page": pagination.per_page,
+                "next_cursor": pagination.next_cursor,
+                "has_next": pagination.has_next
+            }
+        }
     return {
         "pagination": {
             "page": pagination.page,
@@ -0,0 +1,39 @@
+import re
+import unicodedata
+from sqlalchemy import text
+from app.extensions import db
+from app.utils.pagination import OffsetPage
+
+# FTS5 query syntax characters that are stripped from user input
+_FTS_SYNTAX = re.compile(r'["*^():{}+\-]')
+
+def build_match_query(query):
+    """Turn free text into an FTS5 MATCH expression: every term must match as a prefix"""
+    query = unicodedata.normalize('NFC', query)
+    terms = _FTS_SYNTAX.sub(' ', query).split()
+    return ' '.join(f'"{term}"*' for term in terms)
+
+def search_words(query, page=1, per_page=20):
+    """Search words by prefix across Nepali, romanized and English text, best match first.
+
+    Raises ValueError when the query contains no searchable terms.
+    """
+    match = build_match_query(query)
+    if not match:
+        raise ValueError("Search query must contain at least one term")
+
+    total = db.session.execute(
+        text("SELECT COUNT(*) FROM words_fts WHERE words_fts MATCH :match"),
+        {"match": match}
+    ).scalar()
+    rows = db.session.execute(text("""
+        SELECT words.id, words.nepali_word, words.romanized_nepali_word,
+               words.english_word, words.part_of_speech, words_fts.rank
+        FROM words_fts
+        JOIN words ON words.id = words_fts.rowid
+        WHERE words_fts MATCH :match
+        ORDER BY words_fts.rank
+        LIMIT :limit OFFSET :offset
+    """), {"match": match, "limit": per_page, "offset": (page - 1) * per_page}).all()
+
+    return OffsetPage(rows, page, per_page, total)
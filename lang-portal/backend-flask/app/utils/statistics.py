@@ -1,11 +1,33 @@
-from sqlalchemy import func
-from app.models import Word, WordReviewItem, StudySession
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import func, case, select, text
+from app.models import WordReviewItem, DashboardStats, DailyActivity
 from app import db
 
+ROLLUP_COLUMNS = [
+    'total_words', 'total_groups', 'total_activities', 'total_sessions',
+    'completed_sessions', 'total_reviews', 'correct_reviews', 'words_reviewed'
+]
+
+def get_rollup():
+    """Read the trigger-maintained dashboard totals with a single primary-key lookup"""
+    row = db.session.execute(
+        select(*[getattr(DashboardStats, column) for column in ROLLUP_COLUMNS])
+        .where(DashboardStats.id == DashboardStats.ROW_ID)
+    ).mappings().first()
+    if row is None:
+        return {column: 0 for column in ROLLUP_COLUMNS}
+    return dict(row)
+
+def average_score(rollup):
+    """Percentage of correct reviews in a rollup"""
+    total = rollup['total_reviews']
+    return round((rollup['correct_reviews'] / total * 100) if total > 0 else 0, 2)
+
 def get_study_progress():
     """Calculate study progress statistics"""
-    total_studied = db.session.query(WordReviewItem.word_id).group_by(WordReviewItem.word_id).count()
-    total_words = Word.query.count()
+    rollup = get_rollup()
+    total_studied = rollup['words_reviewed']
+    total_words = rollup['total_words']
     
     return {
         "progress": {
@@ -17,18 +39,85 @@ def get_study_progress():
 
 def get_dashboard_statistics():
     """Get dashboard statistics"""
-    total_reviews = WordReviewItem.query.count()
-    correct_reviews = WordReviewItem.query.filter_by(is_correct=True).count()
-    words_learned = db.session.query(WordReviewItem.word_id).group_by(WordReviewItem.word_id).count()
+    rollup = get_rollup()
     
     return {
-        "total_reviews": total_reviews,
-        "average_score": round((correct_reviews / total_reviews * 100) if total_reviews > 0 else 0, 2),
-        "words_learned": words_learned,
-        "study_sessions_completed": StudySession.query.filter(StudySession.ended_at.isnot(None)).count(),
+        "total_reviews": rollup['total_reviews'],
+        "average_score": average_score(rollup),
+        "words_learned": rollup['words_reviewed'],
+        "study_sessions_completed": rollup['completed_sessions'],
         "streak": calculate_streak()
     }
 
+# Days fetched per step of the backward streak walk
+STREAK_PAGE_SIZE = 64
+
+# Gaps-and-islands: consecutive days share julianday(day) - row_number()
+LONGEST_STREAK = text("""
+    SELECT COALESCE(MAX(length), 0) FROM (
+        SELECT COUNT(*) AS length FROM (
+            SELECT julianday(day) - ROW_NUMBER() OVER (ORDER BY day) AS island
+            FROM daily_activity
+        ) GROUP BY island
+    )
+""")
+
+def get_streak(today=None):
+    """Current and longest run of consecutive (UTC) days with study activity.
+
+    The current streak walks daily_activity backwards from today a page at a
+    time and stops at the first gap. A streak is still current when the
+    latest active day is yesterday, since today is not over yet.
+    """
+    today = today or datetime.now(UTC).date()
+    longest = db.session.execute(LONGEST_STREAK).scalar()
+    current = 0
+    expected = None
+    before = today + timedelta(days=1)
+    while True:
+        days = db.session.execute(
+            select(DailyActivity.day)
+            .where(DailyActivity.day < before)
+            .order_by(DailyActivity.day.desc())
+            .limit(STREAK_PAGE_SIZE)
+        ).scalars().all()
+        for day in days:
+            if expected is None:
+                if day < today - timedelta(days=1):
+                    break
+                expected = day
+            if day != expected:
+                break
+            current += 1
+            expected = day - timedelta(days=1)
+        else:
+            if len(days) == STREAK_PAGE_SIZE:
+                before = days[-1]
+                continue
+        return {"current_streak": current, "longest_streak": longest}
+
 def calculate_streak():
     """Calculate current learning streak"""
-    return 0  # Placeholder
+    return get_streak()["current_streak"]
+
+def session_review_counts(session_ids):
+    """Get correct, wrong and total review counts for many sessions in one query"""
+    counts = {session_id: {"correct": 0, "wrong": 0, "total": 0} for session_id in session_ids}
+    if not counts:
+        return counts
+
+    rows = db.session.query(
+        WordReviewItem.session_id,
+        func.sum(case((WordReviewItem.is_correct == True, 1), else_=0)),
+        func.count(WordReviewItem.id)
+    ).filter(WordReviewItem.session_id.in_(counts.keys()))\
+        .group_by(WordReviewItem.session_id)\
+        .all()
+
+    for session_id, correct, total in rows:
+        counts[session_id] = {
+            "correct": correct or 0,
+            "wrong": total - (correct or 0),
+            "total": total
+        }
+    return counts
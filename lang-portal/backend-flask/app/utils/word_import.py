@@ -0,0 +1,180 @@
+import csv
+import io
+import json
+import time
+from itertools import islice
+from typing import List
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert, select
+from app.extensions import db
+from app.models import Word
+from app.schemas import WordBase
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+# Errors kept in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+_word_batch = TypeAdapter(List[WordBase])
+
+def _parse_part_of_speech(value):
+    """CSV cells hold either a JSON list or names separated by ';' or ','"""
+    value = (value or '').strip()
+    if value.startswith('['):
+        return json.loads(value)
+    return [part.strip() for part in value.replace(';', ',').split(',') if part.strip()]
+
+def iter_csv_rows(text_stream):
+    """Yield (line number, row dict) from a CSV stream with a header line"""
+    reader = csv.DictReader(text_stream)
+    for row in reader:
+        if None in row:
+            yield reader.line_num, ValueError("Row has more fields than the header")
+            continue
+        try:
+            if 'part_of_speech' in row:
+                row['part_of_speech'] = _parse_part_of_speech(row['part_of_speech'])
+        except ValueError as e:
+            yield reader.line_num, ValueError(f"part_of_speech: {e}")
+            continue
+        yield reader.line_num, row
+
+def iter_ndjson_rows(text_stream):
+    """Yield (line number, object) from an NDJSON stream, skipping blank lines"""
+    for line_number, line in enumerate(text_stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, ValueError(f"Invalid JSON: {e}")
+
+def _error_messages(errors):
+    return [
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" if error['loc'] else error['msg']
+        for error in errors
+    ]
+
+
+class ImportAborted(Exception):
+    """The stream or the database failed part way; ``report`` covers the chunks committed before"""
+
+    def __init__(self, report):
+        super().__init__("Import stopped part way")
+        self.report = report
+
+
+class WordImporter:
+    """Import words from a CSV or NDJSON stream in validated, deduplicated chunks.
+
+    Rows are read incrementally, validated a batch at a time against WordBase,
+    checked against existing (nepali_word, english_word) pairs through their
+    index, and inserted with executemany, one transaction per chunk. A failed
+    row never blocks the rest of its chunk; an error that stops the import
+    (undecodable bytes, a database failure) is raised as ImportAborted from
+    the original exception, carrying the report of what was committed.
+    """
+
+    def __init__(self, chunk_size=2000):
+        self.chunk_size = chunk_size
+        self.inserted = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.errors = []
+
+    def run(self, text_stream, import_format):
+        """Import everything in the stream and return the report"""
+        if import_format not in IMPORT_FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(IMPORT_FORMATS)}")
+        rows = iter_csv_rows(text_stream) if import_format == 'csv' else iter_ndjson_rows(text_stream)
+
+        started = time.perf_counter()
+        try:
+            while chunk := list(islice(rows, self.chunk_size)):
+                self.import_chunk(chunk)
+        except Exception as e:
+            raise ImportAborted(self.report(time.perf_counter() - started)) from e
+        return self.report(time.perf_counter() - started)
+
+    def import_chunk(self, chunk):
+        parsed = []
+        for line, row in chunk:
+            if isinstance(row, Exception):
+                self._fail(line, [str(row)])
+            elif not isinstance(row, dict):
+                self._fail(line, ["Expected an object"])
+            else:
+                parsed.append((line, row))
+
+        words = self._validate(parsed)
+        if not words:
+            return
+
+        existing = set(db.session.execute(
+            select(Word.nepali_word, Word.english_word)
+            .where(Word.nepali_word.in_({word.nepali_word for _, word in words}))
+        ).all())
+        new = []
+        for _, word in words:
+            key = (word.nepali_word, word.english_word)
+            if key in existing:
+                self.duplicates += 1
+                continue
+            existing.add(key)
+            new.append({
+                'nepali_word': word.nepali_word,
+                'romanized_nepali_word': word.romanized_nepali_word,
+                'english_word': word.english_word,
+                'part_of_speech': json.dumps(word.part_of_speech)
+            })
+
+        if new:
+            try:
+                db.session.execute(insert(Word.__table__), new)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            self.inserted += len(new)
+
+    def _validate(self, parsed):
+        """Validate the batch in one call; only a failing batch is split per row"""
+        try:
+            validated = _word_batch.validate_python([row for _, row in parsed])
+            return [(line, word) for (line, _), word in zip(parsed, validated)]
+        except ValidationError as e:
+            errors_by_index = {}
+            for error in e.errors():
+                index, *loc = error['loc']
+                errors_by_index.setdefault(index, []).append({**error, 'loc': tuple(loc)})
+
+        words = []
+        for index, (line, row) in enumerate(parsed):
+            if index in errors_by_index:
+                self._fail(line, _error_messages(errors_by_index[index]))
+            else:
+                words.append((line, WordBase.model_validate(row)))
+        return words
+
+    def _fail(self, line, messages):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "errors": messages})
+
+    def report(self, elapsed):
+        return {
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+            "elapsed_seconds": round(elapsed, 3)
+        }
+
+def import_words(stream, import_format, chunk_size=2000, encoding='utf-8-sig'):
+    """Import words from a binary or text stream; see WordImporter"""
+    if isinstance(stream, io.RawIOBase):
+        stream = io.BufferedReader(stream)
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding=encoding, newline='')
+    return WordImporter(chunk_size).run(stream, import_format)
@@ -0,0 +1,64 @@
+"""Measure response compression: wire size and latency with and without the compressed-body cache.
+
+Usage: python -m benchmarks.bench_compression [--words 5000] [--per-page 50] [--requests 300]
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks.common import benchmark_config, insert_words, time_calls, summarize
+from app import create_app, db
+from app.utils.compression import available_encodings
+from sqlalchemy import text
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=5000)
+    parser.add_argument('--per-page', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(benchmark_config(os.path.join(tmp, 'bench.db')))
+        with app.app_context():
+            connection = db.engine.raw_connection()
+            insert_words(connection, args.words, seed=args.seed)
+            connection.close()
+            db.session.execute(text(
+                "INSERT INTO groups (name, description, created_at) VALUES ('All', 'Every word', CURRENT_TIMESTAMP)"
+            ))
+            db.session.execute(text(
+                "INSERT INTO words_groups (word_id, group_id) SELECT id, 1 FROM words"
+            ))
+            db.session.commit()
+
+        client = app.test_client()
+        cache = app.extensions['compression_cache']
+        urls = {
+            'words page': f'/api/words?per_page={args.per_page}',
+            'group words page': f'/api/groups/1/words?per_page={args.per_page}',
+        }
+        for name, url in urls.items():
+            plain = client.get(url)
+            assert plain.status_code == 200, plain.json
+            size = len(plain.data)
+            print(f"{name} ({args.per_page} rows, {size:,} bytes)")
+            requests = [(url,)] * args.requests
+            print("  " + summarize('identity', time_calls(client.get, requests)))
+
+            for encoding in available_encodings():
+                headers = {'Accept-Encoding': encoding}
+                encoded = len(client.get(url, headers=headers).data)
+
+                def cold(url):
+                    cache.clear()
+                    return client.get(url, headers=headers)
+
+                print(f"  {encoding}: {encoded:,} bytes ({encoded / size:.0%})")
+                print("  " + summarize(f'{encoding}, compressing', time_calls(cold, requests)))
+                print("  " + summarize(f'{encoding}, cached body',
+                                       time_calls(lambda url: client.get(url, headers=headers), requests)))
+
+if __name__ == '__main__':
+    main()
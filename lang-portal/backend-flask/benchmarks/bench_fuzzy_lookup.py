@@ -0,0 +1,61 @@
+"""Compare trigram-indexed fuzzy lookup with a brute-force Levenshtein scan.
+
+Usage: python -m benchmarks.bench_fuzzy_lookup [--words 100000] [--queries 200]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.common import benchmark_config, insert_words, time_calls, summarize
+from app import create_app, db
+from app.utils.fuzzy import get_fuzzy_index, normalize_romanized, levenshtein, default_max_distance
+from sqlalchemy import text
+
+def misspell(rng, word):
+    """Apply one random edit, the way a learner mistypes"""
+    i = rng.randrange(len(word))
+    edit = rng.choice(['drop', 'swap', 'replace'])
+    if edit == 'drop':
+        return word[:i] + word[i + 1:]
+    if edit == 'swap' and i + 1 < len(word):
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + rng.choice('aeioukgtdnpbmrls') + word[i + 1:]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(benchmark_config(os.path.join(tmp, 'bench.db')))
+        with app.app_context():
+            connection = db.engine.raw_connection()
+            insert_words(connection, args.words, seed=args.seed)
+            connection.close()
+
+            started = time.perf_counter()
+            index = get_fuzzy_index()
+            print(f"index build: {time.perf_counter() - started:.2f}s for {len(index)} words")
+
+            rows = db.session.execute(text("SELECT id, romanized_nepali_word FROM words")).all()
+            keys = [(word_id, normalize_romanized(romanized)) for word_id, romanized in rows]
+
+            def brute_force(query):
+                key = normalize_romanized(query)
+                max_distance = default_max_distance(key)
+                scored = [(levenshtein(key, candidate, max_distance), word_id) for word_id, candidate in keys]
+                return sorted(item for item in scored if item[0] <= max_distance)[:5]
+
+            rng = random.Random(args.seed)
+            queries = [(misspell(rng, rng.choice(rows)[1]),) for _ in range(args.queries)]
+
+            print(f"{args.words} words, {args.queries} misspelled queries")
+            print(summarize('trigram index', time_calls(index.search, queries)))
+            print(summarize('brute-force scan', time_calls(brute_force, queries[:20])))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compare the orjson and stdlib JSON providers on realistic page payloads.
+
+Usage: python -m benchmarks.bench_json [--per-page 50] [--iterations 2000]
+"""
+import argparse
+import random
+from datetime import datetime, timedelta, UTC
+
+from benchmarks.common import synthetic_word, time_calls, summarize
+from flask import Flask
+from app.utils import json_provider
+from app.utils.json_provider import FastJSONProvider
+
+def envelope(data, per_page):
+    return {
+        "success": True,
+        "message": "Success",
+        "timestamp": datetime.now(UTC).isoformat() + "Z",
+        "data": data,
+        "meta": {"pagination": {"current_page": 1, "per_page": per_page, "total_items": 100000,
+                                "total_pages": 100000 // per_page, "has_next": True, "has_prev": False}}
+    }
+
+def payloads(per_page, seed):
+    rng = random.Random(seed)
+    words = []
+    for i in range(per_page):
+        word = synthetic_word(rng, i)
+        words.append({"id": i + 1, **word, "part_of_speech": [word['part_of_speech'][2:-2]]})
+
+    started = datetime(2025, 1, 1, 8, 0)
+    sessions = [{
+        "id": i + 1,
+        "activity_name": "Flashcards",
+        "group_name": f"Group {i % 10}",
+        "started_at": started + timedelta(hours=i),
+        "ended_at": started + timedelta(hours=i, minutes=12),
+        "number_of_review_items": 40,
+        "number_of_correct_review_items": 31,
+        "number_of_wrong_review_items": 9
+    } for i in range(per_page)]
+    return {
+        'words page': envelope({"words": words}, per_page),
+        'study sessions page': envelope({"study_sessions": sessions}, per_page)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--per-page', type=int, default=50)
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    providers = {'stdlib': FastJSONProvider(app, use_orjson=False)}
+    if json_provider.orjson is not None:
+        providers['orjson'] = FastJSONProvider(app, use_orjson=True)
+    else:
+        print("orjson is not installed; timing the stdlib encoder only")
+
+    for name, payload in payloads(args.per_page, args.seed).items():
+        size = len(providers['stdlib'].response(payload).get_data())
+        print(f"{name} ({args.per_page} rows, {size:,} bytes)")
+        for label, provider in providers.items():
+            timings = time_calls(provider.response, [(payload,)] * args.iterations)
+            print("  " + summarize(label, timings))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Compare ORM-entity and column-projected list pages: latency and peak memory.
+
+Usage: python -m benchmarks.bench_list_pages [--words 200000] [--sessions 100000] [--per-page 50]
+"""
+import argparse
+import os
+import random
+import tempfile
+import tracemalloc
+
+from benchmarks.common import benchmark_config, insert_words, insert_history, time_calls, summarize
+from app import create_app, db
+from app.models import Word, Group, StudySession
+from app.utils.projections import (
+    paginate_words, paginate_group_words, paginate_study_sessions, row_dicts
+)
+
+# The entity path each endpoint used before projection
+def orm_words(page, per_page):
+    pagination = Word.query.paginate(page=page, per_page=per_page)
+    return [{
+        "id": w.id,
+        "nepali_word": w.nepali_word,
+        "romanized_nepali_word": w.romanized_nepali_word,
+        "english_word": w.english_word,
+        "part_of_speech": w.part_of_speech
+    } for w in pagination.items]
+
+def orm_group_words(page, per_page):
+    group = db.session.get(Group, 1)
+    pagination = group.words.paginate(page=page, per_page=per_page)
+    return [{
+        "id": w.id,
+        "nepali_word": w.nepali_word,
+        "romanized_nepali_word": w.romanized_nepali_word,
+        "english_word": w.english_word
+    } for w in pagination.items]
+
+def orm_sessions(page, per_page):
+    pagination = StudySession.query.paginate(page=page, per_page=per_page)
+    return [{
+        "id": s.id,
+        "group_id": s.group_id,
+        "study_activity_id": s.study_activity_id,
+        "started_at": s.started_at,
+        "ended_at": s.ended_at,
+        "group_name": s.group.name if s.group else None,
+        "activity_name": s.activity.name if s.activity else None
+    } for s in pagination.items]
+
+def peak_kib(func, args_list):
+    """Largest traced allocation peak over the calls, in KiB"""
+    peak = 0
+    for args in args_list:
+        tracemalloc.start()
+        func(*args)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return peak / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=200000)
+    parser.add_argument('--sessions', type=int, default=100000)
+    parser.add_argument('--per-page', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(benchmark_config(os.path.join(tmp, 'bench.db')))
+        with app.app_context():
+            connection = db.engine.raw_connection()
+            insert_words(connection, args.words, seed=args.seed)
+            insert_history(connection, args.sessions)
+            connection.close()
+            group = db.session.get(Group, 1)
+
+            # Each request runs in a fresh session, the way a request would
+            def isolated(func):
+                def call(*call_args):
+                    result = func(*call_args)
+                    db.session.remove()
+                    return result
+                return call
+
+            cases = {
+                'words': (orm_words, lambda page, per_page: row_dicts(paginate_words(page, per_page).items),
+                          args.words),
+                'group words': (orm_group_words,
+                                lambda page, per_page: row_dicts(paginate_group_words(group, page, per_page).items),
+                                group.words_count),
+                'study sessions': (orm_sessions,
+                                   lambda page, per_page: row_dicts(paginate_study_sessions(page, per_page).items),
+                                   args.sessions),
+            }
+            rng = random.Random(args.seed)
+            for name, (entities, projected, total) in cases.items():
+                pages = total // args.per_page
+                calls = [(rng.randint(1, min(pages, 200)), args.per_page) for _ in range(args.requests)]
+                assert entities(*calls[0]) == projected(*calls[0])
+                print(f"{name} ({total:,} rows, per_page={args.per_page})")
+                for label, func in (('ORM entities', entities), ('column projection', projected)):
+                    func = isolated(func)
+                    print("  " + summarize(label, time_calls(func, calls))
+                          + f"   peak {peak_kib(func, calls[:20]):7.1f} KiB")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Measure the per-request cost of recording metrics.
+
+Usage: python -m benchmarks.bench_metrics [--requests 20000]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.common import benchmark_config
+from app import create_app
+from app.utils.metrics import AppMetrics, MetricsRegistry
+
+def hot_path_us(metrics, iterations):
+    """Microseconds per request for the recording calls the request hooks make"""
+    labels, status_labels = ('GET', '/api/words'), ('GET', '/api/words', '200')
+    started = time.perf_counter()
+    for _ in range(iterations):
+        request_started = time.perf_counter()
+        metrics.in_flight.inc()
+        metrics.latency.observe(labels, time.perf_counter() - request_started)
+        metrics.requests.inc(status_labels)
+        metrics.in_flight.dec()
+        metrics.registry.maybe_flush()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+def request_us(apps, requests):
+    """Median microseconds per request to a trivial endpoint through the full Flask stack.
+
+    Requests alternate between the apps so drift on the machine hits both alike.
+    """
+    clients = {label: app.test_client() for label, app in apps.items()}
+    timings = {label: [] for label in apps}
+    for _ in range(requests):
+        for label, client in clients.items():
+            started = time.perf_counter()
+            client.get('/api/')
+            timings[label].append((time.perf_counter() - started) * 1e6)
+    return {label: statistics.median(values) for label, values in timings.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single = AppMetrics(MetricsRegistry())
+        multi = AppMetrics(MetricsRegistry(os.path.join(tmp, 'metrics'), flush_interval=1.0))
+        print(f"recording, single process:    {hot_path_us(single, args.requests):6.2f} us/request")
+        print(f"recording, multiprocess file: {hot_path_us(multi, args.requests):6.2f} us/request")
+
+        db_path = os.path.join(tmp, 'bench.db')
+        apps = {
+            label: create_app(benchmark_config(db_path, METRICS_ENABLED=enabled, SQL_INSTRUMENTATION=False))
+            for label, enabled in (('metrics off', False), ('metrics on', True))
+        }
+        request_us(apps, 500)  # warm up
+        results = request_us(apps, args.requests)
+        for label, median in results.items():
+            print(f"GET /api/ with {label + ':':<13} {median:7.1f} us median")
+        print(f"overhead: {results['metrics on'] - results['metrics off']:+.1f} us/request")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Time the bulk seed loader on a synthetic corpus, then re-run it to time the idempotent pass.
+
+Usage: python -m benchmarks.bench_seed_load [--words 50000] [--days 365] [--sessions-per-day 3]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import benchmark_config, synthetic_word
+from app import create_app
+from app.utils.bulk_load import load_seeds
+
+def write_array(path, rows):
+    """Write a JSON array one object per line, as a large exported corpus would be"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[\n')
+        for i, row in enumerate(rows):
+            if i:
+                f.write(',\n')
+            f.write(json.dumps(row, ensure_ascii=False))
+        f.write('\n]\n')
+
+def write_corpus(seeds_dir, words, groups, days, sessions_per_day, reviews_per_session, seed):
+    rng = random.Random(seed)
+    word_rows = [synthetic_word(rng, i) for i in range(words)]
+    group_names = [f"Group {i}" for i in range(groups)]
+    write_array(os.path.join(seeds_dir, 'activities.json'),
+                [{'name': 'Flashcards', 'description': 'Cards'}, {'name': 'Word Match', 'description': 'Pairs'}])
+    write_array(os.path.join(seeds_dir, 'groups.json'),
+                [{'name': name, 'description': name} for name in group_names])
+    write_array(os.path.join(seeds_dir, 'words.json'), word_rows)
+    write_array(os.path.join(seeds_dir, 'words_groups.json'), (
+        {'nepali_word': row['nepali_word'], 'group_name': group_names[i % groups]}
+        for i, row in enumerate(word_rows)
+    ))
+
+    start = datetime(2024, 1, 1, 8, 0)
+    def sessions():
+        for day in range(days):
+            for n in range(sessions_per_day):
+                started = start + timedelta(days=day, hours=n * 3)
+                yield {
+                    'group_name': rng.choice(group_names),
+                    'activity_name': 'Flashcards',
+                    'started_at': started.isoformat(),
+                    'ended_at': (started + timedelta(minutes=10)).isoformat(),
+                    'reviews': [{
+                        'nepali_word': rng.choice(word_rows)['nepali_word'],
+                        'is_correct': rng.random() < 0.7,
+                        'created_at': (started + timedelta(seconds=10 * r)).isoformat()
+                    } for r in range(reviews_per_session)]
+                }
+    write_array(os.path.join(seeds_dir, 'sessions.json'), sessions())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=50000)
+    parser.add_argument('--groups', type=int, default=100)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--sessions-per-day', type=int, default=3)
+    parser.add_argument('--reviews-per-session', type=int, default=40)
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    parser.add_argument('--keep-indexes', action='store_true', help="Maintain indexes during the load")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_corpus(tmp, args.words, args.groups, args.days, args.sessions_per_day,
+                     args.reviews_per_session, args.seed)
+        app = create_app(benchmark_config(os.path.join(tmp, 'bench.db')))
+        with app.app_context():
+            for label in ('initial load', 're-run (all rows present)'):
+                print(f"{label}:")
+                started = time.perf_counter()
+                summary = load_seeds(tmp, chunk_size=args.chunk_size, defer_indexes=not args.keep_indexes)
+                elapsed = time.perf_counter() - started
+                rows = sum(counts['inserted'] for counts in summary.values())
+                print(f"  total: {rows:,} rows inserted in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/s)\n")
+
+if __name__ == '__main__':
+    main()
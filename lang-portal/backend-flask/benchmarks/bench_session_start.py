@@ -0,0 +1,64 @@
+"""Time POST /api/study-activities across group sizes: whole group vs first chunk vs sample.
+
+Usage: python -m benchmarks.bench_session_start [--sizes 50,1000,10000,50000] [--requests 20]
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from benchmarks.common import benchmark_config, insert_words, time_calls, summarize
+from app import create_app, db
+from app.models import Group
+
+# What the endpoint did before it returned a chunk: load and serialize every member
+def whole_group(group_id):
+    group = db.session.get(Group, group_id)
+    body = json.dumps({"words": [{
+        'id': w.id,
+        'nepali_word': w.nepali_word,
+        'english_word': w.english_word,
+        'romanized_nepali_word': w.romanized_nepali_word
+    } for w in group.words]})
+    db.session.remove()
+    return body
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='50,1000,10000,50000', help='group sizes to compare')
+    parser.add_argument('--requests', type=int, default=20)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(benchmark_config(os.path.join(tmp, 'bench.db'), SQL_INSTRUMENTATION=False))
+        with app.app_context():
+            connection = db.engine.raw_connection()
+            insert_words(connection, max(sizes))
+            cursor = connection.cursor()
+            for group_id, size in enumerate(sizes, 1):
+                cursor.execute("INSERT INTO groups (id, name, description, created_at) "
+                               "VALUES (?, ?, '', CURRENT_TIMESTAMP)", (group_id, f"{size} words"))
+                cursor.execute("INSERT INTO words_groups (word_id, group_id) SELECT id, ? FROM words WHERE id <= ?",
+                               (group_id, size))
+            cursor.execute("INSERT INTO study_activities (id, name, description, created_at) "
+                           "VALUES (1, 'Flashcards', '', CURRENT_TIMESTAMP)")
+            connection.commit()
+            connection.close()
+
+            client = app.test_client()
+
+            def start(group_id, **options):
+                response = client.post('/api/study-activities',
+                                       json={'group_id': group_id, 'study_activity_id': 1, **options})
+                assert response.status_code == 200
+
+            for group_id, size in enumerate(sizes, 1):
+                calls = [(group_id,)] * args.requests
+                print(f"group of {size:,} words")
+                print("  " + summarize('whole group (before)', time_calls(whole_group, calls)))
+                print("  " + summarize('first chunk + cursor', time_calls(start, calls)))
+                print("  " + summarize('sample', time_calls(lambda g: start(g, sample=True), calls)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Time the streaming word import against per-row ORM inserts.
+
+Usage: python -m benchmarks.bench_word_import [--words 100000] [--orm-words 10000]
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.common import benchmark_config, synthetic_word
+from app import create_app, db
+from app.models import Word
+from app.schemas import WordBase
+from app.utils.word_import import import_words
+
+def write_csv(path, count, seed):
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['nepali_word', 'romanized_nepali_word', 'english_word', 'part_of_speech'])
+        for i in range(count):
+            word = synthetic_word(rng, i)
+            writer.writerow([word['nepali_word'], word['romanized_nepali_word'], word['english_word'],
+                             word['part_of_speech'].strip('[]"')])
+
+def orm_import(path):
+    """The one-object-at-a-time path: validate, check for a duplicate, add"""
+    with open(path, encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            row['part_of_speech'] = [row['part_of_speech']]
+            word = WordBase.model_validate(row)
+            if Word.query.filter_by(nepali_word=word.nepali_word, english_word=word.english_word).first():
+                continue
+            db.session.add(Word(**word.model_dump()))
+            db.session.flush()
+    db.session.commit()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=100000)
+    parser.add_argument('--orm-words', type=int, default=10000)
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'words.csv')
+        write_csv(path, args.words, args.seed)
+        app = create_app(benchmark_config(os.path.join(tmp, 'bench.db')))
+        with app.app_context():
+            with open(path, 'rb') as f:
+                report = import_words(f, 'csv', chunk_size=args.chunk_size)
+            elapsed = report['elapsed_seconds']
+            print(f"streaming import: {report['inserted']:,} words in {elapsed:.2f}s "
+                  f"({report['inserted'] / elapsed:,.0f} rows/s), {report['failed']} failed")
+
+            with open(path, 'rb') as f:
+                report = import_words(f, 'csv', chunk_size=args.chunk_size)
+            print(f"re-import (all duplicates): {report['duplicates']:,} skipped in {report['elapsed_seconds']:.2f}s")
+
+            db.session.execute(db.text("DELETE FROM words"))
+            db.session.commit()
+            orm_path = os.path.join(tmp, 'orm.csv')
+            write_csv(orm_path, args.orm_words, args.seed)
+            started = time.perf_counter()
+            orm_import(orm_path)
+            elapsed = time.perf_counter() - started
+            print(f"per-row ORM import: {args.orm_words:,} words in {elapsed:.2f}s "
+                  f"({args.orm_words / elapsed:,.0f} rows/s)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Compare FTS5 word search with a naive LIKE '%q%' scan.
+
+Usage: python benchmarks/bench_word_search.py [--words 100000] [--queries 200]
+"""
+import argparse
+import os
+import random
+import tempfile
+
+from benchmarks.common import benchmark_config, insert_words, time_calls, summarize
+from app import create_app, db
+from app.utils.search import search_words
+from sqlalchemy import text
+
+LIKE_COUNT = text("""
+    SELECT COUNT(*) FROM words
+    WHERE nepali_word LIKE :pattern OR romanized_nepali_word LIKE :pattern OR english_word LIKE :pattern
+""")
+LIKE_PAGE = text("""
+    SELECT id, nepali_word, romanized_nepali_word, english_word, part_of_speech FROM words
+    WHERE nepali_word LIKE :pattern OR romanized_nepali_word LIKE :pattern OR english_word LIKE :pattern
+    LIMIT 20
+""")
+
+def like_search(query):
+    params = {'pattern': f'%{query}%'}
+    db.session.execute(LIKE_COUNT, params).scalar()
+    db.session.execute(LIKE_PAGE, params).all()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(benchmark_config(os.path.join(tmp, 'bench.db')))
+        with app.app_context():
+            connection = db.engine.raw_connection()
+            insert_words(connection, args.words, seed=args.seed)
+            connection.close()
+
+            rng = random.Random(args.seed)
+            sample = db.session.execute(
+                text("SELECT nepali_word, romanized_nepali_word, english_word FROM words")
+            ).all()
+            queries = []
+            for _ in range(args.queries):
+                word = rng.choice(sample)[rng.randrange(3)]
+                queries.append((word[:rng.randint(2, 4)],))
+
+            print(f"{args.words} words, {args.queries} prefix queries")
+            print(summarize('FTS5 search_words', time_calls(search_words, queries)))
+            print(summarize("LIKE '%q%' scan", time_calls(like_search, queries)))
+
+if __name__ == '__main__':
+    main()
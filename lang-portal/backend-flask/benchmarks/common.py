@@ -0,0 +1,101 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against a throwaway SQLite file built with the application's
+own schema (create_app + create_all), so triggers and indexes match production.
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+# Romanized consonants with their Devanagari letters, and vowels with their signs
+CONSONANTS = [
+    ('k', 'क'), ('kh', 'ख'), ('g', 'ग'), ('ch', 'च'), ('j', 'ज'), ('t', 'त'),
+    ('th', 'थ'), ('d', 'द'), ('dh', 'ध'), ('n', 'न'), ('p', 'प'), ('ph', 'फ'),
+    ('b', 'ब'), ('bh', 'भ'), ('m', 'म'), ('y', 'य'), ('r', 'र'), ('l', 'ल'),
+    ('w', 'व'), ('s', 'स'), ('h', 'ह')
+]
+VOWELS = [('a', ''), ('aa', 'ा'), ('i', 'ि'), ('u', 'ु'), ('e', 'े'), ('o', 'ो')]
+ENGLISH = [
+    'water', 'house', 'mountain', 'river', 'friend', 'food', 'book', 'road',
+    'light', 'tree', 'village', 'market', 'school', 'morning', 'evening', 'rain',
+    'cold', 'warm', 'small', 'big', 'go', 'come', 'eat', 'drink', 'read', 'write'
+]
+PARTS_OF_SPEECH = ['noun', 'verb', 'adjective', 'adverb', 'expression']
+
+def benchmark_config(db_path, **overrides):
+    """Config class pointing the app at db_path with the response cache off"""
+    attrs = {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
+        'RESPONSE_CACHE_ENABLED': False,
+    }
+    attrs.update(overrides)
+    return type('BenchmarkConfig', (Config,), attrs)
+
+def synthetic_word(rng, index):
+    """A plausible (romanized, Devanagari, English) word; index keeps it unique"""
+    romanized, nepali = '', ''
+    for _ in range(rng.randint(2, 4)):
+        consonant = rng.choice(CONSONANTS)
+        vowel = rng.choice(VOWELS)
+        romanized += consonant[0] + vowel[0]
+        nepali += consonant[1] + vowel[1]
+    english = f"{rng.choice(ENGLISH)} {index}"
+    return {
+        'nepali_word': nepali,
+        'romanized_nepali_word': romanized,
+        'english_word': english,
+        'part_of_speech': f'["{rng.choice(PARTS_OF_SPEECH)}"]'
+    }
+
+def insert_words(connection, count, seed=42, chunk_size=10000):
+    """Bulk insert count synthetic words through a raw DB-API connection"""
+    rng = random.Random(seed)
+    cursor = connection.cursor()
+    for start in range(0, count, chunk_size):
+        rows = [synthetic_word(rng, i) for i in range(start, min(start + chunk_size, count))]
+        cursor.executemany(
+            "INSERT INTO words (nepali_word, romanized_nepali_word, english_word, part_of_speech, created_at) "
+            "VALUES (:nepali_word, :romanized_nepali_word, :english_word, :part_of_speech, CURRENT_TIMESTAMP)",
+            rows
+        )
+    connection.commit()
+
+def insert_history(connection, sessions, groups=20):
+    """Groups holding every word round-robin, one activity and sessions spread over them"""
+    cursor = connection.cursor()
+    cursor.executemany(
+        "INSERT INTO groups (name, description, created_at) VALUES (?, '', CURRENT_TIMESTAMP)",
+        [(f"Group {i}",) for i in range(groups)]
+    )
+    cursor.execute("INSERT INTO words_groups (word_id, group_id) SELECT id, (id % ?) + 1 FROM words", (groups,))
+    cursor.execute(
+        "INSERT INTO study_activities (name, description, created_at) VALUES ('Flashcards', '', CURRENT_TIMESTAMP)"
+    )
+    cursor.executemany(
+        "INSERT INTO study_sessions (group_id, study_activity_id, started_at, created_at) "
+        "VALUES (?, 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+        [((i % groups) + 1,) for i in range(sessions)]
+    )
+    connection.commit()
+
+def time_calls(func, args_list):
+    """Call func once per args tuple and return per-call latencies in milliseconds"""
+    timings = []
+    for args in args_list:
+        start = time.perf_counter()
+        func(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def summarize(name, timings):
+    """One report line with median, p95 and max latency"""
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (f"{name:<28} median {statistics.median(ordered):8.3f} ms   "
+            f"p95 {p95:8.3f} ms   max {ordered[-1]:8.3f} ms")
@@ -0,0 +1,296 @@
+"""Generate a deterministic, realistically shaped SQLite dataset for benchmarking.
+
+The same seed and scale always produce the same rows:
+- word popularity is Zipfian, and groups holding popular words are studied more
+- each word's accuracy improves with the number of times it was reviewed
+- daily activity is bursty: weekly rhythm, log-normal bursts, skipped days,
+  occasional breaks of a week or two, and growth over the year
+
+Rows are written with executemany on one raw connection. The review and
+session indexes and triggers are suspended during the load; afterwards they
+are recreated and the trigger-maintained state (rollups, daily activity,
+word schedules) is rebuilt from scratch.
+
+Usage: python -m benchmarks.dataset OUTPUT.db [--scale small|medium|large] [--seed 42]
+       [--words N] [--groups N] [--sessions N] [--reviews N] [--days 365]
+"""
+import argparse
+import bisect
+import itertools
+import math
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import benchmark_config, synthetic_word, ENGLISH
+from app import create_app, db
+from app.utils.bulk_load import Progress
+from app.utils.maintenance import verify_rollups, rebuild_word_schedules
+
+SCALES = {
+    'small': {'words': 10_000, 'groups': 500, 'sessions': 20_000, 'reviews': 500_000},
+    'medium': {'words': 50_000, 'groups': 2_000, 'sessions': 200_000, 'reviews': 5_000_000},
+    'large': {'words': 100_000, 'groups': 5_000, 'sessions': 1_000_000, 'reviews': 50_000_000},
+}
+ACTIVITIES = [('Flashcards', 4), ('Word Match', 2), ('Typing Practice', 2), ('Listening', 1)]
+
+# Tables whose indexes and triggers are suspended while bulk rows go in
+SUSPENDED_TABLES = ('study_sessions', 'word_review_items')
+
+ZIPF_EXPONENT = 1.07
+WEEKDAY_FACTOR = [1.0, 1.0, 0.9, 1.0, 0.8, 1.3, 1.5]        # Monday first
+SESSION_HOURS = ([7, 12, 18, 21], [3, 1, 3, 4])            # peaks and their weights
+SECONDS_PER_REVIEW = (4, 15)
+
+def timestamp(value):
+    """The text form SQLAlchemy stores DateTime columns in on SQLite"""
+    return value.isoformat(' ', 'microseconds')
+
+def zipf_cum_weights(count, rng):
+    """Cumulative Zipf weights over count items whose popularity ranks are shuffled"""
+    ranks = list(range(1, count + 1))
+    rng.shuffle(ranks)
+    weights = [1 / rank ** ZIPF_EXPONENT for rank in ranks]
+    return weights, list(itertools.accumulate(weights))
+
+def day_weights(days, start, rng):
+    """Relative activity per day: weekly rhythm, log-normal bursts, skipped days and breaks"""
+    weights = []
+    break_left = 0
+    for day in range(days):
+        if break_left:
+            break_left -= 1
+            weights.append(0.0)
+            continue
+        if rng.random() < 0.01:
+            break_left = rng.randint(3, 14) - 1
+            weights.append(0.0)
+            continue
+        if rng.random() < 0.08:
+            weights.append(0.0)
+            continue
+        weekday = (start + timedelta(days=day)).weekday()
+        growth = 0.5 + day / days
+        weights.append(WEEKDAY_FACTOR[weekday] * growth * rng.lognormvariate(0, 0.75))
+    return weights
+
+
+class DatasetGenerator:
+    """Write one synthetic dataset into an empty database with the app's schema"""
+
+    def __init__(self, connection, words, groups, sessions, reviews, days=365,
+                 start=datetime(2024, 1, 1), seed=42, chunk_size=50_000, report=print):
+        self.connection = connection
+        self.words = words
+        self.groups = groups
+        self.sessions = sessions
+        self.reviews = reviews
+        self.days = days
+        self.start = start
+        self.rng = random.Random(seed)
+        self.chunk_size = chunk_size
+        self.report = report
+
+    def generate(self):
+        started = time.perf_counter()
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        suspended = self.suspend(cursor)
+
+        self.insert_activities(cursor)
+        word_weights = self.insert_words(cursor)
+        members = self.insert_groups(cursor)
+        self.insert_sessions(cursor, word_weights, members)
+        self.connection.commit()
+
+        resumed = time.perf_counter()
+        for sql in suspended:
+            cursor.execute(sql)
+        self.connection.commit()
+        cursor.execute("PRAGMA journal_mode=DELETE")
+        cursor.execute("PRAGMA synchronous=FULL")
+        self.report(f"  indexes and triggers recreated in {time.perf_counter() - resumed:.1f}s")
+        self.report(f"Rows written in {time.perf_counter() - started:.1f}s")
+
+    def suspend(self, cursor):
+        """Drop the indexes and triggers on SUSPENDED_TABLES; returns the SQL to recreate them"""
+        placeholders = ", ".join("?" * len(SUSPENDED_TABLES))
+        rows = cursor.execute(
+            f"SELECT type, name, sql FROM sqlite_master "
+            f"WHERE type IN ('index', 'trigger') AND tbl_name IN ({placeholders}) AND sql IS NOT NULL",
+            SUSPENDED_TABLES
+        ).fetchall()
+        for kind, name, _ in rows:
+            cursor.execute(f'DROP {kind.upper()} "{name}"')
+        return [sql for _, _, sql in rows]
+
+    def insert_activities(self, cursor):
+        created = timestamp(self.start)
+        cursor.executemany(
+            "INSERT INTO study_activities (id, name, description, created_at) VALUES (?, ?, ?, ?)",
+            [(i, name, name, created) for i, (name, _) in enumerate(ACTIVITIES, 1)]
+        )
+
+    def insert_words(self, cursor):
+        """Insert the words; returns their popularity weights, indexed by id - 1"""
+        created = timestamp(self.start)
+        progress = Progress('words', self.report)
+        for first in range(0, self.words, self.chunk_size):
+            rows = []
+            for index in range(first, min(first + self.chunk_size, self.words)):
+                word = synthetic_word(self.rng, index)
+                rows.append((index + 1, word['nepali_word'], word['romanized_nepali_word'],
+                             word['english_word'], word['part_of_speech'], created))
+            cursor.executemany(
+                "INSERT INTO words (id, nepali_word, romanized_nepali_word, english_word, "
+                "part_of_speech, created_at) VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            progress.update(len(rows))
+        progress.done()
+        weights, _ = zipf_cum_weights(self.words, self.rng)
+        return weights
+
+    def insert_groups(self, cursor):
+        """Insert groups and memberships; returns each group's member word ids"""
+        created = timestamp(self.start)
+        cursor.executemany(
+            "INSERT INTO groups (id, name, description, created_at) VALUES (?, ?, ?, ?)",
+            [(group_id, f"{self.rng.choice(ENGLISH).title()} {group_id}", '', created)
+             for group_id in range(1, self.groups + 1)]
+        )
+
+        # Every word sits in one group; about a third also appear in a second one
+        members = [[] for _ in range(self.groups)]
+        order = list(range(1, self.words + 1))
+        self.rng.shuffle(order)
+        for position, word_id in enumerate(order):
+            members[position % self.groups].append(word_id)
+            if self.rng.random() < 0.3:
+                extra = self.rng.randrange(self.groups)
+                if word_id not in members[extra]:
+                    members[extra].append(word_id)
+
+        progress = Progress('words_groups', self.report)
+        rows = [(word_id, group_index + 1) for group_index, word_ids in enumerate(members)
+                for word_id in word_ids]
+        for first in range(0, len(rows), self.chunk_size):
+            chunk = rows[first:first + self.chunk_size]
+            cursor.executemany("INSERT INTO words_groups (word_id, group_id) VALUES (?, ?)", chunk)
+            progress.update(len(chunk))
+        progress.done()
+        return members
+
+    def session_starts(self):
+        """Sorted session start times spread over the bursty day weights"""
+        weights = day_weights(self.days, self.start, self.rng)
+        hours, hour_weights = SESSION_HOURS
+        days = self.rng.choices(range(self.days), weights=weights, k=self.sessions)
+        starts = []
+        for day in days:
+            hour = self.rng.choices(hours, hour_weights)[0]
+            minutes = min(max(self.rng.gauss(hour * 60, 50), 0), 24 * 60 - 1)
+            starts.append(self.start + timedelta(days=day, minutes=minutes, seconds=self.rng.randrange(60)))
+        starts.sort()
+        return starts
+
+    def insert_sessions(self, cursor, word_weights, members):
+        """Insert sessions in time order, each with reviews of its group's words"""
+        rng = self.rng
+        groups = [index for index, word_ids in enumerate(members) if word_ids]
+        group_cum = list(itertools.accumulate(sum(word_weights[w - 1] for w in members[g]) for g in groups))
+        member_cum = {g: list(itertools.accumulate(word_weights[w - 1] for w in members[g])) for g in groups}
+        activity_ids = list(range(1, len(ACTIVITIES) + 1))
+        activity_weights = [weight for _, weight in ACTIVITIES]
+        difficulty = [rng.gauss(0, 0.08) for _ in range(self.words)]
+        seen = [0] * self.words
+        # Accuracy climbs with practice on the word, levelling off after a few dozen reviews
+        learning = [0.5 + 0.42 * (1 - math.exp(-practice / 6)) for practice in range(60)]
+
+        mean_reviews = max(self.reviews / max(self.sessions, 1), 1)
+        starts = self.session_starts()
+        sessions_progress = Progress('study_sessions', self.report)
+        reviews_progress = Progress('word_review_items', self.report)
+        session_rows, review_rows = [], []
+
+        for session_id, started in enumerate(starts, 1):
+            group = groups[bisect.bisect_left(group_cum, rng.random() * group_cum[-1])]
+            group_words, cum = members[group], member_cum[group]
+            count = 1 + min(int(rng.expovariate(1 / mean_reviews)), int(mean_reviews * 6))
+            moment = started
+            for word_id in rng.choices(group_words, cum_weights=cum, k=count):
+                practice = seen[word_id - 1]
+                seen[word_id - 1] = practice + 1
+                p_correct = learning[min(practice, 59)] + difficulty[word_id - 1]
+                moment += timedelta(seconds=rng.uniform(*SECONDS_PER_REVIEW))
+                review_rows.append((word_id, session_id, group + 1,
+                                    rng.random() < min(max(p_correct, 0.05), 0.98), timestamp(moment)))
+
+            # The most recent sessions may still be open
+            ended = None if session_id > len(starts) - 20 and rng.random() < 0.5 else timestamp(moment)
+            session_rows.append((session_id, group + 1, rng.choices(activity_ids, activity_weights)[0],
+                                 timestamp(started), ended, timestamp(started)))
+
+            if len(review_rows) >= self.chunk_size:
+                self._flush_sessions(cursor, session_rows, review_rows, sessions_progress, reviews_progress)
+                session_rows, review_rows = [], []
+        self._flush_sessions(cursor, session_rows, review_rows, sessions_progress, reviews_progress)
+        sessions_progress.done()
+        reviews_progress.done()
+
+    def _flush_sessions(self, cursor, session_rows, review_rows, sessions_progress, reviews_progress):
+        cursor.executemany(
+            "INSERT INTO study_sessions (id, group_id, study_activity_id, started_at, ended_at, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)", session_rows
+        )
+        cursor.executemany(
+            "INSERT INTO word_review_items (word_id, session_id, group_id, is_correct, created_at) "
+            "VALUES (?, ?, ?, ?, ?)", review_rows
+        )
+        sessions_progress.update(len(session_rows))
+        reviews_progress.update(len(review_rows))
+
+def generate_dataset(path, words, groups, sessions, reviews, days=365, seed=42, report=print):
+    """Create path with the app's schema and fill it; path must not exist yet"""
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} already exists")
+    app = create_app(benchmark_config(os.path.abspath(path), SQL_INSTRUMENTATION=False))
+    with app.app_context():
+        connection = db.engine.raw_connection()
+        try:
+            DatasetGenerator(connection, words, groups, sessions, reviews, days=days,
+                             seed=seed, report=report).generate()
+        finally:
+            connection.close()
+
+        started = time.perf_counter()
+        verify_rollups(repair=True)
+        report(f"  rollups rebuilt in {time.perf_counter() - started:.1f}s")
+        started = time.perf_counter()
+        schedules = rebuild_word_schedules()
+        report(f"  {schedules:,} word schedules rebuilt in {time.perf_counter() - started:.1f}s")
+        db.engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('output', help='database file to create')
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    for name in ('words', 'groups', 'sessions', 'reviews'):
+        parser.add_argument(f'--{name}', type=int, help=f'override the scale\'s {name} count')
+    parser.add_argument('--days', type=int, default=365, help='length of the activity history')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--force', action='store_true', help='replace the output file if it exists')
+    args = parser.parse_args()
+
+    sizes = {name: getattr(args, name) or default for name, default in SCALES[args.scale].items()}
+    if args.force and os.path.exists(args.output):
+        os.remove(args.output)
+    print(f"Generating {args.output}: " + ", ".join(f"{value:,} {name}" for name, value in sizes.items())
+          + f" over {args.days} days (seed {args.seed})")
+    started = time.perf_counter()
+    generate_dataset(args.output, days=args.days, seed=args.seed, **sizes)
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+"""Load-test the API under a real WSGI server with a realistic request mix.
+
+Builds a throwaway database, serves create_app from it with werkzeug's
+threaded server in a child process, and drives it from concurrent virtual
+users. Each user polls the dashboard, browses list pages, and runs study
+sessions (create, post review batches, end). Reports p50/p95/p99 latency,
+requests/sec and errors per endpoint, and writes them to a JSON file. Pass
+--baseline with an earlier result file to print the change per endpoint.
+Pass --dataset to run against a copy of a benchmarks.dataset file instead
+(generated at --scale first if the file does not exist yet).
+
+Usage: python -m benchmarks.load_test [--concurrency 8] [--duration 30] [--output load_test.json]
+       [--dataset datasets/medium.db --scale medium]
+"""
+import argparse
+import gzip
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, UTC
+
+from benchmarks.common import benchmark_config, insert_words, insert_history
+from benchmarks.dataset import SCALES, generate_dataset
+
+# Relative weight of each virtual user action
+MIX = {
+    'dashboard': 30,
+    'browse': 45,
+    'study': 25,
+}
+DASHBOARD_URLS = ['/api/dashboard', '/api/dashboard/statistics', '/api/dashboard/last-session',
+                  '/api/dashboard/study-progress']
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+def build_database(path, args):
+    """Fill a fresh database with synthetic words, groups and past sessions"""
+    from app import create_app, db
+    app = create_app(benchmark_config(path))
+    with app.app_context():
+        connection = db.engine.raw_connection()
+        insert_words(connection, args.words, seed=args.seed)
+        insert_history(connection, args.sessions, groups=args.groups)
+        connection.close()
+        db.engine.dispose()
+
+def copy_dataset(path, args):
+    """Copy a generated dataset, creating it first if missing"""
+    if not os.path.exists(args.dataset):
+        print(f"generating {args.dataset} at {args.scale} scale")
+        generate_dataset(args.dataset, seed=args.seed, **SCALES[args.scale])
+    shutil.copyfile(args.dataset, path)
+
+def size_to_database(path, args):
+    """Point the request mix at what the database really holds rather than the CLI sizes"""
+    connection = sqlite3.connect(path)
+    try:
+        args.words, args.groups, args.sessions = (
+            connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ('words', 'groups', 'study_sessions')
+        )
+    finally:
+        connection.close()
+
+def serve(db_path, profile, ready):
+    """Child process: serve the app on an ephemeral port and report the port through ready"""
+    from werkzeug.serving import make_server, WSGIRequestHandler
+    from app import create_app
+
+    class KeepAliveHandler(WSGIRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_request(self, *args, **kwargs):
+            pass
+
+    app = create_app(benchmark_config(db_path, SQLITE_PROFILE=profile, RESPONSE_CACHE_ENABLED=True))
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=KeepAliveHandler)
+    ready.put(server.server_port)
+    server.serve_forever()
+
+
+class VirtualUser:
+    """One client on a keep-alive connection, recording every request it makes"""
+
+    def __init__(self, port, args, rng, record):
+        self.port = port
+        self.args = args
+        self.rng = rng
+        self.record = record
+        self.connection = None
+
+    def request(self, method, url, name, body=None):
+        """Send a request and return the decoded JSON body, or None on failure"""
+        headers = {'Accept-Encoding': 'gzip'}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=30)
+            started = time.perf_counter()
+            try:
+                self.connection.request(method, url, body=payload, headers=headers)
+                response = self.connection.getresponse()
+                data = response.read()
+                break
+            except (ConnectionError, http.client.HTTPException):
+                # The server dropped the keep-alive connection; reconnect and retry once
+                self.connection.close()
+                self.connection = None
+        else:
+            self.record(f"{method} {name}", (time.perf_counter() - started) * 1000, False)
+            return None
+
+        self.record(f"{method} {name}", (time.perf_counter() - started) * 1000, response.status < 400)
+        if response.status >= 400 or not data:
+            return None
+        if response.getheader('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        return json.loads(data)
+
+    def dashboard(self):
+        url = self.rng.choice(DASHBOARD_URLS)
+        self.request('GET', url, url)
+
+    def browse(self):
+        per_page = self.args.per_page
+        choice = self.rng.random()
+        if choice < 0.4:
+            page = self.rng.randint(1, max(1, self.args.words // per_page))
+            self.request('GET', f'/api/words?page={page}&per_page={per_page}', '/api/words')
+        elif choice < 0.7:
+            group_id = self.rng.randint(1, self.args.groups)
+            self.request('GET', f'/api/groups/{group_id}/words?per_page={per_page}', '/api/groups/<id>/words')
+        elif choice < 0.85:
+            self.request('GET', f'/api/groups?per_page={per_page}', '/api/groups')
+        else:
+            page = self.rng.randint(1, max(1, self.args.sessions // per_page))
+            self.request('GET', f'/api/study-sessions?page={page}&per_page={per_page}', '/api/study-sessions')
+
+    def study(self):
+        group_id = self.rng.randint(1, self.args.groups)
+        body = self.request('POST', '/api/study-activities', '/api/study-activities',
+                            {'group_id': group_id, 'study_activity_id': 1})
+        if not body or not body.get('words'):
+            return
+        session_id = body['id']
+        word_ids = [word['id'] for word in body['words']]
+        for _ in range(self.args.batches):
+            reviews = [{'word_id': self.rng.choice(word_ids), 'is_correct': self.rng.random() < 0.75}
+                       for _ in range(self.args.batch_size)]
+            self.request('POST', f'/api/study-sessions/{session_id}/reviews',
+                         '/api/study-sessions/<id>/reviews', {'reviews': reviews})
+        self.request('POST', f'/api/study-sessions/{session_id}/end', '/api/study-sessions/<id>/end')
+
+    def run(self, stop):
+        actions = list(MIX)
+        weights = [MIX[action] for action in actions]
+        while not stop.is_set():
+            getattr(self, self.rng.choices(actions, weights)[0])()
+        if self.connection is not None:
+            self.connection.close()
+
+
+class Recorder:
+    """Thread-safe latency samples per endpoint, ignoring those taken during warm-up"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.recording = False
+        self._lock = threading.Lock()
+
+    def __call__(self, endpoint, elapsed_ms, ok):
+        if not self.recording:
+            return
+        with self._lock:
+            self.samples[endpoint].append(elapsed_ms)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def summary(self, duration):
+        def stats(timings, errors):
+            ordered = sorted(timings)
+            return {
+                "requests": len(ordered),
+                "errors": errors,
+                "rps": round(len(ordered) / duration, 1),
+                "p50_ms": round(percentile(ordered, 0.50), 2),
+                "p95_ms": round(percentile(ordered, 0.95), 2),
+                "p99_ms": round(percentile(ordered, 0.99), 2),
+                "max_ms": round(ordered[-1], 2)
+            }
+
+        endpoints = {endpoint: stats(timings, self.errors[endpoint])
+                     for endpoint, timings in sorted(self.samples.items())}
+        every = [timing for timings in self.samples.values() for timing in timings]
+        total = stats(every, sum(self.errors.values())) if every else None
+        return endpoints, total
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_report(endpoints, total, baseline=None):
+    print(f"{'endpoint':<42} {'reqs':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    rows = list(endpoints.items()) + [('TOTAL', total)]
+    for endpoint, stats in rows:
+        line = (f"{endpoint:<42} {stats['requests']:>7} {stats['errors']:>5} {stats['rps']:>8.1f} "
+                f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}")
+        previous = (baseline or {}).get('total' if endpoint == 'TOTAL' else 'endpoints', {})
+        previous = previous if endpoint == 'TOTAL' else previous.get(endpoint)
+        if previous:
+            line += (f"   p95 {stats['p95_ms'] - previous['p95_ms']:+.2f} ms"
+                     f"  rps {stats['rps'] - previous['rps']:+.1f}")
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--concurrency', type=int, default=8, help='virtual users')
+    parser.add_argument('--duration', type=float, default=30, help='measured seconds')
+    parser.add_argument('--warmup', type=float, default=3, help='unmeasured seconds before measuring')
+    parser.add_argument('--words', type=int, default=20000)
+    parser.add_argument('--groups', type=int, default=50)
+    parser.add_argument('--sessions', type=int, default=5000, help='past sessions in the database')
+    parser.add_argument('--per-page', type=int, default=50)
+    parser.add_argument('--batches', type=int, default=3, help='review posts per study session')
+    parser.add_argument('--batch-size', type=int, default=10, help='reviews per post')
+    parser.add_argument('--profile', default='production', help='SQLITE_PROFILE for the server')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--dataset', help='benchmarks.dataset file to serve instead of building one')
+    parser.add_argument('--scale', choices=SCALES, default='small', help='size to generate a missing --dataset at')
+    parser.add_argument('--output', default='load_test.json')
+    parser.add_argument('--baseline', help='earlier result file to compare against')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'load.db')
+        started = time.perf_counter()
+        if args.dataset:
+            copy_dataset(db_path, args)
+        else:
+            build_database(db_path, args)
+        size_to_database(db_path, args)
+        print(f"database: {args.words} words, {args.groups} groups, {args.sessions} sessions "
+              f"in {time.perf_counter() - started:.1f}s")
+
+        ready = multiprocessing.Queue()
+        server = multiprocessing.Process(target=serve, args=(db_path, args.profile, ready), daemon=True)
+        server.start()
+        try:
+            port = ready.get(timeout=60)
+            recorder = Recorder()
+            stop = threading.Event()
+            users = [
+                threading.Thread(target=VirtualUser(port, args, random.Random(args.seed + i), recorder).run,
+                                 args=(stop,))
+                for i in range(args.concurrency)
+            ]
+            for user in users:
+                user.start()
+            time.sleep(args.warmup)
+            recorder.recording = True
+            measured_from = time.perf_counter()
+            time.sleep(args.duration)
+            recorder.recording = False
+            duration = time.perf_counter() - measured_from
+            stop.set()
+            for user in users:
+                user.join()
+        finally:
+            server.terminate()
+            server.join()
+
+    endpoints, total = recorder.summary(duration)
+    if total is None:
+        raise SystemExit("No requests completed")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print(f"{args.concurrency} users for {duration:.1f}s against {args.profile} profile")
+    print_report(endpoints, total, baseline)
+
+    result = {
+        "started_at": datetime.now(UTC).isoformat(),
+        "git_revision": git_revision(),
+        "config": {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+        "mix": MIX,
+        "duration_seconds": round(duration, 2),
+        "endpoints": endpoints,
+        "total": total
+    }
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(f"results written to {args.output}")
+
+if __name__ == '__main__':
+    main()
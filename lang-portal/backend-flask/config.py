@@ -20,6 +20,57 @@ class Config:
     
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # SQLite engine profile applied at connect time ('default' or 'production')
+    SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'default')
+    SQLITE_PROFILES = {
+        'default': {},
+        'production': {
+            'pragmas': {
+                'journal_mode': 'WAL',          # readers no longer block on the review writer
+                'synchronous': 'NORMAL',        # durable at checkpoints, safe with WAL
+                'busy_timeout': 5000,           # wait up to 5s for a lock instead of failing
+                'cache_size': -65536,           # 64 MiB page cache per connection
+                'mmap_size': 268435456,         # 256 MiB memory-mapped reads
+                'temp_store': 'MEMORY',
+                'foreign_keys': 'ON'
+            },
+            'engine_options': {
+                'pool_size': 10,
+                'max_overflow': 20,
+                'pool_timeout': 30,
+                'pool_recycle': 3600,
+                'connect_args': {'timeout': 5}
+            }
+        }
+    }
+    
+    # In-process cache for slowly changing API responses
+    RESPONSE_CACHE_ENABLED = True
+    RESPONSE_CACHE_SIZE = 1024      # entries
+    RESPONSE_CACHE_TTL = 300        # seconds; bounds staleness from writes outside the API
+    
+    # JSON encoder for responses: 'auto' uses orjson when installed, 'stdlib' never does
+    JSON_SERIALIZER = os.environ.get('JSON_SERIALIZER', 'auto')
+    
+    # Response compression negotiated on Accept-Encoding (brotli needs the optional package)
+    COMPRESSION_ENABLED = True
+    COMPRESSION_MIN_SIZE = 1024       # bytes; smaller bodies are sent as-is
+    COMPRESSION_LEVEL = int(os.environ.get('COMPRESSION_LEVEL', 6))                    # gzip, 1-9
+    COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', 5))  # brotli, 0-11
+    COMPRESSION_CACHE_SIZE = 512      # compressed bodies kept per process, keyed by ETag
+    
+    # Per-request statement counts and timings (X-DB-Queries, Server-Timing headers)
+    SQL_INSTRUMENTATION = os.environ.get('SQL_INSTRUMENTATION', '1') == '1'
+    SQL_SLOW_QUERY_MS = float(os.environ.get('SQL_SLOW_QUERY_MS', 100))  # logged with the query plan
+    
+    # Prometheus metrics at /metrics; set METRICS_MULTIPROC_DIR when running several worker processes
+    METRICS_ENABLED = True
+    METRICS_MULTIPROC_DIR = os.environ.get('METRICS_MULTIPROC_DIR')
+    METRICS_FLUSH_INTERVAL = 1.0      # seconds between a worker's metric file writes
+    
+    # Largest number of answers accepted by one batch review submission
+    REVIEW_BATCH_MAX_SIZE = 500
+    
     # CORS settings
     CORS_ORIGINS = [
         "http://localhost:8080",
@@ -0,0 +1,25 @@
+ALTER TABLE groups ADD COLUMN words_count INTEGER NOT NULL DEFAULT 0;
+
+CREATE TRIGGER IF NOT EXISTS words_groups_count_insert
+AFTER INSERT ON words_groups
+BEGIN
+    UPDATE groups SET words_count = words_count + 1 WHERE id = NEW.group_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_groups_count_delete
+AFTER DELETE ON words_groups
+BEGIN
+    UPDATE groups SET words_count = words_count - 1 WHERE id = OLD.group_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_groups_count_update
+AFTER UPDATE OF group_id ON words_groups
+WHEN OLD.group_id IS NOT NEW.group_id
+BEGIN
+    UPDATE groups SET words_count = words_count - 1 WHERE id = OLD.group_id;
+    UPDATE groups SET words_count = words_count + 1 WHERE id = NEW.group_id;
+END;
+
+UPDATE groups SET words_count = (
+    SELECT COUNT(*) FROM words_groups WHERE words_groups.group_id = groups.id
+);
@@ -0,0 +1,129 @@
+CREATE TABLE IF NOT EXISTS dashboard_stats (
+    id INTEGER PRIMARY KEY,
+    total_words INTEGER NOT NULL DEFAULT 0,
+    total_groups INTEGER NOT NULL DEFAULT 0,
+    total_activities INTEGER NOT NULL DEFAULT 0,
+    total_sessions INTEGER NOT NULL DEFAULT 0,
+    completed_sessions INTEGER NOT NULL DEFAULT 0,
+    total_reviews INTEGER NOT NULL DEFAULT 0,
+    correct_reviews INTEGER NOT NULL DEFAULT 0,
+    words_reviewed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS word_review_stats (
+    word_id INTEGER PRIMARY KEY,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    correct_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS words_rollup_insert AFTER INSERT ON words
+BEGIN
+    UPDATE dashboard_stats SET total_words = total_words + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_rollup_delete AFTER DELETE ON words
+BEGIN
+    UPDATE dashboard_stats SET total_words = total_words - 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS groups_rollup_insert AFTER INSERT ON groups
+BEGIN
+    UPDATE dashboard_stats SET total_groups = total_groups + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS groups_rollup_delete AFTER DELETE ON groups
+BEGIN
+    UPDATE dashboard_stats SET total_groups = total_groups - 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_activities_rollup_insert AFTER INSERT ON study_activities
+BEGIN
+    UPDATE dashboard_stats SET total_activities = total_activities + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_activities_rollup_delete AFTER DELETE ON study_activities
+BEGIN
+    UPDATE dashboard_stats SET total_activities = total_activities - 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_sessions_rollup_insert AFTER INSERT ON study_sessions
+BEGIN
+    UPDATE dashboard_stats
+    SET total_sessions = total_sessions + 1,
+        completed_sessions = completed_sessions + (NEW.ended_at IS NOT NULL)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_sessions_rollup_end AFTER UPDATE OF ended_at ON study_sessions
+BEGIN
+    UPDATE dashboard_stats
+    SET completed_sessions = completed_sessions
+        + (NEW.ended_at IS NOT NULL) - (OLD.ended_at IS NOT NULL)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_sessions_rollup_delete AFTER DELETE ON study_sessions
+BEGIN
+    UPDATE dashboard_stats
+    SET total_sessions = total_sessions - 1,
+        completed_sessions = completed_sessions - (OLD.ended_at IS NOT NULL)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS word_review_items_rollup_insert AFTER INSERT ON word_review_items
+BEGIN
+    UPDATE dashboard_stats
+    SET total_reviews = total_reviews + 1,
+        correct_reviews = correct_reviews + NEW.is_correct,
+        words_reviewed = words_reviewed + NOT EXISTS (
+            SELECT 1 FROM word_review_stats WHERE word_id = NEW.word_id
+        )
+    WHERE id = 1;
+    INSERT INTO word_review_stats (word_id, review_count, correct_count)
+    VALUES (NEW.word_id, 1, NEW.is_correct)
+    ON CONFLICT (word_id) DO UPDATE SET
+        review_count = review_count + 1,
+        correct_count = correct_count + excluded.correct_count;
+END;
+
+CREATE TRIGGER IF NOT EXISTS word_review_items_rollup_correct AFTER UPDATE OF is_correct ON word_review_items
+BEGIN
+    UPDATE dashboard_stats
+    SET correct_reviews = correct_reviews + NEW.is_correct - OLD.is_correct
+    WHERE id = 1;
+    UPDATE word_review_stats
+    SET correct_count = correct_count + NEW.is_correct - OLD.is_correct
+    WHERE word_id = NEW.word_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS word_review_items_rollup_delete AFTER DELETE ON word_review_items
+BEGIN
+    UPDATE word_review_stats
+    SET review_count = review_count - 1,
+        correct_count = correct_count - OLD.is_correct
+    WHERE word_id = OLD.word_id;
+    UPDATE dashboard_stats
+    SET total_reviews = total_reviews - 1,
+        correct_reviews = correct_reviews - OLD.is_correct,
+        words_reviewed = words_reviewed - EXISTS (
+            SELECT 1 FROM word_review_stats WHERE word_id = OLD.word_id AND review_count = 0
+        )
+    WHERE id = 1;
+    DELETE FROM word_review_stats WHERE word_id = OLD.word_id AND review_count = 0;
+END;
+
+INSERT OR REPLACE INTO dashboard_stats (id, total_words, total_groups, total_activities, total_sessions, completed_sessions, total_reviews, correct_reviews, words_reviewed) VALUES (
+    1,
+    (SELECT COUNT(*) FROM words),
+    (SELECT COUNT(*) FROM groups),
+    (SELECT COUNT(*) FROM study_activities),
+    (SELECT COUNT(*) FROM study_sessions),
+    (SELECT COUNT(*) FROM study_sessions WHERE ended_at IS NOT NULL),
+    (SELECT COUNT(*) FROM word_review_items),
+    (SELECT COUNT(*) FROM word_review_items WHERE is_correct),
+    (SELECT COUNT(DISTINCT word_id) FROM word_review_items)
+);
+
+DELETE FROM word_review_stats;
+INSERT INTO word_review_stats (word_id, review_count, correct_count)
+SELECT word_id, COUNT(*), SUM(is_correct) FROM word_review_items GROUP BY word_id;
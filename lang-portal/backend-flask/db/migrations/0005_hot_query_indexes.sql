@@ -0,0 +1,27 @@
+-- Per-session counts and reviewed-word lookups
+CREATE INDEX IF NOT EXISTS ix_word_review_items_session_id_is_correct
+    ON word_review_items (session_id, is_correct, word_id);
+
+-- Per-group statistics
+CREATE INDEX IF NOT EXISTS ix_word_review_items_group_id_is_correct
+    ON word_review_items (group_id, is_correct);
+
+-- Per-word totals (GROUP BY word_id)
+CREATE INDEX IF NOT EXISTS ix_word_review_items_word_id_is_correct
+    ON word_review_items (word_id, is_correct);
+
+CREATE INDEX IF NOT EXISTS ix_study_sessions_group_id
+    ON study_sessions (group_id);
+
+CREATE INDEX IF NOT EXISTS ix_study_sessions_study_activity_id
+    ON study_sessions (study_activity_id);
+
+CREATE INDEX IF NOT EXISTS ix_study_sessions_started_at
+    ON study_sessions (started_at);
+
+-- Membership lookups in both directions (this table has a surrogate id key)
+CREATE INDEX IF NOT EXISTS ix_words_groups_group_id_word_id
+    ON words_groups (group_id, word_id);
+
+CREATE INDEX IF NOT EXISTS ix_words_groups_word_id_group_id
+    ON words_groups (word_id, group_id);
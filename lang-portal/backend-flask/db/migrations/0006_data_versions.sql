@@ -0,0 +1,106 @@
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT OR IGNORE INTO data_versions (table_name) VALUES ('words');
+INSERT OR IGNORE INTO data_versions (table_name) VALUES ('groups');
+INSERT OR IGNORE INTO data_versions (table_name) VALUES ('words_groups');
+INSERT OR IGNORE INTO data_versions (table_name) VALUES ('study_activities');
+
+CREATE TRIGGER IF NOT EXISTS words_version_insert
+AFTER INSERT ON words
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'words';
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_version_update
+AFTER UPDATE ON words
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'words';
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_version_delete
+AFTER DELETE ON words
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'words';
+END;
+
+CREATE TRIGGER IF NOT EXISTS groups_version_insert
+AFTER INSERT ON groups
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS groups_version_update
+AFTER UPDATE ON groups
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS groups_version_delete
+AFTER DELETE ON groups
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_groups_version_insert
+AFTER INSERT ON words_groups
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'words_groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_groups_version_update
+AFTER UPDATE ON words_groups
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'words_groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_groups_version_delete
+AFTER DELETE ON words_groups
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'words_groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_activities_version_insert
+AFTER INSERT ON study_activities
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'study_activities';
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_activities_version_update
+AFTER UPDATE ON study_activities
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'study_activities';
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_activities_version_delete
+AFTER DELETE ON study_activities
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE table_name = 'study_activities';
+END;
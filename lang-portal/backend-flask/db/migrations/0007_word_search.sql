@@ -0,0 +1,31 @@
+CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
+    nepali_word,
+    romanized_nepali_word,
+    english_word,
+    content='words',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+INSERT INTO words_fts (words_fts) VALUES ('rebuild');
+
+CREATE TRIGGER IF NOT EXISTS words_fts_insert AFTER INSERT ON words
+BEGIN
+    INSERT INTO words_fts (rowid, nepali_word, romanized_nepali_word, english_word)
+    VALUES (NEW.id, NEW.nepali_word, NEW.romanized_nepali_word, NEW.english_word);
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_fts_delete AFTER DELETE ON words
+BEGIN
+    INSERT INTO words_fts (words_fts, rowid, nepali_word, romanized_nepali_word, english_word)
+    VALUES ('delete', OLD.id, OLD.nepali_word, OLD.romanized_nepali_word, OLD.english_word);
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_fts_update
+AFTER UPDATE OF nepali_word, romanized_nepali_word, english_word ON words
+BEGIN
+    INSERT INTO words_fts (words_fts, rowid, nepali_word, romanized_nepali_word, english_word)
+    VALUES ('delete', OLD.id, OLD.nepali_word, OLD.romanized_nepali_word, OLD.english_word);
+    INSERT INTO words_fts (rowid, nepali_word, romanized_nepali_word, english_word)
+    VALUES (NEW.id, NEW.nepali_word, NEW.romanized_nepali_word, NEW.english_word);
+END;
@@ -0,0 +1,75 @@
+CREATE TABLE IF NOT EXISTS word_schedules (
+    word_id INTEGER NOT NULL,
+    group_id INTEGER NOT NULL,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    ease_factor FLOAT NOT NULL DEFAULT 2.5,
+    interval_days FLOAT NOT NULL DEFAULT 0,
+    lapses INTEGER NOT NULL DEFAULT 0,
+    last_reviewed_at DATETIME NOT NULL,
+    due_at DATETIME NOT NULL,
+    PRIMARY KEY (word_id, group_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_word_schedules_group_id_due_at
+    ON word_schedules (group_id, due_at);
+
+CREATE TRIGGER IF NOT EXISTS word_review_items_schedule AFTER INSERT ON word_review_items
+BEGIN
+    INSERT INTO word_schedules (
+        word_id, group_id, repetitions, ease_factor, interval_days, lapses, last_reviewed_at, due_at
+    )
+    SELECT
+        NEW.word_id, NEW.group_id,
+        NEW.is_correct,
+        CASE WHEN NEW.is_correct THEN 2.6 ELSE 1.96 END,
+        1,
+        1 - NEW.is_correct,
+        NEW.created_at,
+        datetime(NEW.created_at, '+1 days')
+    WHERE true
+    ON CONFLICT (word_id, group_id) DO UPDATE SET
+        repetitions = CASE WHEN excluded.repetitions THEN repetitions + 1 ELSE 0 END,
+        ease_factor = MAX(1.3, ease_factor + CASE WHEN excluded.repetitions THEN 0.1 ELSE -0.54 END),
+        interval_days = CASE
+            WHEN NOT excluded.repetitions OR repetitions = 0 THEN 1
+            WHEN repetitions = 1 THEN 6
+            ELSE ROUND(interval_days * ease_factor, 2)
+        END,
+        lapses = lapses + excluded.lapses,
+        last_reviewed_at = excluded.last_reviewed_at,
+        due_at = datetime(excluded.last_reviewed_at, '+' || CASE
+            WHEN NOT excluded.repetitions OR repetitions = 0 THEN 1
+            WHEN repetitions = 1 THEN 6
+            ELSE ROUND(interval_days * ease_factor, 2)
+        END || ' days');
+END;
+
+-- Backfill from existing review history
+DELETE FROM word_schedules;
+INSERT INTO word_schedules (
+    word_id, group_id, repetitions, ease_factor, interval_days, lapses, last_reviewed_at, due_at
+)
+SELECT
+    word_id, group_id,
+    is_correct,
+    CASE WHEN is_correct THEN 2.6 ELSE 1.96 END,
+    1,
+    1 - is_correct,
+    created_at,
+    datetime(created_at, '+1 days')
+FROM word_review_items WHERE true ORDER BY created_at, id
+ON CONFLICT (word_id, group_id) DO UPDATE SET
+    repetitions = CASE WHEN excluded.repetitions THEN repetitions + 1 ELSE 0 END,
+    ease_factor = MAX(1.3, ease_factor + CASE WHEN excluded.repetitions THEN 0.1 ELSE -0.54 END),
+    interval_days = CASE
+        WHEN NOT excluded.repetitions OR repetitions = 0 THEN 1
+        WHEN repetitions = 1 THEN 6
+        ELSE ROUND(interval_days * ease_factor, 2)
+    END,
+    lapses = lapses + excluded.lapses,
+    last_reviewed_at = excluded.last_reviewed_at,
+    due_at = datetime(excluded.last_reviewed_at, '+' || CASE
+        WHEN NOT excluded.repetitions OR repetitions = 0 THEN 1
+        WHEN repetitions = 1 THEN 6
+        ELSE ROUND(interval_days * ease_factor, 2)
+    END || ' days');
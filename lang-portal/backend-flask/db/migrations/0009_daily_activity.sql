@@ -0,0 +1,50 @@
+CREATE TABLE IF NOT EXISTS daily_activity (
+    day DATE PRIMARY KEY,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    session_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS word_review_items_daily_insert AFTER INSERT ON word_review_items
+BEGIN
+    INSERT INTO daily_activity (day, review_count, correct_count, session_count)
+    VALUES (date(NEW.created_at), 1, NEW.is_correct, 0)
+    ON CONFLICT (day) DO UPDATE SET
+        review_count = review_count + 1,
+        correct_count = correct_count + excluded.correct_count;
+END;
+
+CREATE TRIGGER IF NOT EXISTS word_review_items_daily_delete AFTER DELETE ON word_review_items
+BEGIN
+    UPDATE daily_activity
+    SET review_count = review_count - 1,
+        correct_count = correct_count - OLD.is_correct
+    WHERE day = date(OLD.created_at);
+    DELETE FROM daily_activity
+    WHERE day = date(OLD.created_at) AND review_count = 0 AND session_count = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_sessions_daily_insert AFTER INSERT ON study_sessions
+BEGIN
+    INSERT INTO daily_activity (day, review_count, correct_count, session_count)
+    VALUES (date(NEW.started_at), 0, 0, 1)
+    ON CONFLICT (day) DO UPDATE SET session_count = session_count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_sessions_daily_delete AFTER DELETE ON study_sessions
+BEGIN
+    UPDATE daily_activity SET session_count = session_count - 1
+    WHERE day = date(OLD.started_at);
+    DELETE FROM daily_activity
+    WHERE day = date(OLD.started_at) AND review_count = 0 AND session_count = 0;
+END;
+
+-- Backfill from existing history
+DELETE FROM daily_activity;
+INSERT INTO daily_activity (day, review_count, correct_count, session_count)
+SELECT day, SUM(reviews), SUM(correct), SUM(sessions) FROM (
+    SELECT date(created_at) AS day, COUNT(*) AS reviews, SUM(is_correct) AS correct, 0 AS sessions
+    FROM word_review_items GROUP BY day
+    UNION ALL
+    SELECT date(started_at), 0, 0, COUNT(*) FROM study_sessions GROUP BY 1
+) GROUP BY day;
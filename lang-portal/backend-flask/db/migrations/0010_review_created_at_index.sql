@@ -0,0 +1,3 @@
+-- Time-range exports, in created_at order
+CREATE INDEX IF NOT EXISTS ix_word_review_items_created_at
+    ON word_review_items (created_at);
@@ -0,0 +1,3 @@
+-- Duplicate checks on the natural key during imports
+CREATE INDEX IF NOT EXISTS ix_words_nepali_word_english_word
+    ON words (nepali_word, english_word);
@@ -0,0 +1,37 @@
+-- Cap SM-2 intervals at 36500 days; longer ones overflow datetime() into a NULL due_at
+DROP TRIGGER IF EXISTS word_review_items_schedule;
+
+CREATE TRIGGER IF NOT EXISTS word_review_items_schedule AFTER INSERT ON word_review_items
+BEGIN
+    INSERT INTO word_schedules (
+        word_id, group_id, repetitions, ease_factor, interval_days, lapses, last_reviewed_at, due_at
+    )
+    SELECT
+        NEW.word_id, NEW.group_id,
+        NEW.is_correct,
+        CASE WHEN NEW.is_correct THEN 2.6 ELSE 1.96 END,
+        1,
+        1 - NEW.is_correct,
+        NEW.created_at,
+        datetime(NEW.created_at, '+1 days')
+    WHERE true
+    ON CONFLICT (word_id, group_id) DO UPDATE SET
+        repetitions = CASE WHEN excluded.repetitions THEN repetitions + 1 ELSE 0 END,
+        ease_factor = MAX(1.3, ease_factor + CASE WHEN excluded.repetitions THEN 0.1 ELSE -0.54 END),
+        interval_days = CASE
+            WHEN NOT excluded.repetitions OR repetitions = 0 THEN 1
+            WHEN repetitions = 1 THEN 6
+            ELSE MIN(ROUND(interval_days * ease_factor, 2), 36500)
+        END,
+        lapses = lapses + excluded.lapses,
+        last_reviewed_at = excluded.last_reviewed_at,
+        due_at = datetime(excluded.last_reviewed_at, '+' || CASE
+            WHEN NOT excluded.repetitions OR repetitions = 0 THEN 1
+            WHEN repetitions = 1 THEN 6
+            ELSE MIN(ROUND(interval_days * ease_factor, 2), 36500)
+        END || ' days');
+END;
+
+UPDATE word_schedules
+SET interval_days = 36500, due_at = datetime(last_reviewed_at, '+36500 days')
+WHERE interval_days > 36500;
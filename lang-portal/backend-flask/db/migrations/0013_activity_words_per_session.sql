@@ -0,0 +1,2 @@
+-- Words handed out when a session of the activity starts; NULL uses the API default
+ALTER TABLE study_activities ADD COLUMN words_per_session INTEGER;
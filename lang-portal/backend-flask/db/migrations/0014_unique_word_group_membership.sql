@@ -0,0 +1,9 @@
+-- One membership row per (word, group), so re-running the seed's INSERT OR IGNORE
+-- skips existing pairs. Duplicates are dropped first; the delete trigger keeps
+-- groups.words_count in step. rowid works whether or not the table has an id column.
+DELETE FROM words_groups
+WHERE rowid NOT IN (SELECT MIN(rowid) FROM words_groups GROUP BY word_id, group_id);
+
+DROP INDEX IF EXISTS ix_words_groups_word_id_group_id;
+CREATE UNIQUE INDEX IF NOT EXISTS ix_words_groups_word_id_group_id
+    ON words_groups (word_id, group_id);
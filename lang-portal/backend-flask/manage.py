@@ -1,3 +1,4 @@
+import click
 from flask.cli import FlaskGroup
 from app import create_app, db
 from app.models import Word, Group, StudyActivity, StudySession, WordReviewItem
@@ -11,5 +12,70 @@ def init_db():
     db.create_all()
     print("Initialized database")
 
+@cli.command("repair-counts")
+def repair_counts():
+    """Backfill and repair denormalized group word counts."""
+    from app.utils.maintenance import rebuild_group_word_counts
+    drifted = rebuild_group_word_counts()
+    print(f"Repaired word counts ({drifted} groups were out of date)")
+
+@cli.command("verify-rollups")
+@click.option("--repair", is_flag=True, help="Overwrite drifted rollups with rebuilt values.")
+def verify_rollups_command(repair):
+    """Rebuild dashboard rollups from scratch and report drift."""
+    from app.utils.maintenance import verify_rollups
+    drift = verify_rollups(repair=repair)
+    if not drift:
+        print("Rollups are consistent")
+        return
+    for name, values in drift.items():
+        print(f"{name}: {values}")
+    print("Rollups repaired" if repair else "Rollups have drifted; re-run with --repair to fix")
+
+@cli.command("rebuild-schedules")
+def rebuild_schedules():
+    """Rebuild spaced-repetition schedules from review history."""
+    from app.utils.maintenance import rebuild_word_schedules
+    count = rebuild_word_schedules()
+    print(f"Rebuilt {count} word schedules")
+
+@cli.command("export-reviews")
+@click.option("--format", "export_format", type=click.Choice(["ndjson", "csv"]), default="ndjson")
+@click.option("--since", help="Only reviews at or after this ISO date/datetime (UTC).")
+@click.option("--until", help="Only reviews before this ISO date/datetime (UTC).")
+@click.option("--output", type=click.File("w", encoding="utf-8"), default="-", help="Defaults to stdout.")
+def export_reviews_command(export_format, since, until, output):
+    """Stream review history as NDJSON or CSV."""
+    from app.utils.export import export_reviews, parse_export_bound
+    try:
+        since = parse_export_bound(since, "since")
+        until = parse_export_bound(until, "until")
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    for chunk in export_reviews(export_format, since=since, until=until):
+        output.write(chunk)
+
+@cli.command("import-words")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "import_format", type=click.Choice(["csv", "ndjson"]),
+              help="Defaults to the file extension.")
+@click.option("--chunk-size", default=2000, show_default=True)
+def import_words_command(path, import_format, chunk_size):
+    """Bulk import words from a CSV or NDJSON file."""
+    from app.utils.word_import import import_words, ImportAborted
+    import_format = import_format or ("csv" if path.endswith(".csv") else "ndjson")
+    aborted = None
+    with open(path, "rb") as f:
+        try:
+            report = import_words(f, import_format, chunk_size=chunk_size)
+        except ImportAborted as e:
+            aborted, report = e, e.report
+    print(f"Imported {report['inserted']} words in {report['elapsed_seconds']}s "
+          f"({report['duplicates']} duplicates skipped, {report['failed']} rows failed)")
+    for error in report["errors"]:
+        print(f"  line {error['line']}: {'; '.join(error['errors'])}")
+    if aborted is not None:
+        raise click.ClickException(f"Import stopped part way: {aborted.__cause__}")
+
 if __name__ == '__main__':
     cli()
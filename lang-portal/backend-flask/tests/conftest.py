@@ -1,6 +1,8 @@
 import os
+import sqlite3
 import sys
 import pytest
+from contextlib import contextmanager
 from datetime import datetime, UTC
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session, Session
@@ -11,6 +13,8 @@ sys.path.insert(0, project_root)
 
 from app import create_app, db
 from app.models import Word, Group, StudyActivity, StudySession, WordReviewItem
+from app.utils.maintenance import run_migrations
+from app.utils.query_stats import capture_queries
 from config import Config
 from tests.fixtures.test_data import SAMPLE_WORDS, SAMPLE_GROUPS, SAMPLE_ACTIVITIES
 
@@ -56,6 +60,41 @@ def session(app):
     transaction.rollback()
     connection.close()
 
+def apply_migrations(path):
+    """Build a database file the way ``invoke migrate`` does, from db/migrations alone"""
+    connection = sqlite3.connect(path)
+    run_migrations(connection, Config.MIGRATIONS_DIR)
+    connection.close()
+
+@pytest.fixture
+def migrated_app(tmp_path):
+    """An app on a database built from the SQL migrations rather than create_all"""
+    path = tmp_path / 'migrated.db'
+    apply_migrations(path)
+
+    class MigratedConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+
+    app = create_app(MigratedConfig)
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def query_budget(app):
+    """Assert a block runs at most a number of SQL statements: ``with query_budget(3): ...``"""
+    @contextmanager
+    def budget(limit):
+        # Start cold so identity-map hits left by fixtures do not hide queries
+        db.session.expunge_all()
+        with capture_queries() as stats:
+            yield stats
+        assert stats.count <= limit, (
+            f"{stats.count} statements, budget {limit}:\n" + "\n".join(stats.statements.elements())
+        )
+    return budget
+
 @pytest.fixture
 def sample_words(session):
     """Create sample words with proper initialization"""
@@ -142,3 +181,43 @@ def sample_full_data(session, sample_words, sample_groups, sample_activities, sa
         'activities': sample_activities,
         'session': sample_study_session
     }
+
+@pytest.fixture
+def study_session(session, sample_groups, sample_activities):
+    """A session on the first sample group and activity"""
+    study_session = StudySession(group_id=sample_groups[0].id, study_activity_id=sample_activities[0].id)
+    session.add(study_session)
+    session.commit()
+    return study_session
+
+@pytest.fixture
+def review(session, study_session):
+    """Record a review in study_session: ``review(word, is_correct=True, created_at=None)``"""
+    def add(word, is_correct=True, created_at=None):
+        item = WordReviewItem(word_id=word.id, session_id=study_session.id,
+                              group_id=study_session.group_id, is_correct=is_correct)
+        if created_at is not None:
+            item.created_at = created_at
+        session.add(item)
+        session.flush()
+        return item
+    return add
+
+@pytest.fixture
+def history(session, sample_full_data):
+    """A group with words, a session and a few reviews"""
+    group = sample_full_data['groups'][0]
+    activity = sample_full_data['activities'][0]
+    study_session = StudySession(group_id=group.id, study_activity_id=activity.id)
+    session.add(study_session)
+    session.flush()
+    for word in sample_full_data['words']:
+        session.add(WordReviewItem(word_id=word.id, session_id=study_session.id,
+                                   group_id=group.id, is_correct=True))
+    session.commit()
+    return {
+        'group_id': group.id,
+        'activity_id': activity.id,
+        'session_id': study_session.id,
+        'word_id': sample_full_data['words'][0].id
+    }
@@ -241,6 +241,34 @@ class TestPaginationBehavior:
             assert response.status_code == 400
             assert response.json['error_code'] == 'VALIDATION_ERROR'
 
+    @pytest.mark.parametrize("endpoint", [
+        '/api/words',
+        '/api/groups',
+        '/api/study-sessions'
+    ])
+    def test_cursor_pagination(self, client, endpoint, sample_words, sample_groups, sample_study_session):
+        """Test walking every page with keyset cursors"""
+        seen = []
+        url = f'{endpoint}?per_page=1&cursor='
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200
+            pagination = response.json['meta']['pagination']
+            assert pagination['mode'] == 'cursor'
+            assert 'total_items' not in pagination
+            items = next(iter(response.json['data'].values()))
+            seen.extend(item['id'] for item in items)
+            url = f"{endpoint}?per_page=1&cursor={pagination['next_cursor']}" if pagination['has_next'] else None
+
+        offset = client.get(f'{endpoint}?per_page=50').json
+        assert seen == sorted(item['id'] for item in next(iter(offset['data'].values())))
+
+    def test_invalid_cursor(self, client):
+        """Test malformed cursors are rejected"""
+        response = client.get('/api/words?cursor=not-a-cursor')
+        assert response.status_code == 400
+        assert response.json['error_code'] == 'VALIDATION_ERROR'
+
 class TestDataManagement:
     """Test data management endpoints"""
     def test_reset_operations(self, client, sample_word_reviews):
@@ -0,0 +1,89 @@
+import json
+import pytest
+from sqlalchemy import inspect, text
+from app import db
+from app.models import Word, Group, StudySession, WordReviewItem
+from app.utils.bulk_load import load_seeds, iter_json_array
+from app.utils.maintenance import verify_rollups
+
+SEEDS = {
+    'activities.json': [{'name': 'Flashcards', 'description': 'Cards', 'instructions': 'Flip', 'thumbnail': 'cards.jpg'}],
+    'groups.json': [{'name': 'Greetings', 'description': 'Hello'}, {'name': 'Food', 'description': 'Eat'}],
+    'words.json': [
+        {'nepali_word': 'नमस्ते', 'romanized_nepali_word': 'namaste', 'english_word': 'hello',
+         'part_of_speech': '["greeting"]'},
+        {'nepali_word': 'भात', 'romanized_nepali_word': 'bhaat', 'english_word': 'rice',
+         'part_of_speech': ['noun']},
+    ],
+    'words_groups.json': [
+        {'nepali_word': 'नमस्ते', 'group_name': 'Greetings'},
+        {'nepali_word': 'भात', 'group_name': 'Food'},
+    ],
+    'sessions.json': [{
+        'group_name': 'Greetings', 'activity_name': 'Flashcards',
+        'started_at': '2025-01-01T10:00:00', 'ended_at': '2025-01-01T10:05:00Z',
+        'reviews': [
+            {'nepali_word': 'नमस्ते', 'is_correct': True, 'created_at': '2025-01-01T10:01:00'},
+            {'nepali_word': 'नमस्ते', 'is_correct': False, 'created_at': '2025-01-01T10:02:00'},
+        ]
+    }]
+}
+
+@pytest.fixture
+def seeds_dir(tmp_path):
+    for filename, rows in SEEDS.items():
+        (tmp_path / filename).write_text(json.dumps(rows, ensure_ascii=False), encoding='utf-8')
+    return tmp_path
+
+def test_iter_json_array_streams_across_buffers(tmp_path):
+    """Test objects split across read buffers are decoded intact"""
+    path = tmp_path / 'rows.json'
+    rows = [{'id': i, 'text': 'नमस्ते ' * i} for i in range(50)]
+    path.write_text(json.dumps(rows, indent=2, ensure_ascii=False), encoding='utf-8')
+    assert list(iter_json_array(path, buffer_size=7)) == rows
+
+    path.write_text('[{"id": 1}, {"id":', encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(iter_json_array(path, buffer_size=4))
+
+def test_load_seeds(app, seeds_dir):
+    """Test seeds load with relations resolved and rollups in step"""
+    summary = load_seeds(seeds_dir, chunk_size=1, report=lambda message: None)
+    assert summary['words'] == {'inserted': 2, 'skipped': 0}
+    assert summary['word_review_items'] == {'inserted': 2, 'skipped': 0}
+
+    greetings = Group.query.filter_by(name='Greetings').one()
+    assert greetings.total_words == 1
+    assert Word.query.filter_by(english_word='rice').one().part_of_speech_list == ['noun']
+    study_session = StudySession.query.one()
+    assert study_session.group_id == greetings.id
+    assert WordReviewItem.query.filter_by(session_id=study_session.id).count() == 2
+    assert verify_rollups() == {}
+
+    indexes = {index['name'] for index in inspect(db.engine).get_indexes('word_review_items')}
+    assert 'ix_word_review_items_word_id_is_correct' in indexes
+
+def test_load_seeds_is_idempotent(app, seeds_dir):
+    """Test a re-run skips rows that are already present"""
+    load_seeds(seeds_dir, report=lambda message: None)
+    summary = load_seeds(seeds_dir, report=lambda message: None)
+    assert all(counts['inserted'] == 0 for counts in summary.values())
+    assert summary['words_groups']['skipped'] == 2
+    assert Word.query.count() == 2
+    assert WordReviewItem.query.count() == 2
+
+def test_load_seeds_rolls_back_on_unknown_reference(app, seeds_dir):
+    """Test a dangling reference aborts the whole load"""
+    (seeds_dir / 'words_groups.json').write_text(
+        json.dumps([{'nepali_word': 'missing', 'group_name': 'Food'}]), encoding='utf-8')
+    with pytest.raises(ValueError, match="unknown word 'missing'"):
+        load_seeds(seeds_dir, report=lambda message: None)
+    assert Word.query.count() == 0
+
+def test_load_seeds_twice_on_migrated_schema(migrated_app, seeds_dir):
+    """Test a re-run skips memberships on the migration-built schema too"""
+    load_seeds(seeds_dir, report=lambda message: None)
+    summary = load_seeds(seeds_dir, report=lambda message: None)
+    assert summary['words_groups'] == {'inserted': 0, 'skipped': 2}
+    assert db.session.execute(text("SELECT COUNT(*) FROM words_groups")).scalar() == 2
+    assert Group.query.filter_by(name='Greetings').one().total_words == 1
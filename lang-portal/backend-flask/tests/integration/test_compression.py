@@ -0,0 +1,96 @@
+import gzip
+import json
+import pytest
+from app.models import Word
+from app.utils import compression
+
+@pytest.fixture
+def many_words(session):
+    """Enough words for a page well above the compression threshold"""
+    for i in range(40):
+        session.add(Word(nepali_word=f'शब्द{i}', romanized_nepali_word=f'shabda{i}',
+                         english_word=f'word {i}', part_of_speech=['noun']))
+    session.commit()
+
+def _gzip_get(client, url, **headers):
+    return client.get(url, headers={'Accept-Encoding': 'gzip', **headers})
+
+def test_gzip_negotiated(client, many_words):
+    """Test a large JSON page is gzipped when the client accepts it"""
+    plain = client.get('/api/words?per_page=40')
+    response = _gzip_get(client, '/api/words?per_page=40')
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert int(response.headers['Content-Length']) == len(response.data) < len(plain.data)
+    body = json.loads(gzip.decompress(response.data))
+    assert body['data'] == plain.json['data']
+
+def test_no_accept_encoding_is_identity(client, many_words):
+    """Test clients that do not ask for compression get the plain body"""
+    response = client.get('/api/words?per_page=40')
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+    refused = client.get('/api/words?per_page=40', headers={'Accept-Encoding': 'gzip;q=0'})
+    assert 'Content-Encoding' not in refused.headers
+
+def test_small_responses_not_compressed(client, many_words):
+    """Test bodies under COMPRESSION_MIN_SIZE are sent as-is"""
+    response = _gzip_get(client, '/api/words?per_page=1')
+    assert 'Content-Encoding' not in response.headers
+
+def test_compression_disabled(app, client, many_words):
+    """Test COMPRESSION_ENABLED turns compression off"""
+    app.config['COMPRESSION_ENABLED'] = False
+    response = _gzip_get(client, '/api/words?per_page=40')
+    assert 'Content-Encoding' not in response.headers
+
+def test_encoded_etag_round_trip(client, many_words):
+    """Test the compressed representation has its own ETag that still validates"""
+    plain_etag = client.get('/api/words?per_page=40').headers['ETag']
+    response = _gzip_get(client, '/api/words?per_page=40')
+    etag = response.headers['ETag']
+    assert etag != plain_etag and etag.startswith(plain_etag[:-1])
+
+    response = _gzip_get(client, '/api/words?per_page=40', **{'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+def test_compressed_body_cached_by_etag(app, client, many_words, monkeypatch):
+    """Test repeat requests for unchanged data reuse the compressed body"""
+    calls = []
+    original = compression.compress
+    monkeypatch.setattr(compression, 'compress', lambda *args: calls.append(args) or original(*args))
+
+    first = _gzip_get(client, '/api/words?per_page=40')
+    second = _gzip_get(client, '/api/words?per_page=40')
+
+    assert len(calls) == 1
+    assert second.data == first.data
+    assert app.extensions['compression_cache'].stats()['hits'] == 1
+
+def test_uncacheable_responses_compressed(client, session, many_words, sample_groups, sample_activities):
+    """Test POST responses without an ETag are still compressed"""
+    group = sample_groups[0]
+    group.words.extend(Word.query.all())
+    session.commit()
+
+    response = client.post('/api/study-activities',
+                           json={'group_id': group.id, 'study_activity_id': sample_activities[0].id},
+                           headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'ETag' not in response.headers
+    assert len(json.loads(gzip.decompress(response.data))['words']) == 40
+
+def test_streamed_exports_not_compressed(client, many_words):
+    """Test streamed responses pass through untouched"""
+    response = _gzip_get(client, '/api/reviews/export')
+    assert 'Content-Encoding' not in response.headers
+
+def test_brotli_preferred_when_installed(client, many_words):
+    """Test brotli wins over gzip when the package is available"""
+    brotli = pytest.importorskip('brotli')
+    response = client.get('/api/words?per_page=40', headers={'Accept-Encoding': 'gzip, br'})
+    assert response.headers['Content-Encoding'] == 'br'
+    assert json.loads(brotli.decompress(response.data))['success'] is True
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import event, text
+from app import db
+from app.models import Word
+
+@pytest.mark.parametrize("endpoint", [
+    '/api/words',
+    '/api/groups',
+    '/api/study-activities'
+])
+def test_etag_round_trip(client, endpoint, sample_words, sample_groups, sample_activities):
+    """Test a matching If-None-Match gets 304 with no body"""
+    response = client.get(endpoint)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert not etag.startswith('W/')
+    assert 'Last-Modified' in response.headers
+
+    response = client.get(endpoint, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+def test_not_modified_skips_query(client, sample_words):
+    """Test a 304 only reads the version counters"""
+    etag = client.get('/api/words').headers['ETag']
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = client.get('/api/words', headers={'If-None-Match': etag})
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert 'data_versions' in statements[0]
+
+def test_etag_changes_on_write(client, session, sample_words, sample_groups):
+    """Test writes to a read table invalidate the ETag"""
+    words_etag = client.get('/api/words').headers['ETag']
+    groups_etag = client.get('/api/groups').headers['ETag']
+
+    session.add(Word(nepali_word='नयाँ', romanized_nepali_word='naya',
+                     english_word='new', part_of_speech=['adjective']))
+    session.commit()
+
+    response = client.get('/api/words', headers={'If-None-Match': words_etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != words_etag
+    assert client.get('/api/groups', headers={'If-None-Match': groups_etag}).status_code == 304
+
+def test_etag_depends_on_query(client, sample_words):
+    """Test different pages get different validators"""
+    first = client.get('/api/words?page=1&per_page=1').headers['ETag']
+    second = client.get('/api/words?page=2&per_page=1').headers['ETag']
+    assert first != second
+
+def test_if_modified_since(client, session, sample_words):
+    """Test Last-Modified revalidation without an ETag"""
+    session.execute(text("UPDATE data_versions SET updated_at = datetime('now', '-1 minute')"))
+    session.commit()
+    last_modified = client.get('/api/words').headers['Last-Modified']
+    response = client.get('/api/words', headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 304
+
+def test_if_modified_since_same_second_write(client, session, sample_words):
+    """Test a write in the same second as the copy the client holds is not answered with 304"""
+    last_modified = client.get('/api/words').headers['Last-Modified']
+    session.add(Word(nepali_word='पानी', romanized_nepali_word='paani',
+                     english_word='water', part_of_speech=['noun']))
+    session.commit()
+    response = client.get('/api/words', headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 200
+    assert len(response.json['data']['words']) == len(sample_words) + 1
@@ -0,0 +1,78 @@
+import pytest
+from datetime import datetime, date, timedelta, UTC
+from sqlalchemy import text
+from app import db
+from app.models import DailyActivity
+from app.utils.maintenance import verify_rollups
+from app.utils.statistics import get_streak, STREAK_PAGE_SIZE
+
+def _noon(day):
+    return datetime.combine(day, datetime.min.time(), UTC) + timedelta(hours=12)
+
+def _activity():
+    return {row.day: (row.review_count, row.correct_count, row.session_count)
+            for row in db.session.execute(db.select(DailyActivity)).scalars()}
+
+class TestDailyActivity:
+    """Test the per-day activity rollup and streaks computed from it"""
+    def test_rollup_follows_writes(self, session, review, sample_full_data):
+        """Test reviews and sessions are counted on their day and removed on delete"""
+        word = sample_full_data['words'][0]
+        today = datetime.now(UTC).date()
+        review(word, created_at=_noon(today))
+        review(word, is_correct=False, created_at=_noon(today))
+        review(word, created_at=_noon(today - timedelta(days=3)))
+        session.commit()
+
+        activity = _activity()
+        assert activity[today - timedelta(days=3)] == (1, 1, 0)
+        assert activity[today][:2] == (2, 1)
+
+        session.execute(text("DELETE FROM word_review_items"))
+        session.commit()
+        assert today - timedelta(days=3) not in _activity()
+        assert verify_rollups() == {}
+
+    @pytest.mark.parametrize("offsets,current,longest", [
+        ([0, 1, 2, 5, 6], 3, 3),      # active today
+        ([1, 2, 10, 11, 12, 13], 2, 4),  # not yet active today, streak still alive
+        ([2, 3], 0, 2),               # missed yesterday
+        ([], 0, 0),
+    ])
+    def test_streaks(self, session, offsets, current, longest):
+        """Test current and longest streaks over the rollup"""
+        today = date(2025, 3, 1)
+        session.add_all(DailyActivity(day=today - timedelta(days=offset), review_count=1) for offset in offsets)
+        session.commit()
+        assert get_streak(today) == {"current_streak": current, "longest_streak": longest}
+
+    def test_streak_walk_spans_pages(self, session):
+        """Test a streak longer than one page of the backward walk"""
+        today = date(2025, 3, 1)
+        length = STREAK_PAGE_SIZE * 2 + 5
+        session.add_all(DailyActivity(day=today - timedelta(days=offset), review_count=1) for offset in range(length))
+        session.add(DailyActivity(day=today - timedelta(days=length + 1), review_count=1))
+        session.commit()
+        assert get_streak(today) == {"current_streak": length, "longest_streak": length}
+
+    def test_dashboard_exposes_streak(self, client, session, review, sample_full_data):
+        """Test the statistics endpoint reports streaks from today's activity"""
+        word = sample_full_data['words'][0]
+        today = datetime.now(UTC).date()
+        review(word, created_at=_noon(today))
+        review(word, created_at=_noon(today - timedelta(days=1)))
+        session.commit()
+
+        data = client.get('/api/dashboard/statistics').json['data']
+        assert data['current_streak'] == 2
+        assert data['longest_streak'] == 2
+
+    def test_verify_repairs_daily_drift(self, session, review, sample_full_data):
+        """Test drifted daily rows are reported and rebuilt"""
+        review(sample_full_data['words'][0], created_at=_noon(datetime.now(UTC).date()))
+        session.commit()
+        session.execute(text("UPDATE daily_activity SET review_count = 99"))
+        session.commit()
+
+        assert verify_rollups(repair=True)['daily_activity'] == 2
+        assert verify_rollups() == {}
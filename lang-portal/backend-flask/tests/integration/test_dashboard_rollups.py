@@ -0,0 +1,63 @@
+from sqlalchemy import text
+from app import db
+from app.utils.maintenance import verify_rollups
+
+class TestDashboardRollups:
+    """Test trigger-maintained dashboard rollups"""
+    def test_rollups_follow_writes(self, client, session, sample_words, sample_groups, sample_activities,
+                                   study_session, review):
+        """Test dashboard totals track inserts, session ends and resets"""
+        review(sample_words[0], True)
+        review(sample_words[0], False)
+        review(sample_words[1], True)
+        session.commit()
+
+        response = client.post(f'/api/study-sessions/{study_session.id}/end')
+        assert response.status_code == 200
+
+        overview = client.get('/api/dashboard').json['data']
+        assert overview['total_words'] == len(sample_words)
+        assert overview['total_groups'] == len(sample_groups)
+        assert overview['total_study_sessions'] == 1
+
+        stats = client.get('/api/dashboard/statistics').json['data']
+        assert stats['total_reviews'] == 3
+        assert stats['words_learned'] == 2
+        assert stats['study_sessions_completed'] == 1
+        assert round(stats['average_score'], 2) == 66.67
+
+        progress = client.get('/api/dashboard/study-progress').json['data']['progress']
+        assert progress['total_words_studied'] == 2
+        assert progress['total_activities'] == len(sample_activities)
+
+        assert verify_rollups() == {}
+
+        client.post('/api/reset-history')
+        stats = client.get('/api/dashboard/statistics').json['data']
+        assert stats['total_reviews'] == 0
+        assert stats['words_learned'] == 0
+        assert stats['study_sessions_completed'] == 0
+        assert verify_rollups() == {}
+
+    def test_verify_rollups_repairs_drift(self, app, session, sample_words):
+        """Test the verification rebuild reports and repairs drift"""
+        db.session.execute(text("UPDATE dashboard_stats SET total_words = 99"))
+        db.session.execute(text("INSERT INTO word_review_stats (word_id, review_count) VALUES (1, 5)"))
+        db.session.commit()
+
+        drift = verify_rollups(repair=True)
+        assert drift['total_words'] == {'stored': 99, 'actual': len(sample_words)}
+        assert drift['word_review_stats'] == 1
+        assert verify_rollups() == {}
+
+    def test_verify_rollups_reports_missing_stats_rows(self, app, session, sample_words, review):
+        """Test a word_review_stats row missing from the stored side counts as drift"""
+        review(sample_words[0], True)
+        review(sample_words[1], False)
+        session.commit()
+        assert verify_rollups() == {}
+
+        db.session.execute(text("DELETE FROM word_review_stats WHERE word_id = :id"), {'id': sample_words[0].id})
+        db.session.commit()
+        assert verify_rollups(repair=True) == {'word_review_stats': 1}
+        assert verify_rollups() == {}
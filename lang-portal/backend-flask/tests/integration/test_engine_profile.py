@@ -0,0 +1,61 @@
+import pytest
+from app import create_app, db
+from app.utils.engine import effective_pragmas
+from tests.conftest import TestConfig
+
+@pytest.fixture
+def production_app(tmp_path):
+    """App on a file database with the production SQLite profile"""
+    class ProductionConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'profile.db'}"
+        SQLITE_PROFILE = 'production'
+
+    app = create_app(ProductionConfig)
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+def test_production_pragmas(production_app):
+    """Test the production profile is applied to pooled connections"""
+    pragmas = effective_pragmas(db.engine)
+    assert pragmas['journal_mode'] == 'wal'
+    assert pragmas['synchronous'] == 1  # NORMAL
+    assert pragmas['busy_timeout'] == 5000
+    assert pragmas['cache_size'] == -65536
+    assert pragmas['temp_store'] == 2  # MEMORY
+    assert pragmas['foreign_keys'] == 1
+    assert db.engine.pool.size() == 10
+
+def test_reads_during_write(production_app):
+    """Test a reader is not blocked by an open write transaction under WAL"""
+    writer = db.engine.connect()
+    transaction = writer.begin()
+    writer.exec_driver_sql(
+        "INSERT INTO groups (name, description, words_count, created_at) "
+        "VALUES ('pending', 'uncommitted', 0, CURRENT_TIMESTAMP)"
+    )
+    try:
+        with db.engine.connect() as reader:
+            assert reader.exec_driver_sql("SELECT COUNT(*) FROM groups").scalar() == 0
+    finally:
+        transaction.rollback()
+        writer.close()
+
+def test_full_reset_with_foreign_keys(production_app):
+    """Test full reset respects foreign keys on word memberships"""
+    client = production_app.test_client()
+    from app.models import Group, Word
+    group = Group(name="g", description="d")
+    group.words.append(Word(nepali_word="क", romanized_nepali_word="ka",
+                            english_word="k", part_of_speech=["noun"]))
+    db.session.add(group)
+    db.session.commit()
+
+    response = client.post('/api/full-reset')
+    assert response.status_code == 200
+    assert client.get('/api/dashboard').json['data']['total_words'] == 0
+
+def test_default_profile_leaves_pragmas(app):
+    """Test the default profile does not change connection settings"""
+    assert effective_pragmas(db.engine)['foreign_keys'] == 0
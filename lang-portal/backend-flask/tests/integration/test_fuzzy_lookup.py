@@ -0,0 +1,56 @@
+from sqlalchemy import text
+from app.models import Word
+
+def test_fuzzy_lookup(client, sample_words):
+    """Test misspelled romanized words resolve to the right entry"""
+    response = client.get('/api/words/fuzzy?q=dhanyavaad')
+    assert response.status_code == 200
+    words = response.json['data']['words']
+    assert [w['english_word'] for w in words] == ['thank you']
+    assert words[0]['distance'] == 0
+
+    words = client.get('/api/words/fuzzy?q=namsate').json['data']['words']
+    assert words[0]['romanized_nepali_word'] == 'namaste'
+
+def test_fuzzy_lookup_follows_writes(client, session, sample_words):
+    """Test inserts, updates and deletes reach the in-memory index"""
+    assert client.get('/api/words/fuzzy?q=pani').json['data']['words'] == []
+
+    session.add(Word(nepali_word='पानी', romanized_nepali_word='paani',
+                     english_word='water', part_of_speech=['noun']))
+    session.commit()
+    assert client.get('/api/words/fuzzy?q=pani').json['data']['words'][0]['english_word'] == 'water'
+
+    sample_words[0].romanized_nepali_word = 'sanchai'
+    session.commit()
+    assert client.get('/api/words/fuzzy?q=namaste').json['data']['words'] == []
+    assert client.get('/api/words/fuzzy?q=sanchai').json['data']['words'][0]['english_word'] == 'hello'
+
+    session.execute(text("DELETE FROM words WHERE english_word = 'water'"))
+    session.commit()
+    assert client.get('/api/words/fuzzy?q=pani').json['data']['words'] == []
+
+def test_fuzzy_lookup_follows_raw_sql_updates(client, session, sample_words):
+    """Test writes the ORM never saw (raw SQL, other processes) still reach the index"""
+    assert client.get('/api/words/fuzzy?q=namaste').json['data']['words']
+
+    session.execute(text("UPDATE words SET romanized_nepali_word = 'sanchai' WHERE romanized_nepali_word = 'namaste'"))
+    session.commit()
+    assert client.get('/api/words/fuzzy?q=namaste').json['data']['words'] == []
+    assert client.get('/api/words/fuzzy?q=sanchai').json['data']['words'][0]['english_word'] == 'hello'
+
+def test_fuzzy_lookup_ignores_rolled_back_writes(client, session, sample_words):
+    """Test ORM changes only reach the index once their transaction commits"""
+    assert client.get('/api/words/fuzzy?q=namaste').json['data']['words']
+
+    sample_words[0].romanized_nepali_word = 'sanchai'
+    session.flush()
+    session.rollback()
+    assert client.get('/api/words/fuzzy?q=sanchai').json['data']['words'] == []
+    assert client.get('/api/words/fuzzy?q=namaste').json['data']['words'][0]['english_word'] == 'hello'
+
+def test_fuzzy_lookup_validation(client):
+    """Test missing queries and out-of-range parameters are rejected"""
+    assert client.get('/api/words/fuzzy').status_code == 400
+    assert client.get('/api/words/fuzzy?q=pani&limit=0').status_code == 400
+    assert client.get('/api/words/fuzzy?q=pani&max_distance=9').json['error_code'] == 'VALIDATION_ERROR'
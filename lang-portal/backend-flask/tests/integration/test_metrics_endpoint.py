@@ -0,0 +1,81 @@
+import json
+import re
+from app import create_app, db
+from tests.conftest import TestConfig
+
+def _sample(text, name, **labels):
+    """Value of one sample line in the exposition text, or None"""
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    pattern = "^" + re.escape(f"{name}{{{label_text}}}" if labels else name) + r" (\S+)$"
+    match = re.search(pattern, text, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+def test_request_metrics(client, sample_words):
+    """Test requests are counted by route template and status with latency buckets"""
+    client.get('/api/words')
+    client.get('/api/words')
+    client.get('/api/words/999999')
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+    text = response.get_data(as_text=True)
+
+    assert _sample(text, 'http_requests_total', method='GET', route='/api/words', status='200') == 2
+    assert _sample(text, 'http_requests_total', method='GET', route='/api/words/<int:id>', status='404') == 1
+    assert _sample(text, 'http_request_duration_seconds_count', method='GET', route='/api/words') == 2
+    assert _sample(text, 'http_request_duration_seconds_bucket', method='GET', route='/api/words', le='+Inf') == 2
+    assert '# TYPE http_request_duration_seconds histogram' in text
+    # The scrape itself is the one request in flight
+    assert _sample(text, 'http_requests_in_flight') == 1
+    assert _sample(text, 'db_pool_checkout_wait_seconds_count') >= 1
+
+def test_unmatched_routes_share_a_label(client):
+    """Test unknown URLs do not create one series each"""
+    client.get('/nope/1')
+    client.get('/nope/2')
+    text = client.get('/metrics').get_data(as_text=True)
+    assert _sample(text, 'http_requests_total', method='GET', route='<unmatched>', status='404') == 2
+
+def test_review_and_cache_metrics(client, history):
+    """Test review inserts and response cache lookups are counted"""
+    url = f"/api/study-sessions/{history['session_id']}/reviews"
+    client.post(url, json={'reviews': [{'word_id': history['word_id'], 'is_correct': True}] * 3})
+    client.get('/api/dashboard')
+    client.get('/api/dashboard')
+
+    text = client.get('/metrics').get_data(as_text=True)
+    assert _sample(text, 'word_reviews_inserted_total') == 3
+    assert _sample(text, 'response_cache_hits_total') == 1
+    assert _sample(text, 'response_cache_misses_total') == 1
+
+def test_in_flight_reaches_worker_files(tmp_path):
+    """Test a worker's file shows requests in flight while they run and none once it is idle"""
+    class MultiprocessConfig(TestConfig):
+        METRICS_MULTIPROC_DIR = str(tmp_path)
+        METRICS_FLUSH_INTERVAL = 60
+
+    app = create_app(MultiprocessConfig)
+    registry = app.extensions['metrics'].registry
+
+    def in_flight():
+        with open(registry.path) as f:
+            return json.load(f)['http_requests_in_flight']['values'][0][1]
+
+    app.add_url_rule('/probe', 'probe', lambda: str(in_flight()))
+    with app.app_context():
+        assert app.test_client().get('/probe').get_data(as_text=True) == '1'
+        assert in_flight() == 0
+        db.session.remove()
+
+def test_metrics_disabled():
+    """Test METRICS_ENABLED=False removes the endpoint"""
+    class NoMetricsConfig(TestConfig):
+        METRICS_ENABLED = False
+
+    app = create_app(NoMetricsConfig)
+    with app.app_context():
+        db.create_all()
+        assert app.test_client().get('/metrics').status_code == 404
+        db.session.remove()
+        db.drop_all()
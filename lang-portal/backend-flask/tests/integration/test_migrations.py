@@ -0,0 +1,41 @@
+import sqlite3
+from sqlalchemy import text
+from app import create_app, db
+from app.models import Word, Group
+from app.utils.maintenance import run_migrations
+from config import Config
+from tests.conftest import TestConfig
+
+def test_migrate_after_create_all(tmp_path):
+    """Test the migrations run on a database create_all already built with every column"""
+    path = tmp_path / 'words.db'
+
+    class FileConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+
+    app = create_app(FileConfig)
+    with app.app_context():
+        db.create_all()
+        group = Group(name='Greetings', description='Hello')
+        group.words.append(Word(nepali_word='नमस्ते', romanized_nepali_word='namaste',
+                                english_word='hello', part_of_speech=['greeting']))
+        db.session.add(group)
+        db.session.commit()
+        db.session.remove()
+        db.engine.dispose()
+
+    connection = sqlite3.connect(path)
+    try:
+        ran = run_migrations(connection, Config.MIGRATIONS_DIR)
+        assert '0003_group_word_counts.sql' in ran
+        assert run_migrations(connection, Config.MIGRATIONS_DIR) == []
+        assert connection.execute("SELECT words_count FROM groups").fetchall() == [(1,)]
+    finally:
+        connection.close()
+
+def test_migrations_add_missing_columns(migrated_app):
+    """Test the guarded ALTERs still add their columns to a database built from the migrations"""
+    columns = {row[1] for row in db.session.execute(text("PRAGMA table_info(groups)"))}
+    assert 'words_count' in columns
+    columns = {row[1] for row in db.session.execute(text("PRAGMA table_info(study_activities)"))}
+    assert 'words_per_session' in columns
@@ -0,0 +1,59 @@
+from app import db
+from app.models import Word, StudySession
+from app.utils.projections import paginate_words, paginate_study_sessions, row_dicts
+
+def test_words_page_matches_entities(client, sample_words):
+    """Test the projected words page renders exactly what the entities hold"""
+    response = client.get('/api/words?per_page=50')
+    expected = [{
+        "id": w.id,
+        "nepali_word": w.nepali_word,
+        "romanized_nepali_word": w.romanized_nepali_word,
+        "english_word": w.english_word,
+        "part_of_speech": w.part_of_speech
+    } for w in Word.query.order_by(Word.id)]
+
+    assert response.json['data']['words'] == expected
+    assert response.json['meta']['pagination']['total_items'] == len(expected)
+
+def test_projection_loads_no_entities(session, sample_words):
+    """Test projected pages are plain rows and leave the identity map empty"""
+    session.expunge_all()
+    page = paginate_words(1, 50)
+
+    assert page.items and not any(isinstance(row, Word) for row in page.items)
+    assert len(db.session.identity_map) == 0
+
+def test_study_session_rows_without_group(session, sample_activities):
+    """Test sessions with no group still list, with a null group name"""
+    study_session = StudySession(group_id=None, study_activity_id=sample_activities[0].id)
+    session.add(study_session)
+    session.commit()
+
+    rows = row_dicts(paginate_study_sessions(1, 20).items)
+    assert rows[0]['id'] == study_session.id
+    assert rows[0]['group_name'] is None
+    assert rows[0]['activity_name'] == sample_activities[0].name
+
+def test_page_past_the_end(client, sample_words):
+    """Test a page past the last one is a 404 like before"""
+    assert client.get('/api/words?page=999').status_code == 404
+    assert client.get('/api/study-sessions?page=999').status_code == 404
+
+def test_group_words_cursor_pages(client, session, sample_words, sample_groups):
+    """Test cursor pages over projected group rows cover every member once"""
+    group = sample_groups[0]
+    group.words.extend(sample_words)
+    session.commit()
+
+    seen, url = [], f'/api/groups/{group.id}/words?per_page=1&cursor='
+    while True:
+        body = client.get(url).json
+        seen += [word['id'] for word in body['data']['words']]
+        if not body['meta']['pagination']['has_next']:
+            break
+        url = f"/api/groups/{group.id}/words?per_page=1&cursor={body['meta']['pagination']['next_cursor']}"
+
+    assert seen == sorted(word.id for word in sample_words)
+    offset = client.get(f'/api/groups/{group.id}/words?per_page=50').json
+    assert offset['meta']['pagination']['total_items'] == len(sample_words)
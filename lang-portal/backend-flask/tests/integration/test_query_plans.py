@@ -0,0 +1,77 @@
+import re
+import pytest
+from sqlalchemy import event
+from app import db
+from app.models import Group
+
+# Tables that grow with review history; hot queries must reach them through an index
+GUARDED_TABLES = ('word_review_items', 'study_sessions', 'words_groups', 'word_schedules')
+
+def _capture(func):
+    """Run func and return the (statement, parameters) pairs it executed"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            captured.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    return captured
+
+def _full_scans(statement, parameters):
+    """Return the query plan lines that walk a guarded table without an index seek"""
+    with db.engine.connect() as connection:
+        plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    problems = []
+    for row in plan:
+        detail = row[-1]
+        for table in GUARDED_TABLES:
+            # "SCAN t USING INDEX i" is an ordered walk that stops at the LIMIT;
+            # a bare or covering-index SCAN reads the whole table.
+            if re.match(rf"SCAN {table}\b(?! USING INDEX)", detail):
+                problems.append(detail)
+        if 'TEMP B-TREE FOR ORDER BY' in detail:
+            problems.append(detail)
+    return problems
+
+HOT_REQUESTS = [
+    ('GET', '/api/groups/{group_id}/study-sessions'),
+    ('GET', '/api/study-activities/{activity_id}/study-sessions'),
+    ('GET', '/api/groups/{group_id}'),
+    ('GET', '/api/groups/{group_id}/words'),
+    ('GET', '/api/groups/{group_id}/words?cursor='),
+    ('GET', '/api/groups/{group_id}/due-words'),
+    ('GET', '/api/study-sessions/{session_id}/words'),
+    ('GET', '/api/dashboard/last-session'),
+    ('GET', '/api/reviews/export'),
+    ('GET', '/api/reviews/export?since=2025-01-01&until=2025-02-01'),
+    ('POST', '/api/study-sessions/{session_id}/reviews'),
+    ('POST', '/api/study-sessions/{session_id}/end'),
+]
+
+@pytest.mark.parametrize("method,url", HOT_REQUESTS)
+def test_hot_endpoint_query_plans(client, history, method, url):
+    """Test every statement behind a hot endpoint uses an index on guarded tables"""
+    url = url.format(**history)
+    if method == 'GET':
+        captured = _capture(lambda: client.get(url))
+    else:
+        body = {'reviews': [{'word_id': history['word_id'], 'is_correct': False}]}
+        captured = _capture(lambda: client.post(url, json=body))
+
+    assert captured
+    for statement, parameters in captured:
+        assert _full_scans(statement, parameters) == [], statement
+
+def test_group_statistics_query_plans(app, history):
+    """Test Group.statistics counts use the group index"""
+    group = db.session.get(Group, history['group_id'])
+    captured = _capture(lambda: group.statistics)
+
+    assert len(captured) == 3
+    for statement, parameters in captured:
+        assert _full_scans(statement, parameters) == [], statement
@@ -0,0 +1,115 @@
+import logging
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app import create_app, db
+from app.models import Group
+from tests.conftest import TestConfig
+
+# Statement budgets per endpoint; raise one only with a reason
+QUERY_BUDGETS = [
+    ('GET', '/api/words', 3),
+    ('GET', '/api/words/{word_id}', 3),
+    ('GET', '/api/words/{word_id}/groups', 2),
+    ('GET', '/api/groups', 3),
+    ('GET', '/api/groups/{group_id}', 4),
+    ('GET', '/api/groups/{group_id}/words', 3),
+    ('GET', '/api/groups/{group_id}/due-words', 3),
+    ('GET', '/api/groups/{group_id}/study-sessions', 3),
+    ('GET', '/api/study-sessions', 2),
+    ('GET', '/api/study-sessions/{session_id}', 3),
+    ('GET', '/api/study-sessions/{session_id}/words', 3),
+    ('GET', '/api/study-activities', 3),
+    ('GET', '/api/study-activities/{activity_id}/study-sessions', 3),
+    ('GET', '/api/dashboard', 1),
+    ('GET', '/api/dashboard/statistics', 3),
+    ('GET', '/api/dashboard/last-session', 3),
+    ('GET', '/api/dashboard/study-progress', 1),
+    ('POST', '/api/study-activities', 4),
+    ('POST', '/api/study-sessions/{session_id}/reviews', 3),
+    ('POST', '/api/study-sessions/{session_id}/end', 4),
+]
+
+@pytest.mark.parametrize("method,url,budget", QUERY_BUDGETS)
+def test_endpoint_query_budget(client, history, query_budget, method, url, budget):
+    """Test each endpoint stays within its statement budget"""
+    url = url.format(**history)
+    with query_budget(budget):
+        if method == 'GET':
+            response = client.get(url)
+        elif url.endswith('/reviews'):
+            response = client.post(url, json={'reviews': [{'word_id': history['word_id'], 'is_correct': True}]})
+        elif url.endswith('/end'):
+            response = client.post(url)
+        else:
+            response = client.post(url, json={'group_id': history['group_id'],
+                                              'study_activity_id': history['activity_id']})
+    assert response.status_code == 200
+
+def test_query_headers(client, history):
+    """Test responses report their statement count and DB time"""
+    db.session.expunge_all()
+    response = client.get(f"/api/groups/{history['group_id']}/words")
+
+    assert int(response.headers['X-DB-Queries']) >= 1
+    assert response.headers['X-DB-Duplicate-Queries'] == '0'
+    assert response.headers['Server-Timing'].startswith('db;dur=')
+    assert f'desc="count={response.headers["X-DB-Queries"]}"' in response.headers['Server-Timing']
+
+def test_duplicates_counted(app, history, query_budget):
+    """Test repeated statements show up as duplicates"""
+    with query_budget(3) as stats:
+        for _ in range(3):
+            db.session.expunge_all()
+            db.session.get(Group, history['group_id'])
+
+    assert stats.count == 3
+    assert stats.duplicates == 2
+    assert stats.repeated()[0][1] == 3
+
+def test_query_budget_failure_lists_statements(app, history, query_budget):
+    """Test an exceeded budget names the statements that ran"""
+    with pytest.raises(AssertionError, match='FROM groups'):
+        with query_budget(0):
+            db.session.get(Group, history['group_id'])
+
+def test_failed_statements_leave_no_timer_state(app, query_budget):
+    """Test statements that raise are not left pending on the pooled connection"""
+    connection = db.session.connection()
+    for _ in range(3):
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM no_such_table"))
+    assert 'query_start' not in connection.info
+
+    with query_budget(1) as stats:
+        connection.execute(text("SELECT 1"))
+    assert stats.count == 1
+
+def test_slow_query_logged_with_plan(caplog):
+    """Test statements over SQL_SLOW_QUERY_MS are logged with their query plan"""
+    class SlowConfig(TestConfig):
+        SQL_SLOW_QUERY_MS = 0
+
+    app = create_app(SlowConfig)
+    with app.app_context():
+        db.create_all()
+        with caplog.at_level(logging.WARNING, logger='app.utils.query_stats'):
+            app.test_client().get('/api/groups')
+        db.session.remove()
+        db.drop_all()
+
+    messages = [record.getMessage() for record in caplog.records if 'Slow query' in record.getMessage()]
+    assert any('FROM groups' in message and 'plan:' in message and 'SCAN' in message for message in messages)
+
+def test_instrumentation_disabled():
+    """Test SQL_INSTRUMENTATION=False leaves responses without the headers"""
+    class QuietConfig(TestConfig):
+        SQL_INSTRUMENTATION = False
+
+    app = create_app(QuietConfig)
+    with app.app_context():
+        db.create_all()
+        response = app.test_client().get('/api/groups')
+        db.session.remove()
+        db.drop_all()
+    assert 'X-DB-Queries' not in response.headers
@@ -0,0 +1,83 @@
+import pytest
+from app.models import StudySession, WordReviewItem, Word
+
+@pytest.fixture
+def group_session(session, sample_full_data):
+    """A study session on a group that contains the sample words"""
+    study_session = StudySession(
+        group_id=sample_full_data['groups'][0].id,
+        study_activity_id=sample_full_data['activities'][0].id
+    )
+    session.add(study_session)
+    session.commit()
+    return study_session
+
+class TestBatchReviews:
+    """Test batch review submission"""
+    def test_batch_insert(self, client, session, sample_full_data, group_session):
+        """Test valid reviews are inserted together with per-item results"""
+        words = sample_full_data['words']
+        payload = {'reviews': [
+            {'word_id': words[0].id, 'is_correct': True},
+            {'word_id': words[1].id, 'is_correct': False, 'created_at': '2025-01-02T03:04:05Z'},
+            {'word_id': words[2].id, 'is_correct': True}
+        ]}
+        response = client.post(f'/api/study-sessions/{group_session.id}/reviews', json=payload)
+        assert response.status_code == 200
+        data = response.json['data']
+        assert data['accepted'] == 3
+        assert data['rejected'] == 0
+        assert [r['status'] for r in data['results']] == ['created'] * 3
+
+        reviews = WordReviewItem.query.filter_by(session_id=group_session.id).order_by(WordReviewItem.id).all()
+        assert [r.id for r in reviews] == [r['id'] for r in data['results']]
+        assert reviews[1].created_at.isoformat() == '2025-01-02T03:04:05'
+
+        stats = client.get('/api/dashboard/statistics').json['data']
+        assert stats['total_reviews'] == 3
+
+    def test_batch_partial_rejection(self, client, session, sample_full_data, group_session):
+        """Test invalid items are reported without blocking valid ones"""
+        outsider = Word(nepali_word='बाहिर', romanized_nepali_word='bahira',
+                        english_word='outside', part_of_speech=['adverb'])
+        session.add(outsider)
+        session.commit()
+
+        payload = {'reviews': [
+            {'word_id': sample_full_data['words'][0].id, 'is_correct': True},
+            {'word_id': outsider.id, 'is_correct': True},
+            {'word_id': sample_full_data['words'][1].id, 'is_correct': 'yes'}
+        ]}
+        response = client.post(f'/api/study-sessions/{group_session.id}/reviews', json=payload)
+        assert response.status_code == 200
+        results = response.json['data']['results']
+        assert [r['status'] for r in results] == ['created', 'rejected', 'rejected']
+        assert WordReviewItem.query.count() == 1
+
+    def test_batch_validation(self, client, group_session):
+        """Test malformed batches are rejected"""
+        url = f'/api/study-sessions/{group_session.id}/reviews'
+        assert client.post(url, json={}).status_code == 400
+        assert client.post(url, json={'reviews': []}).status_code == 400
+
+        response = client.post(url, json={'reviews': [{'word_id': 999, 'is_correct': True}]})
+        assert response.status_code == 400
+        assert response.json['errors'][0]['status'] == 'rejected'
+
+        response = client.post('/api/study-sessions/999/reviews',
+                               json={'reviews': [{'word_id': 1, 'is_correct': True}]})
+        assert response.status_code == 404
+
+def test_reviews_invalidate_cached_statistics(client, sample_full_data, group_session):
+    """Test cached dashboard statistics are dropped when reviews are written"""
+    word_id = sample_full_data['words'][0].id
+    assert client.get('/api/dashboard/statistics').json['data']['total_reviews'] == 0
+    assert client.get('/api/dashboard/statistics').json['data']['total_reviews'] == 0
+    assert client.get('/api/cache/stats').json['data']['hits'] >= 1
+
+    client.post(f'/api/study-sessions/{group_session.id}/words/{word_id}/review', json={'is_correct': True})
+    assert client.get('/api/dashboard/statistics').json['data']['total_reviews'] == 1
+
+    client.post(f'/api/study-sessions/{group_session.id}/reviews',
+                json={'reviews': [{'word_id': word_id, 'is_correct': False}]})
+    assert client.get('/api/dashboard/statistics').json['data']['total_reviews'] == 2
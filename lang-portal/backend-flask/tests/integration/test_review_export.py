@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+import pytest
+from datetime import datetime, UTC
+from app.models import StudySession, WordReviewItem
+from app.utils.export import export_reviews
+
+@pytest.fixture
+def history(session, sample_full_data):
+    """Reviews spread over three days"""
+    study_session = StudySession(group_id=sample_full_data['groups'][0].id,
+                                 study_activity_id=sample_full_data['activities'][0].id)
+    session.add(study_session)
+    session.flush()
+    for day, word in zip([1, 2, 3], sample_full_data['words']):
+        session.add(WordReviewItem(word_id=word.id, session_id=study_session.id,
+                                   group_id=study_session.group_id, is_correct=day != 2,
+                                   created_at=datetime(2025, 1, day, 9, 0, tzinfo=UTC)))
+    session.commit()
+    return study_session
+
+def test_export_ndjson(client, history):
+    """Test NDJSON export streams joined rows oldest first"""
+    response = client.get('/api/reviews/export')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.is_streamed
+
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row['english_word'] for row in rows] == ['hello', 'thank you', 'please']
+    assert rows[0]['reviewed_at'] == '2025-01-01T09:00:00Z'
+    assert rows[0]['group_name'] == history.group.name
+    assert rows[0]['activity_name'] == history.activity.name
+    assert rows[1]['is_correct'] is False
+
+def test_export_csv_with_range(client, history):
+    """Test CSV export honours since (inclusive) and until (exclusive)"""
+    response = client.get('/api/reviews/export?format=csv&since=2025-01-02&until=2025-01-03')
+    assert response.status_code == 200
+    assert response.headers['Content-Disposition'] == 'attachment; filename="reviews.csv"'
+
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [row['nepali_word'] for row in rows] == ['धन्यवाद']
+    assert rows[0]['is_correct'] == 'False'
+
+def test_export_in_chunks(app, history):
+    """Test every chunk after the CSV header carries at most chunk_size rows"""
+    chunks = list(export_reviews('csv', chunk_size=2))
+    assert len(chunks) == 3
+    assert chunks[0].startswith('review_id,reviewed_at,')
+    assert [chunk.count('\n') for chunk in chunks[1:]] == [2, 1]
+
+@pytest.mark.parametrize("query", ['format=xml', 'since=yesterday'])
+def test_export_validation(client, query):
+    """Test unknown formats and malformed bounds are rejected before streaming"""
+    response = client.get(f'/api/reviews/export?{query}')
+    assert response.status_code == 400
+    assert response.json['error_code'] == 'VALIDATION_ERROR'
@@ -15,3 +15,190 @@ def test_study_session_list(client, sample_study_session):
     assert response.status_code == 200
     assert 'study_sessions' in response.json['data']
     assert len(response.json['data']['study_sessions']) > 0
+
+def _count_queries(engine, func):
+    """Run func and return how many SQL statements it executed"""
+    from sqlalchemy import event
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        result = func()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return result, len(statements)
+
+def test_group_study_sessions_constant_queries(client, session, sample_words, sample_groups, sample_activities):
+    """Test that listing sessions costs the same number of queries for any page size"""
+    from app import db
+    from app.models import StudySession, WordReviewItem
+    group = sample_groups[0]
+    activity = sample_activities[0]
+
+    for i in range(6):
+        study_session = StudySession(group_id=group.id, study_activity_id=activity.id)
+        session.add(study_session)
+        session.flush()
+        for word in sample_words:
+            session.add(WordReviewItem(
+                word_id=word.id,
+                session_id=study_session.id,
+                group_id=group.id,
+                is_correct=(word.id + i) % 2 == 0
+            ))
+    session.commit()
+    group_id, group_name, activity_name = group.id, group.name, activity.name
+
+    small, small_count = _count_queries(
+        db.engine, lambda: client.get(f'/api/groups/{group_id}/study-sessions?per_page=1'))
+    large, large_count = _count_queries(
+        db.engine, lambda: client.get(f'/api/groups/{group_id}/study-sessions?per_page=6'))
+
+    assert small.status_code == 200
+    assert large.status_code == 200
+    assert small_count == large_count
+
+    sessions = large.json['data']['study_sessions']
+    assert len(sessions) == 6
+    for item in sessions:
+        assert item['group_name'] == group_name
+        assert item['activity_name'] == activity_name
+        assert item['number_of_review_items'] == len(sample_words)
+        assert item['number_of_correct_review_items'] + item['number_of_wrong_review_items'] == len(sample_words)
+
+def test_end_study_session_counts(client, session, sample_words, sample_groups, sample_activities):
+    """Test ending a session returns its aggregated review counts"""
+    from app.models import StudySession, WordReviewItem
+    study_session = StudySession(group_id=sample_groups[0].id, study_activity_id=sample_activities[0].id)
+    session.add(study_session)
+    session.flush()
+    session.add(WordReviewItem(word_id=sample_words[0].id, session_id=study_session.id,
+                               group_id=sample_groups[0].id, is_correct=True))
+    session.add(WordReviewItem(word_id=sample_words[1].id, session_id=study_session.id,
+                               group_id=sample_groups[0].id, is_correct=False))
+    session.commit()
+
+    response = client.post(f'/api/study-sessions/{study_session.id}/end')
+    assert response.status_code == 200
+    data = response.json['data']
+    assert data['number_of_review_items'] == 2
+    assert data['number_of_correct_review_items'] == 1
+    assert data['number_of_wrong_review_items'] == 1
+    assert data['ended_at'] is not None
+
+@pytest.fixture
+def large_group(session, sample_groups):
+    """A group of 300 words, enough for sampling to use index seeks"""
+    from app.models import Word
+    group = sample_groups[0]
+    words = [Word(nepali_word=f'शब्द{i}', romanized_nepali_word=f'shabda{i}',
+                  english_word=f'word {i}', part_of_speech=['noun']) for i in range(300)]
+    session.add_all(words)
+    group.words.extend(words)
+    session.commit()
+    return group.id, {word.id for word in words}
+
+def _start(client, group_id, activity_id, **options):
+    response = client.post('/api/study-activities',
+                           json={'group_id': group_id, 'study_activity_id': activity_id, **options})
+    assert response.status_code == 200
+    return response.json
+
+def test_start_returns_first_chunk_and_cursor(client, large_group, sample_activities):
+    """Test a new session gets the first words of the group and a cursor for the rest"""
+    group_id, word_ids = large_group
+    data = _start(client, group_id, sample_activities[0].id)
+    assert data['words_total'] == 300
+    assert [w['id'] for w in data['words']] == sorted(word_ids)[:50]
+
+    seen = [w['id'] for w in data['words']]
+    cursor = data['next_cursor']
+    while cursor:
+        page = client.get(f'/api/groups/{group_id}/words?per_page=50&cursor={cursor}').json
+        seen += [w['id'] for w in page['data']['words']]
+        cursor = page['meta']['pagination']['next_cursor']
+    assert seen == sorted(word_ids)
+
+def test_start_chunk_size(client, session, large_group, sample_activities):
+    """Test the activity's words_per_session sets the chunk size and words_limit overrides it"""
+    group_id, _ = large_group
+    activity = sample_activities[0]
+    activity.words_per_session = 10
+    session.commit()
+
+    assert len(_start(client, group_id, activity.id)['words']) == 10
+    assert len(_start(client, group_id, activity.id, words_limit=25)['words']) == 25
+
+def test_start_sampled(client, large_group, sample_groups, sample_words, sample_activities):
+    """Test sample mode returns distinct random members and no cursor"""
+    group_id, word_ids = large_group
+    data = _start(client, group_id, sample_activities[0].id, sample=True, words_limit=20)
+    ids = [w['id'] for w in data['words']]
+    assert len(ids) == 20 == len(set(ids))
+    assert set(ids) <= word_ids
+    assert ids != sorted(ids)
+    assert data['next_cursor'] is None
+
+    # Small groups are sampled from the full member list
+    other = sample_groups[1]
+    other.words.extend(sample_words)
+    data = _start(client, other.id, sample_activities[0].id, sample=True)
+    assert sorted(w['id'] for w in data['words']) == sorted(w.id for w in sample_words)
+
+def test_start_sampled_with_id_gaps(client, session, sample_groups, sample_activities):
+    """Test sampling fills the chunk when most of the id range is one gap"""
+    from app.models import Word
+    words = [Word(id=word_id, nepali_word=f'शब्द{word_id}', romanized_nepali_word=f'shabda{word_id}',
+                  english_word=f'word {word_id}', part_of_speech=['noun'])
+             for word_id in list(range(1, 251)) + [100000]]
+    session.add_all(words)
+    sample_groups[0].words.extend(words)
+    session.commit()
+
+    for _ in range(3):
+        data = _start(client, sample_groups[0].id, sample_activities[0].id, sample=True)
+        ids = [w['id'] for w in data['words']]
+        assert len(ids) == 50 == len(set(ids))
+
+def test_start_sampled_with_id_gaps_fixed_queries(client, session, query_budget, sample_groups, sample_activities):
+    """Test a wide id gap costs one extra statement, not one per missing word"""
+    from app.models import Word
+    words = [Word(id=word_id, nepali_word=f'शब्द{word_id}', romanized_nepali_word=f'shabda{word_id}',
+                  english_word=f'word {word_id}', part_of_speech=['noun'])
+             for word_id in list(range(1, 1001)) + [10000000]]
+    session.add_all(words)
+    sample_groups[0].words.extend(words)
+    session.commit()
+    group_id, activity_id = sample_groups[0].id, sample_activities[0].id
+
+    # group, activity, id range, pivot picks, top-up, session insert
+    for _ in range(3):
+        with query_budget(6):
+            data = _start(client, group_id, activity_id, sample=True)
+        assert len({w['id'] for w in data['words']}) == 50
+
+def test_start_queries_independent_of_group_size(client, session, large_group, sample_groups, sample_words,
+                                                 sample_activities):
+    """Test starting a session runs the same statements for a small and a large group"""
+    from app import db
+    small = sample_groups[1]
+    small.words.extend(sample_words[:2])
+    session.commit()
+    group_id, activity_id = large_group[0], sample_activities[0].id
+
+    for options in ({}, {'sample': True, 'words_limit': 20}):
+        _, small_count = _count_queries(db.engine, lambda: _start(client, small.id, activity_id, **options))
+        _, large_count = _count_queries(db.engine, lambda: _start(client, group_id, activity_id, **options))
+        assert large_count <= small_count + 1  # sampling a large group reads its id range first
+
+@pytest.mark.parametrize('options', [{'words_limit': 0}, {'words_limit': 51}, {'words_limit': 'many'},
+                                     {'sample': 'yes'}])
+def test_start_options_validated(client, sample_groups, sample_activities, options):
+    """Test out-of-range chunk sizes and non-boolean sample flags are rejected"""
+    response = client.post('/api/study-activities', json={
+        'group_id': sample_groups[0].id, 'study_activity_id': sample_activities[0].id, **options})
+    assert response.status_code == 400
+    assert response.json['error_code'] == 'VALIDATION_ERROR'
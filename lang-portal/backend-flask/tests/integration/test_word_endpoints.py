@@ -1,4 +1,5 @@
 import pytest
+from app.models import Group
 
 def test_word_group_listing(client, session, sample_words, sample_groups):
     """Test word group listing"""
@@ -31,4 +32,42 @@ def test_word_details(client, sample_words):
     word = sample_words[0]
     response = client.get(f'/api/words/{word.id}')
     assert response.status_code == 200
-    assert response.json['data']['nepali_word'] == word.nepali_word
\ No newline at end of file
+    assert response.json['data']['nepali_word'] == word.nepali_word
+
+
+@pytest.mark.parametrize('path', ['/api/words/{id}', '/api/words/{id}/groups'])
+def test_word_groups_fixed_queries(client, session, query_budget, sample_words, path):
+    """Test a word's groups and their totals take the same statements for 1 group or 12"""
+    shared, single = sample_words[0], sample_words[1]
+    groups = [Group(name=f'Group {i}', description='') for i in range(12)]
+    session.add_all(groups)
+    shared.groups.extend(groups)
+    single.groups.append(groups[0])
+    session.commit()
+    word_ids, group_ids = (single.id, shared.id), sorted(g.id for g in groups)
+
+    counts = []
+    for word_id in word_ids:
+        with query_budget(3) as stats:
+            response = client.get(path.format(id=word_id))
+        assert response.status_code == 200
+        assert not any('count(' in statement.lower() for statement in stats.statements)
+        counts.append(stats.count)
+    assert counts[0] == counts[1]
+
+    word_groups = response.json['data']['word_groups']
+    assert [g['id'] for g in word_groups] == group_ids
+    assert [g['total_words'] for g in word_groups] == [2] + [1] * 11
+
+
+def test_word_groups_pagination_total(client, session, sample_words):
+    """Test the word-groups total is counted once the first page is full"""
+    word = sample_words[0]
+    word.groups.extend(Group(name=f'Group {i}', description='') for i in range(5))
+    session.commit()
+
+    meta = client.get(f'/api/words/{word.id}/groups?per_page=2').json['meta']['pagination']
+    assert (meta['total_items'], meta['total_pages'], meta['has_next']) == (5, 3, True)
+    meta = client.get(f'/api/words/{word.id}/groups?per_page=10').json['meta']['pagination']
+    assert (meta['total_items'], meta['has_next']) == (5, False)
+    assert client.get(f'/api/words/{word.id}/groups?page=9&per_page=2').status_code == 404
@@ -0,0 +1,98 @@
+import io
+import json
+import pytest
+from sqlalchemy.exc import OperationalError
+from app.models import Word
+from app.utils.word_import import import_words, ImportAborted, WordImporter
+
+CSV_BODY = (
+    "nepali_word,romanized_nepali_word,english_word,part_of_speech\n"
+    "पानी,paani,water,noun\n"
+    "खानु,khaanu,to eat,verb;noun\n"
+    "ठूलो,thulo,big,\"[\"\"adjective\"\"]\"\n"
+    "गलत,galat,,noun\n"
+    "पानी,paani,water,noun\n"
+)
+
+def test_import_csv_upload(client, sample_words):
+    """Test a multipart CSV upload inserts valid rows and reports the rest by line"""
+    response = client.post('/api/words/import', data={
+        'file': (io.BytesIO(CSV_BODY.encode('utf-8')), 'words.csv')
+    }, content_type='multipart/form-data')
+    assert response.status_code == 200
+
+    report = response.json['data']
+    assert report['inserted'] == 3
+    assert report['duplicates'] == 1
+    assert report['failed'] == 1
+    assert report['errors'][0]['line'] == 5
+    assert report['errors'][0]['errors'][0].startswith('english_word')
+    assert Word.query.filter_by(english_word='to eat').one().part_of_speech_list == ['verb', 'noun']
+
+def test_import_ndjson_body_skips_existing(client, sample_words):
+    """Test raw NDJSON bodies dedupe against words already stored"""
+    lines = [
+        {'nepali_word': 'नमस्ते', 'romanized_nepali_word': 'namaste', 'english_word': 'hello',
+         'part_of_speech': ['greeting']},
+        {'nepali_word': 'नमस्ते', 'romanized_nepali_word': 'namaste', 'english_word': 'goodbye',
+         'part_of_speech': ['greeting']},
+        'not an object',
+    ]
+    body = '\n'.join(json.dumps(line, ensure_ascii=False) for line in lines) + '\n{broken\n'
+    response = client.post('/api/words/import', data=body.encode('utf-8'),
+                           content_type='application/x-ndjson')
+    report = response.json['data']
+    assert (report['inserted'], report['duplicates'], report['failed']) == (1, 1, 2)
+    assert [error['line'] for error in report['errors']] == [3, 4]
+
+    words = client.get('/api/words/fuzzy?q=namaste').json['data']['words']
+    assert {word['english_word'] for word in words} == {'hello', 'goodbye'}
+
+def test_import_requires_format(client):
+    """Test uploads of unknown format are rejected"""
+    response = client.post('/api/words/import', data=b'x', content_type='application/octet-stream')
+    assert response.status_code == 400
+    assert response.json['error_code'] == 'VALIDATION_ERROR'
+
+def test_import_in_chunks(app):
+    """Test duplicates split across chunks are still caught"""
+    rows = [f"शब्द{i % 50},shabda{i % 50},word {i % 50},noun\n" for i in range(120)]
+    body = "nepali_word,romanized_nepali_word,english_word,part_of_speech\n" + ''.join(rows)
+    report = import_words(io.BytesIO(body.encode('utf-8')), 'csv', chunk_size=16)
+    assert (report['inserted'], report['duplicates'], report['failed']) == (50, 70, 0)
+    assert Word.query.count() == 50
+
+def test_import_reports_rows_committed_before_a_bad_chunk(client):
+    """Test an upload that stops decoding part way keeps and reports the chunks before it"""
+    assert client.get('/api/words').json['meta']['pagination']['total_items'] == 0
+
+    rows = ''.join(f"शब्द{i},shabda{i},word {i},noun\n" for i in range(3000))
+    body = ("nepali_word,romanized_nepali_word,english_word,part_of_speech\n" + rows).encode('utf-8')
+    response = client.post('/api/words/import', data={
+        'file': (io.BytesIO(body + b"\xff\xfe,bad,row,noun\n"), 'words.csv')
+    }, content_type='multipart/form-data')
+    assert response.status_code == 400
+    assert response.json['error_code'] == 'VALIDATION_ERROR'
+    inserted = response.json['data']['inserted']
+    assert inserted >= 2000
+    assert Word.query.count() == inserted
+    assert client.get('/api/words').json['meta']['pagination']['total_items'] == inserted
+
+def test_import_aborted_on_database_error(app, monkeypatch):
+    """Test a database failure in a later chunk raises with the committed chunks counted"""
+    importer = WordImporter(chunk_size=10)
+    import_chunk = importer.import_chunk
+
+    def failing_import_chunk(chunk):
+        if importer.inserted:
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        import_chunk(chunk)
+    monkeypatch.setattr(importer, 'import_chunk', failing_import_chunk)
+
+    body = ''.join(json.dumps({'nepali_word': f"शब्द{i}", 'romanized_nepali_word': f"shabda{i}",
+                               'english_word': f"word {i}", 'part_of_speech': ['noun']}) + '\n' for i in range(25))
+    with pytest.raises(ImportAborted) as aborted:
+        importer.run(io.StringIO(body), 'ndjson')
+    assert aborted.value.report['inserted'] == 10
+    assert isinstance(aborted.value.__cause__, OperationalError)
+    assert Word.query.count() == 10
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import text
+from app import db
+from app.models import WordSchedule
+from app.models.word_schedule import MAX_INTERVAL_DAYS
+from app.utils.maintenance import rebuild_word_schedules
+
+def _days_ago(days):
+    return datetime.now(UTC) - timedelta(days=days)
+
+def _schedule(study_session, word):
+    return db.session.get(WordSchedule, (word.id, study_session.group_id), populate_existing=True)
+
+class TestWordSchedules:
+    """Test SM-2 scheduling state and the due-word queue"""
+    def test_schedule_follows_reviews(self, session, study_session, review, sample_full_data):
+        """Test intervals grow with correct answers and reset on a lapse"""
+        word = sample_full_data['words'][0]
+
+        expected = [(True, 1, 1, 2.6), (True, 2, 6, 2.7), (True, 3, 16.2, 2.8), (False, 0, 1, 2.26)]
+        for is_correct, repetitions, interval, ease in expected:
+            review(word, is_correct, created_at=_days_ago(0))
+            schedule = _schedule(study_session, word)
+            assert schedule.repetitions == repetitions
+            assert schedule.interval_days == interval
+            assert round(schedule.ease_factor, 2) == ease
+        assert schedule.lapses == 1
+        assert schedule.due_at == schedule.last_reviewed_at.replace(microsecond=0) + timedelta(days=1)
+
+    def test_interval_is_capped(self, session, study_session, review, sample_full_data):
+        """Test a long run of correct answers stops growing the interval at 100 years"""
+        word = sample_full_data['words'][0]
+        for _ in range(30):
+            review(word, True, created_at=_days_ago(0))
+        schedule = _schedule(study_session, word)
+        assert schedule.interval_days == MAX_INTERVAL_DAYS
+        assert schedule.due_at is not None
+
+    def test_due_words_order(self, client, session, study_session, review, sample_full_data):
+        """Test overdue words come first, then words never reviewed"""
+        group_id = study_session.group_id
+        first, second, third = sample_full_data['words']
+        review(first, True, created_at=_days_ago(2))    # due 1 day ago
+        review(second, False, created_at=_days_ago(5))  # due 4 days ago
+        session.commit()
+
+        response = client.get(f'/api/groups/{group_id}/due-words')
+        assert response.status_code == 200
+        words = response.json['data']['words']
+        assert [w['id'] for w in words] == [second.id, first.id, third.id]
+        assert [w['new'] for w in words] == [False, False, True]
+
+        words = client.get(f'/api/groups/{group_id}/due-words?limit=1').json['data']['words']
+        assert [w['id'] for w in words] == [second.id]
+
+        words = client.get(f'/api/groups/{group_id}/due-words?include_new=false').json['data']['words']
+        assert [w['id'] for w in words] == [second.id, first.id]
+
+    def test_recent_reviews_are_not_due(self, client, session, study_session, review, sample_full_data):
+        """Test a word reviewed just now leaves the queue until its interval passes"""
+        review(sample_full_data['words'][0], True, created_at=_days_ago(0))
+        session.commit()
+
+        words = client.get(f'/api/groups/{study_session.group_id}/due-words?include_new=false').json['data']['words']
+        assert words == []
+
+    def test_due_words_validation(self, client, sample_full_data):
+        """Test unknown groups and out-of-range limits are rejected"""
+        assert client.get('/api/groups/9999/due-words').status_code == 404
+        response = client.get(f"/api/groups/{sample_full_data['groups'][0].id}/due-words?limit=0")
+        assert response.status_code == 400
+        assert response.json['error_code'] == 'VALIDATION_ERROR'
+
+    def test_rebuild_matches_trigger(self, session, study_session, review, sample_full_data):
+        """Test replaying the history reproduces the trigger-maintained state"""
+        for days_ago, (word, is_correct) in enumerate([
+            (sample_full_data['words'][0], True), (sample_full_data['words'][1], False),
+            (sample_full_data['words'][0], True), (sample_full_data['words'][0], False),
+        ]):
+            review(word, is_correct, created_at=_days_ago(10 - days_ago))
+        session.commit()
+
+        before = [s.to_dict() for s in WordSchedule.query.order_by(WordSchedule.word_id)]
+        assert rebuild_word_schedules() == 2
+        session.expire_all()
+        assert [s.to_dict() for s in WordSchedule.query.order_by(WordSchedule.word_id)] == before
+
+    def test_reset_history_clears_schedules(self, client, session, study_session, review, sample_full_data):
+        """Test resetting history empties the due queue"""
+        review(sample_full_data['words'][0], True, created_at=_days_ago(3))
+        session.commit()
+
+        assert client.post('/api/reset-history').status_code == 200
+        assert WordSchedule.query.count() == 0
+
+    def test_create_all_replaces_outdated_trigger(self, app):
+        """Test create_all swaps in the current trigger on a database built by an older version"""
+        db.session.execute(text("DROP TRIGGER word_review_items_schedule"))
+        db.session.execute(text(
+            "CREATE TRIGGER word_review_items_schedule AFTER INSERT ON word_review_items BEGIN SELECT 1; END"
+        ))
+        db.session.commit()
+
+        db.create_all()
+        trigger = db.session.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'word_review_items_schedule'"
+        )).scalar()
+        assert f"{MAX_INTERVAL_DAYS}" in trigger
+
+    def test_rebuild_matches_trigger_for_backdated_reviews(self, client, session, study_session, review, sample_full_data):
+        """Test a backdated batch posted after newer reviews replays in the order the trigger saw"""
+        word = sample_full_data['words'][0]
+        review(word, True, created_at=_days_ago(1))
+        review(word, True, created_at=_days_ago(0))
+        session.commit()
+        backdated = (datetime.now(UTC) - timedelta(days=30)).isoformat()
+        response = client.post(f'/api/study-sessions/{study_session.id}/reviews', json={
+            'reviews': [{'word_id': word.id, 'is_correct': False, 'created_at': backdated}]})
+        assert response.status_code == 200
+
+        session.expire_all()
+        before = [s.to_dict() for s in WordSchedule.query.order_by(WordSchedule.word_id)]
+        rebuild_word_schedules()
+        session.expire_all()
+        assert [s.to_dict() for s in WordSchedule.query.order_by(WordSchedule.word_id)] == before
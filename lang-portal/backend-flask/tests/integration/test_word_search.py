@@ -0,0 +1,54 @@
+import pytest
+from app.models import Word
+from app.utils.search import build_match_query
+
+def test_build_match_query():
+    """Test user input becomes a prefix query without FTS syntax"""
+    assert build_match_query('nam') == '"nam"*'
+    assert build_match_query('thank "you"*') == '"thank"* "you"*'
+    assert build_match_query(' ( ) ') == ''
+
+@pytest.mark.parametrize("query,expected", [
+    ('नमस्', 'hello'),       # Devanagari prefix
+    ('धन्यवाद', 'thank you'),  # whole Devanagari word
+    ('dhanya', 'thank you'), # romanized prefix
+    ('PLEA', 'please'),      # case-insensitive English prefix
+])
+def test_search_columns(client, sample_words, query, expected):
+    """Test prefix search across all three word columns"""
+    response = client.get('/api/words/search', query_string={'q': query})
+    assert response.status_code == 200
+    words = response.json['data']['words']
+    assert [w['english_word'] for w in words] == [expected]
+
+def test_search_ranking_and_pagination(client, session, sample_words):
+    """Test better matches rank first and results paginate"""
+    session.add(Word(nepali_word='धन्यवाद छ', romanized_nepali_word='dhanyabad chha',
+                     english_word='thanks a lot thanks', part_of_speech=['expression']))
+    session.commit()
+
+    response = client.get('/api/words/search?q=thank&per_page=1')
+    assert response.status_code == 200
+    assert response.json['meta']['pagination']['total_items'] == 2
+    assert response.json['data']['words'][0]['english_word'] == 'thanks a lot thanks'
+
+    second = client.get('/api/words/search?q=thank&per_page=1&page=2').json['data']['words']
+    assert second[0]['english_word'] == 'thank you'
+
+def test_search_follows_updates(client, session, sample_words):
+    """Test the index is kept in sync by triggers"""
+    word = sample_words[0]
+    word.english_word = 'greetings'
+    session.commit()
+    assert client.get('/api/words/search?q=hello').json['data']['words'] == []
+    assert len(client.get('/api/words/search?q=greet').json['data']['words']) == 1
+
+    session.delete(word)
+    session.commit()
+    assert client.get('/api/words/search?q=greet').json['data']['words'] == []
+
+def test_search_requires_query(client):
+    """Test empty queries are rejected"""
+    response = client.get('/api/words/search?q=')
+    assert response.status_code == 400
+    assert response.json['error_code'] == 'VALIDATION_ERROR'
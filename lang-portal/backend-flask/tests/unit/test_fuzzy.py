@@ -0,0 +1,69 @@
+import random
+import pytest
+from app.utils.fuzzy import normalize_romanized, levenshtein, TrigramIndex
+
+@pytest.mark.parametrize("spelling", ['dhanyavaad', 'Dhanyabad', 'dhanyawad', 'dhanya-baad'])
+def test_normalize_folds_spelling_variants(spelling):
+    """Test common romanization variants share a key"""
+    assert normalize_romanized(spelling) == 'dhanyabad'
+
+def test_levenshtein_is_bounded():
+    """Test distances are exact within the bound and capped beyond it"""
+    assert levenshtein('namaste', 'namaste', 2) == 0
+    assert levenshtein('namaste', 'namste', 2) == 1
+    assert levenshtein('namaste', 'nmste', 2) == 2
+    assert levenshtein('namaste', 'kripaya', 2) == 3
+
+def test_levenshtein_matches_dynamic_programming():
+    """Test the bit-parallel distance agrees with the textbook DP table"""
+    def reference(a, b):
+        previous = list(range(len(b) + 1))
+        for i, char_a in enumerate(a, 1):
+            current = [i]
+            for j, char_b in enumerate(b, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+            previous = current
+        return previous[-1]
+
+    rng = random.Random(11)
+    for _ in range(2000):
+        a = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 9)))
+        b = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 9)))
+        assert levenshtein(a, b, 3) == min(reference(a, b), 4)
+
+def test_index_search_orders_by_distance():
+    """Test lookups tolerate typos and return the closest words first"""
+    index = TrigramIndex()
+    index.rebuild([(1, 'namaste'), (2, 'dhanyabad'), (3, 'kripaya'), (4, 'namaskar')])
+    assert index.search('dhanyavaad') == [(2, 0)]
+    assert index.search('namaste')[0] == (1, 0)
+    assert index.search('kripya') == [(3, 1)]
+    assert index.search('xyzzy') == []
+
+def test_index_add_and_remove():
+    """Test incremental updates replace and drop entries"""
+    index = TrigramIndex()
+    index.add(1, 'namaste')
+    index.add(1, 'kripaya')
+    assert index.search('namaste') == []
+    assert index.search('kripaya') == [(1, 0)]
+    index.remove(1)
+    assert index.search('kripaya') == []
+    assert len(index) == 0
+
+def test_index_matches_brute_force():
+    """Test trigram filtering finds exactly what a full scan finds"""
+    rng = random.Random(7)
+    words = [''.join(rng.choice('abdeghijklmnoprstu') for _ in range(rng.randint(3, 9)))
+             for _ in range(500)]
+    index = TrigramIndex()
+    index.rebuild(enumerate(words))
+    keys = [normalize_romanized(word) for word in words]
+
+    for query in rng.sample(words, 50):
+        key = normalize_romanized(query)
+        for max_distance in (1, 2):
+            expected = {i for i, candidate in enumerate(keys)
+                        if candidate and levenshtein(key, candidate, max_distance) <= max_distance}
+            found = {word_id for word_id, _ in index.search(query, limit=len(words), max_distance=max_distance)}
+            assert found == expected
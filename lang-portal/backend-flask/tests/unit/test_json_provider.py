@@ -0,0 +1,61 @@
+import decimal
+import uuid
+import pytest
+from datetime import date, datetime, timedelta, timezone, UTC
+from flask import Flask
+from app.utils import json_provider
+from app.utils.json_provider import FastJSONProvider
+
+PAYLOAD = {
+    "success": True,
+    "data": {
+        "words": [{"id": 1, "nepali_word": "नमस्ते", "english_word": "hello \"there\"", "score": 0.25}],
+        "started_at": datetime(2025, 1, 2, 3, 4, 5, 678901),
+        "ended_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+        "local": datetime(2025, 1, 2, 9, 0, tzinfo=timezone(timedelta(hours=5, minutes=45))),
+        "day": date(2025, 1, 2),
+        "amount": decimal.Decimal("1.50"),
+        "token": uuid.UUID(int=1),
+        "empty": None
+    },
+    "meta": {"z": 1, "a": [1, 2, {"b": False}]}
+}
+
+def _body(use_orjson, debug=False):
+    app = Flask(__name__)
+    app.debug = debug
+    provider = FastJSONProvider(app, use_orjson=use_orjson)
+    return provider.response(PAYLOAD).get_data()
+
+@pytest.mark.skipif(json_provider.orjson is None, reason="orjson not installed")
+def test_orjson_and_stdlib_bytes_match():
+    """Test both serializers produce byte-identical responses for the app's payload types"""
+    assert _body(use_orjson=True) == _body(use_orjson=False)
+
+@pytest.mark.skipif(json_provider.orjson is None, reason="orjson not installed")
+def test_orjson_falls_back_for_big_integers():
+    """Test integers orjson cannot encode are served by the stdlib encoder instead of failing"""
+    app = Flask(__name__)
+    provider = FastJSONProvider(app)
+    assert provider.response({"id": 2 ** 70}).get_data() == b'{"id":1180591620717411303424}\n'
+
+def test_serialized_shape():
+    """Test keys are sorted, output compact UTF-8 and datetimes ISO 8601 UTC"""
+    body = _body(use_orjson=False).decode('utf-8')
+    assert body.startswith('{"data":{"amount":"1.50","day":"2025-01-02","empty":null,')
+    assert '"nepali_word":"नमस्ते"' in body
+    assert '"started_at":"2025-01-02T03:04:05.678901Z"' in body
+    assert '"ended_at":"2025-01-02T03:04:05Z"' in body
+    assert '"local":"2025-01-02T09:00:00+05:45"' in body
+    assert body.endswith('}\n')
+
+def test_fallback_without_orjson(monkeypatch):
+    """Test the provider falls back to the stdlib encoder when orjson is missing"""
+    monkeypatch.setattr(json_provider, 'orjson', None)
+    app = Flask(__name__)
+    assert FastJSONProvider(app).use_orjson is False
+    assert FastJSONProvider(app).response(PAYLOAD).get_data() == _body(use_orjson=False)
+
+def test_debug_responses_are_indented():
+    """Test debug mode keeps the readable stdlib output"""
+    assert _body(use_orjson=True, debug=True).startswith(b'{\n  "data"')
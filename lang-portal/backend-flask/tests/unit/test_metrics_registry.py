@@ -0,0 +1,89 @@
+import json
+import os
+import subprocess
+import sys
+from app.utils.metrics import MetricsRegistry, Counter, Gauge, Histogram
+
+def _registry(directory=None):
+    registry = MetricsRegistry(directory)
+    counter = registry.register(Counter('requests_total', 'Requests', ('route',)))
+    gauge = registry.register(Gauge('in_flight', 'In flight'))
+    histogram = registry.register(Histogram('latency_seconds', 'Latency', buckets=(0.1, 1.0)))
+    return registry, counter, gauge, histogram
+
+def test_single_process_rendering():
+    """Test counters, gauges and cumulative histogram buckets render in text format"""
+    registry, counter, gauge, histogram = _registry()
+    counter.inc(('/a',))
+    counter.inc(('/a',), 2)
+    gauge.inc()
+    histogram.observe((), 0.05)
+    histogram.observe((), 0.5)
+    histogram.observe((), 3)
+
+    text = registry.render()
+    assert 'requests_total{route="/a"} 3' in text
+    assert 'in_flight 1' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert 'latency_seconds_count 3' in text
+    assert 'latency_seconds_sum 3.55' in text
+
+def test_label_values_escaped():
+    """Test quotes and backslashes in label values are escaped"""
+    registry, counter, _, _ = _registry()
+    counter.inc(('say "hi"\\',))
+    assert 'requests_total{route="say \\"hi\\"\\\\"} 1' in registry.render()
+
+def test_multiprocess_aggregation(tmp_path):
+    """Test worker files are summed, keeping exited workers' counters but not their gauges"""
+    exited = subprocess.Popen([sys.executable, '-c', 'pass'])
+    exited.wait()
+    worker, worker_counter, worker_gauge, worker_histogram = _registry(str(tmp_path))
+    worker_counter.inc(('/a',), 5)
+    worker_gauge.inc(amount=4)
+    worker_histogram.observe((), 0.5)
+    worker.flush()
+    os.replace(worker.path, tmp_path / f"metrics_{exited.pid}_0.json")
+
+    registry, counter, gauge, histogram = _registry(str(tmp_path))
+    counter.inc(('/a',))
+    counter.inc(('/b',))
+    gauge.inc()
+    histogram.observe((), 0.05)
+
+    text = registry.render()
+    assert 'requests_total{route="/a"} 6' in text
+    assert 'requests_total{route="/b"} 1' in text
+    assert 'in_flight 1' in text
+    assert 'latency_seconds_count 2' in text
+    with open(registry.path) as f:
+        assert json.load(f)['in_flight']['values'] == [[[], 1]]
+
+def test_recycled_pid_keeps_exited_counters(tmp_path):
+    """Test a process reusing a dead worker's pid archives its file instead of overwriting it"""
+    previous, previous_counter, previous_gauge, _ = _registry(str(tmp_path))
+    previous_counter.inc(('/a',), 5)
+    previous_gauge.inc(amount=4)
+    previous.flush()
+
+    # A fresh registry stands in for the next process to be handed this pid
+    registry, counter, gauge, _ = _registry(str(tmp_path))
+    counter.inc(('/a',))
+    gauge.inc()
+    text = registry.render()
+    assert 'requests_total{route="/a"} 6' in text
+    assert 'in_flight 1' in text
+    assert os.path.exists(previous.path[:-len('.json')] + '.exited.json')
+
+def test_flush_is_rate_limited(tmp_path):
+    """Test maybe_flush writes at most once per interval"""
+    registry, counter, _, _ = _registry(str(tmp_path))
+    registry.flush_interval = 60
+    registry.maybe_flush()
+    counter.inc(('/a',))
+    registry.maybe_flush()
+    with open(registry.path) as f:
+        data = json.load(f)
+    assert data['requests_total']['values'] == []
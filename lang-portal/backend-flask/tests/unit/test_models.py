@@ -1,7 +1,10 @@
 import pytest
 from datetime import datetime, UTC, timedelta
 from app.models import Word, Group, StudyActivity, StudySession, WordReviewItem
+from sqlalchemy import text
 from app import db
+from app.models.group import words_groups
+from app.utils.maintenance import rebuild_group_word_counts
 
 class TestWordModel:
     """Test Word model functionalities"""
@@ -81,6 +84,47 @@ class TestGroupModel:
             assert "correct_count" in stats
             assert "wrong_count" in stats
 
+    def test_group_words_count_maintained(self, app):
+        """Test words_count follows ORM and raw SQL membership changes"""
+        with app.app_context():
+            group = Group(name="Counted", description="Test")
+            words = [
+                Word(nepali_word=f"w{i}", romanized_nepali_word=f"w{i}",
+                     english_word=f"w{i}", part_of_speech=["noun"])
+                for i in range(3)
+            ]
+            group.words.append(words[0])
+            group.words.append(words[1])
+            db.session.add_all([group, *words])
+            db.session.commit()
+            assert group.words_count == 2
+
+            db.session.execute(
+                words_groups.insert().values(word_id=words[2].id, group_id=group.id)
+            )
+            db.session.commit()
+            assert group.total_words == 3
+
+            group.words.remove(words[0])
+            db.session.commit()
+            assert group.total_words == 2
+
+    def test_rebuild_group_word_counts(self, app):
+        """Test repairing drifted word counts"""
+        with app.app_context():
+            group = Group(name="Drifted", description="Test")
+            group.words.append(Word(nepali_word="x", romanized_nepali_word="x",
+                                    english_word="x", part_of_speech=["noun"]))
+            db.session.add(group)
+            db.session.commit()
+
+            db.session.execute(text("UPDATE groups SET words_count = 42"))
+            db.session.commit()
+
+            assert rebuild_group_word_counts() == 1
+            assert group.total_words == 1
+            assert rebuild_group_word_counts() == 0
+
 class TestStudyActivityModel:
     """Test StudyActivity model functionalities"""
     
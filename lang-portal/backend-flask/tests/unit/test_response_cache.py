@@ -0,0 +1,44 @@
+from app.utils.response_cache import LRUCache
+
+class TestLRUCache:
+    def test_hit_and_miss(self):
+        """Test lookups are counted"""
+        cache = LRUCache(maxsize=2)
+        assert cache.get('a') is None
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first"""
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.stats()['evictions'] == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Test entries expire after their TTL"""
+        now = [100.0]
+        monkeypatch.setattr('app.utils.response_cache.time.monotonic', lambda: now[0])
+        cache = LRUCache(maxsize=2, ttl=10)
+        cache.set('a', 1)
+        now[0] += 9
+        assert cache.get('a') == 1
+        now[0] += 2
+        assert cache.get('a') is None
+
+    def test_tag_invalidation(self):
+        """Test invalidating a tag drops only the entries carrying it"""
+        cache = LRUCache(maxsize=10)
+        cache.set('stats', 1, tags=('reviews', 'sessions'))
+        cache.set('word', 2, tags=('catalog',))
+        assert cache.invalidate('reviews') == 1
+        assert cache.get('stats') is None
+        assert cache.get('word') == 2
@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime, UTC
 from app.utils.responses import success_response, error_response, pagination_meta
+from app.utils.pagination import encode_cursor, decode_cursor, KeysetPage
 
 class TestSuccessResponse:
     def test_basic_response(self, app):
@@ -95,3 +96,24 @@ class TestPaginationMeta:
         assert pagination['page'] == 5
         assert pagination['has_next'] is False
         assert pagination['has_previous'] is True
+
+    def test_keyset_pagination_format(self):
+        """Test cursor-mode pagination metadata"""
+        meta = pagination_meta(KeysetPage(items=[1, 2], per_page=2, next_cursor=encode_cursor(2)))
+        pagination = meta['pagination']
+
+        assert pagination['mode'] == 'cursor'
+        assert pagination['has_next'] is True
+        assert decode_cursor(pagination['next_cursor']) == {'after': 2}
+
+class TestCursor:
+    def test_round_trip(self):
+        """Test cursors decode to the key they were built from"""
+        assert decode_cursor(encode_cursor(1234)) == {'after': 1234}
+        assert decode_cursor('') == {'after': None}
+
+    @pytest.mark.parametrize("token", ['garbage!', encode_cursor('x'), 'e30'])
+    def test_invalid(self, token):
+        """Test tampered cursors are rejected"""
+        with pytest.raises(ValueError):
+            decode_cursor(token)